@@ -0,0 +1,126 @@
+"""Benchmarks of each phase: conversion, form binding, processing,
+validation and rendering, on synthetic schemas of growing width.
+
+With pytest, using pytest-benchmark if it is installed:
+
+    pytest benchmarks/bench_suite.py
+
+Standalone, storing or comparing baselines in `benchmarks/baselines`:
+
+    python benchmarks/bench_suite.py [--widths 10,100,1000,10000]
+        [--depth 1] [--save NAME] [--compare NAME] [--threshold 0.1]
+"""
+import argparse
+import sys
+import pytest
+from jsonschema_wtforms import Form, compile_schema
+from jsonschema_wtforms.field import ObjectParameters
+from jsonschema_wtforms.formdata import record_formdata
+from jsonschema_wtforms.resolver import Resolver
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+from harness import Benchmark, compare, save_baseline  # noqa: E402
+from schemas import Workload  # noqa: E402
+
+
+WIDTHS = (10, 100, 1000)
+
+
+@pytest.fixture(scope='module', params=WIDTHS, ids=lambda w: f'w{w}')
+def workload(request):
+    return Workload.make(request.param)
+
+
+def bound_form(workload: Workload) -> Form:
+    form = Form.from_schema(workload.schema)
+    root = compile_schema(workload.schema)
+    form.process(formdata=record_formdata(root.fields, workload.record))
+    return form
+
+
+def test_from_json_field(benchmark, workload):
+    schema = workload.schema
+
+    def convert():
+        return ObjectParameters.from_json_field(
+            None, False, schema, resolver=Resolver(schema))
+
+    benchmark(convert)
+
+
+def test_from_schema(benchmark, workload):
+    # The schema is compiled once and cached: only binding is measured.
+    compile_schema(workload.schema)
+    benchmark(Form.from_schema, workload.schema)
+
+
+def test_process(benchmark, workload):
+    form = Form.from_schema(workload.schema)
+    formdata = record_formdata(
+        compile_schema(workload.schema).fields, workload.record)
+    benchmark(form.process, formdata=formdata)
+
+
+def test_validate(benchmark, workload):
+    form = bound_form(workload)
+    assert benchmark(form.validate)
+
+
+def test_render(benchmark, workload):
+    form = bound_form(workload)
+
+    def render():
+        return [field() for field in form]
+
+    benchmark(render)
+
+
+BENCHMARKS = (
+    test_from_json_field,
+    test_from_schema,
+    test_process,
+    test_validate,
+    test_render,
+)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument(
+        '--widths', default=','.join(map(str, WIDTHS)),
+        help='comma separated numbers of properties')
+    parser.add_argument('--depth', type=int, default=1)
+    parser.add_argument('--array-size', type=int, default=3)
+    parser.add_argument('--enum-size', type=int, default=5)
+    parser.add_argument('--ref-reuse', type=float, default=0.5)
+    parser.add_argument('--max-time', type=float, default=1.0,
+                        help='seconds spent per benchmark')
+    parser.add_argument('--save', metavar='NAME')
+    parser.add_argument('--compare', metavar='NAME')
+    parser.add_argument('--threshold', type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    results = {}
+    for width in map(int, args.widths.split(',')):
+        workload = Workload.make(
+            width, depth=args.depth, array_size=args.array_size,
+            enum_size=args.enum_size, ref_reuse=args.ref_reuse)
+        for func in BENCHMARKS:
+            name = f'{func.__name__[5:]}[w{width}]'
+            benchmark = Benchmark(name, max_time=args.max_time)
+            func(benchmark, workload)
+            results[name] = benchmark.stats
+            print(f'{name:<30} min {benchmark.stats["min"] * 1e6:12.1f} µs'
+                  f'  median {benchmark.stats["median"] * 1e6:12.1f} µs'
+                  f'  ({benchmark.stats["rounds"]} rounds)')
+
+    if args.save:
+        print(f'saved to {save_baseline(args.save, results)}')
+    if args.compare:
+        if compare(args.compare, results, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
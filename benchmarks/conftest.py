@@ -0,0 +1,10 @@
+import pytest
+from harness import Benchmark
+
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    @pytest.fixture
+    def benchmark(request):
+        return Benchmark(request.node.name, max_time=0.2)
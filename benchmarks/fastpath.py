@@ -0,0 +1,34 @@
+"""Validation throughput of the fast path against the form path, on
+random records of the parity test schema.
+
+    python benchmarks/fastpath.py [records]
+"""
+import sys
+import time
+from jsonschema_wtforms import compile_schema
+from jsonschema_wtforms.batch import BatchValidator
+from jsonschema_wtforms.fastpath import FastValidator
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0] + '/../tests')
+from test_fastpath import SCHEMA, random_records  # noqa: E402
+
+
+def main(count: int = 20000):
+    root = compile_schema(SCHEMA, cache=None)
+    records = list(random_records(count))
+
+    print(f'{count} records')
+    results = {}
+    for label, validator in (('form path', BatchValidator(root)),
+                             ('fast path', FastValidator(root))):
+        start = time.perf_counter()
+        for _ in validator(records):
+            pass
+        results[label] = count / (time.perf_counter() - start)
+        print(f'  {label:<12} {results[label]:12.0f} records/s')
+    before, after = results.values()
+    print(f'  speedup: {after / before:.2f}x')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,54 @@
+"""Form build time with options, validators and factories computed once
+per parameters object, against computing them for every field of every
+form, as was done before.
+
+    python benchmarks/form_build.py [properties] [repeat]
+"""
+import sys
+import timeit
+import wtforms.validators
+from jsonschema_wtforms import Form, compile_schema
+from jsonschema_wtforms.converter import NotRequired
+from jsonschema_wtforms.field import NumberParameters
+
+sys.path.insert(0, __file__.rsplit('/', 1)[0])
+from instantiation import make_schema  # noqa: E402
+
+
+def uncached(params):
+    if isinstance(params, NumberParameters):
+        required = wtforms.validators.InputRequired
+    else:
+        required = wtforms.validators.DataRequired
+    options = params.get_options()
+    if 'validators' in options:
+        options['validators'] = [
+            required() if params.required else NotRequired(),
+            *params.validators
+        ]
+    return params.get_factory()(**options)
+
+
+def main(width: int = 300, repeat: int = 100):
+    root = compile_schema(make_schema(width), cache=None)
+    fields = root.fields
+
+    def before():
+        return Form({name: uncached(params)
+                     for name, params in fields.items()})
+
+    def after():
+        return Form(fields)
+
+    print(f'{width} properties, {repeat} form builds')
+    results = {}
+    for label, stmt in (('per field (before)', before),
+                        ('precomputed (after)', after)):
+        results[label] = min(timeit.repeat(stmt, number=repeat, repeat=5))
+        print(f'  {label:<25} {results[label] / repeat * 1e6:10.1f} µs')
+    before, after = results.values()
+    print(f'  speedup: {before / after:.2f}x')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
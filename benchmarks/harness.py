@@ -0,0 +1,124 @@
+"""A minimal stand-in for the `benchmark` fixture of pytest-benchmark,
+so that the suite also runs where the plugin is not installed.
+
+Only the calls used by the suite are provided: `benchmark(func, ...)`
+and `benchmark.pedantic(func, setup=..., rounds=...)`.
+"""
+import json
+import platform
+import statistics
+import time
+import typing as t
+from pathlib import Path
+
+
+BASELINES = Path(__file__).parent / 'baselines'
+
+
+class Benchmark:
+
+    def __init__(self, name: str, max_time: float = 1.0,
+                 min_rounds: int = 5, min_time: float = 0.000_1):
+        self.name = name
+        self.max_time = max_time
+        self.min_rounds = min_rounds
+        self.min_time = min_time
+        self.stats: t.Optional[dict] = None
+
+    def record(self, timings: t.List[float]):
+        self.stats = {
+            'min': min(timings),
+            'max': max(timings),
+            'mean': statistics.fmean(timings),
+            'median': statistics.median(timings),
+            'stddev': statistics.stdev(timings) if len(timings) > 1 else 0,
+            'rounds': len(timings),
+        }
+
+    def __call__(self, func: t.Callable, *args, **kwargs):
+        # Calibrates the iterations so that a round is measurable.
+        iterations = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                result = func(*args, **kwargs)
+            duration = time.perf_counter() - start
+            if duration >= self.min_time:
+                break
+            iterations *= 10
+
+        timings = [duration / iterations]
+        deadline = time.perf_counter() + self.max_time
+        while len(timings) < self.min_rounds or \
+                time.perf_counter() < deadline:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                func(*args, **kwargs)
+            timings.append((time.perf_counter() - start) / iterations)
+            if len(timings) >= 10_000:
+                break
+        self.record(timings)
+        return result
+
+    def pedantic(self, target: t.Callable, args: tuple = (),
+                 kwargs: t.Optional[dict] = None,
+                 setup: t.Optional[t.Callable] = None,
+                 rounds: int = 1, iterations: int = 1,
+                 warmup_rounds: int = 0):
+        timings = []
+        for round in range(warmup_rounds + rounds):
+            if setup is not None and (prepared := setup()) is not None:
+                args, kwargs = prepared
+            start = time.perf_counter()
+            for _ in range(iterations):
+                result = target(*args, **(kwargs or {}))
+            if round >= warmup_rounds:
+                timings.append((time.perf_counter() - start) / iterations)
+        self.record(timings)
+        return result
+
+
+def environment() -> dict:
+    import wtforms
+    try:
+        from importlib.metadata import version
+        library = version('jsonschema_wtforms')
+    except Exception:
+        library = 'unknown'
+    return {
+        'jsonschema_wtforms': library,
+        'wtforms': wtforms.__version__,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'node': platform.node(),
+    }
+
+
+def save_baseline(name: str, results: t.Dict[str, dict]) -> Path:
+    BASELINES.mkdir(exist_ok=True)
+    path = BASELINES / f'{name}.json'
+    path.write_text(json.dumps(
+        {'environment': environment(), 'benchmarks': results},
+        indent=2, sort_keys=True))
+    return path
+
+
+def compare(name: str, results: t.Dict[str, dict],
+            threshold: float = 0.1) -> t.List[str]:
+    """Prints the ratio of each minimum to the baseline one and returns
+    the benchmarks slower by more than `threshold`.
+    """
+    baseline = json.loads((BASELINES / f'{name}.json').read_text())
+    reference = baseline['benchmarks']
+    regressions = []
+    print(f'against {name} ({baseline["environment"]})')
+    for key, stats in results.items():
+        if key not in reference:
+            continue
+        ratio = stats['min'] / reference[key]['min']
+        flag = ''
+        if ratio > 1 + threshold:
+            regressions.append(key)
+            flag = '  REGRESSION'
+        print(f'  {key:<40} {ratio:6.2f}x{flag}')
+    return regressions
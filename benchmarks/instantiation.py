@@ -0,0 +1,62 @@
+"""Form instantiation cost: dynamic `Form.from_schema` against the
+declarative class returned by `schema_form_class`. Both forms are
+processed, as declarative forms process on instantiation.
+
+    python benchmarks/instantiation.py [properties] [repeat]
+"""
+import sys
+import timeit
+from jsonschema_wtforms import Form, schema_form_class
+
+
+def make_schema(width: int) -> dict:
+    properties = {}
+    for i in range(width):
+        kind = i % 4
+        if kind == 0:
+            properties[f'text{i}'] = {'type': 'string', 'maxLength': 50}
+        elif kind == 1:
+            properties[f'number{i}'] = {'type': 'integer', 'minimum': 0}
+        elif kind == 2:
+            properties[f'choice{i}'] = {'enum': ['a', 'b', 'c']}
+        else:
+            properties[f'address{i}'] = {
+                'type': 'object',
+                'properties': {
+                    'street': {'type': 'string'},
+                    'city': {'type': 'string'},
+                },
+                'required': ['city']
+            }
+    return {
+        'type': 'object',
+        'title': 'Benchmark',
+        'properties': properties,
+        'required': list(properties)[::2]
+    }
+
+
+def main(width: int = 100, repeat: int = 200):
+    schema = make_schema(width)
+    form_class = schema_form_class(schema)
+
+    def dynamic():
+        form = Form.from_schema(schema)
+        form.process()
+        return form
+
+    timings = {
+        'Form.from_schema (cached conversion)': dynamic,
+        'schema_form_class()': form_class,
+    }
+    print(f'{width} properties, {repeat} instantiations')
+    results = {}
+    for label, stmt in timings.items():
+        results[label] = min(timeit.repeat(stmt, number=repeat, repeat=5))
+        print(f'  {label:<40} {results[label] / repeat * 1e6:10.1f} µs')
+    before, after = results.values()
+    print(f'  speedup: {before / after:.2f}x')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
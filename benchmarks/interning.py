@@ -0,0 +1,87 @@
+"""Conversion time and memory saved by interning identical subschemas,
+on a schema where many properties reference the same definitions.
+
+    python benchmarks/interning.py [references] [repeat]
+"""
+import sys
+import timeit
+import tracemalloc
+from jsonschema_wtforms.field import ObjectParameters, ArrayParameters
+from jsonschema_wtforms.resolver import Resolver
+
+
+def make_schema(references: int) -> dict:
+    address = {
+        'type': 'object',
+        'properties': {
+            **{f'line{i}': {'type': 'string', 'maxLength': 80}
+               for i in range(10)},
+            'country': {'enum': [f'C{i}' for i in range(200)]},
+            'geo': {'$ref': '#/definitions/Geo'},
+            'phones': {
+                'type': 'array',
+                'items': {'type': 'string', 'pattern': r'^\+?[0-9 ]+$'}
+            }
+        },
+        'required': ['line0', 'country']
+    }
+    geo = {
+        'type': 'object',
+        'properties': {
+            'latitude': {'type': 'number', 'minimum': -90, 'maximum': 90},
+            'longitude': {'type': 'number', 'minimum': -180, 'maximum': 180}
+        }
+    }
+    return {
+        'type': 'object',
+        'properties': {
+            f'address{i}': {'$ref': '#/definitions/Address'}
+            for i in range(references)
+        },
+        'definitions': {'Address': address, 'Geo': geo}
+    }
+
+
+def walk(params):
+    yield params
+    if isinstance(params, ObjectParameters):
+        for field in params.fields.values():
+            yield from walk(field)
+    elif isinstance(params, ArrayParameters) and params.subfield is not None:
+        yield from walk(params.subfield)
+
+
+def convert(schema, interning):
+    return ObjectParameters.from_json_field(
+        None, False, schema, resolver=Resolver(schema, interning=interning))
+
+
+def measure(schema, interning, repeat):
+    seconds = min(timeit.repeat(
+        lambda: convert(schema, interning), number=repeat, repeat=3)
+    ) / repeat
+    tracemalloc.start()
+    root = convert(schema, interning)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    nodes = list(walk(root))
+    return seconds, retained, len(nodes), len({id(node) for node in nodes})
+
+
+def main(references: int = 50, repeat: int = 20):
+    schema = make_schema(references)
+    print(f'{references} references to the same definition')
+    results = {}
+    for interning in (False, True):
+        seconds, retained, nodes, unique = results[interning] = measure(
+            schema, interning, repeat)
+        print(f'  interning={interning!s:<5} {seconds * 1e3:8.2f} ms '
+              f'{retained / 1024:8.1f} KiB  '
+              f'{unique} distinct parameters for {nodes} nodes')
+    (before, before_mem, *_), (after, after_mem, *_) = results.values()
+    print(f'  time saved: {(1 - after / before):.0%}, '
+          f'memory saved: {(1 - after_mem / before_mem):.0%}')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,132 @@
+"""Synthetic schemas and records for the benchmark suite.
+
+The properties of a generated object cycle through strings, integers,
+numbers, booleans, enums, arrays of enums, arrays of numbers and, while
+`depth` allows, nested objects and arrays of objects. A share of the
+nested objects (`ref_reuse`) point to shared definitions through
+`$ref` instead of being inlined.
+"""
+import itertools
+import random
+import typing as t
+
+
+SCALARS = ('string', 'integer', 'number', 'boolean', 'enum', 'tags',
+           'numbers')
+CONTAINERS = ('object', 'objects')
+
+
+def generate_schema(width: int = 100, depth: int = 1,
+                    child_width: int = 5, array_size: int = 3,
+                    enum_size: int = 5, ref_reuse: float = 0.5) -> dict:
+    definitions = {}
+    counter = itertools.count()
+
+    def enum():
+        return [f'value{i}' for i in range(enum_size)]
+
+    def nested(level: int) -> dict:
+        schema = generate(child_width, level)
+        if next(counter) % 100 < ref_reuse * 100:
+            key = f'Item{level}'
+            definitions.setdefault(key, schema)
+            return {'$ref': f'#/definitions/{key}'}
+        return schema
+
+    def generate(count: int, level: int) -> dict:
+        kinds = SCALARS + (CONTAINERS if level else ())
+        properties = {}
+        # Names of the same width: a `FieldList` named `objects8` would
+        # read the formdata of `objects80`, see `FieldList._extract_indices`.
+        digits = len(str(count - 1))
+        for i in range(count):
+            kind = kinds[i % len(kinds)]
+            name = f'{kind}{i:0{digits}d}'
+            if kind == 'string':
+                properties[name] = {'type': 'string', 'maxLength': 50}
+            elif kind == 'integer':
+                properties[name] = {
+                    'type': 'integer', 'minimum': 0, 'maximum': 1000}
+            elif kind == 'number':
+                properties[name] = {'type': 'number', 'minimum': 0}
+            elif kind == 'boolean':
+                properties[name] = {'type': 'boolean'}
+            elif kind == 'enum':
+                properties[name] = {'enum': enum()}
+            elif kind == 'tags':
+                properties[name] = {
+                    'type': 'array', 'items': {'enum': enum()}}
+            elif kind == 'numbers':
+                properties[name] = {
+                    'type': 'array',
+                    'maxItems': array_size * 2,
+                    'items': {'type': 'number', 'minimum': 0}
+                }
+            elif kind == 'object':
+                properties[name] = nested(level - 1)
+            else:
+                properties[name] = {
+                    'type': 'array',
+                    'maxItems': array_size * 2,
+                    'items': nested(level - 1)
+                }
+        return {
+            'type': 'object',
+            'properties': properties,
+            # A false boolean fails `DataRequired`.
+            'required': [name for name in list(properties)[::3]
+                         if not name.startswith('boolean')]
+        }
+
+    schema = generate(width, depth)
+    schema['title'] = 'Benchmark'
+    if definitions:
+        schema['definitions'] = definitions
+    return schema
+
+
+def generate_record(schema: dict, array_size: int = 3,
+                    seed: int = 0) -> dict:
+    """A valid record for a schema made by `generate_schema`.
+    """
+    rng = random.Random(seed)
+    definitions = schema.get('definitions', {})
+
+    def value(definition: dict):
+        if '$ref' in definition:
+            definition = definitions[definition['$ref'].rsplit('/', 1)[1]]
+        if 'enum' in definition:
+            return rng.choice(definition['enum'])
+        kind = definition['type']
+        if kind == 'object':
+            return {name: value(sub)
+                    for name, sub in definition['properties'].items()}
+        if kind == 'array':
+            items = definition['items']
+            if 'enum' in items:
+                return rng.sample(
+                    items['enum'], min(array_size, len(items['enum'])))
+            return [value(items) for _ in range(array_size)]
+        if kind == 'string':
+            return 'x' * rng.randint(1, 50)
+        if kind == 'integer':
+            return rng.randint(0, 1000)
+        if kind == 'number':
+            return rng.random() * 100
+        return rng.random() < 0.5
+
+    return value(schema)
+
+
+class Workload(t.NamedTuple):
+    width: int
+    schema: dict
+    record: dict
+
+    @classmethod
+    def make(cls, width: int, depth: int = 1, array_size: int = 3,
+             enum_size: int = 5, ref_reuse: float = 0.5):
+        schema = generate_schema(
+            width, depth=depth, array_size=array_size,
+            enum_size=enum_size, ref_reuse=ref_reuse)
+        return cls(width, schema, generate_record(schema, array_size))
@@ -1,29 +1,115 @@
 import wtforms.form
+from functools import partial
+from jsonschema_wtforms import instrumentation
+from jsonschema_wtforms.cache import SchemaCache, fingerprint, schema_cache
 from jsonschema_wtforms.field import ObjectParameters
-from typing import Dict, Iterable, Optional
+from jsonschema_wtforms.incremental import revalidate
+from jsonschema_wtforms.resolver import Resolver
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Type
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 
 JSONSchema = Dict
 
 
+def compile_schema(schema: JSONSchema,
+                   include: Optional[Iterable[str]] = None,
+                   exclude: Optional[Iterable[str]] = None,
+                   cache: Optional[SchemaCache] = schema_cache,
+                   lazy: bool = False,
+                   compact: bool = False
+                   ) -> ObjectParameters:
+    # Read once: iterators would be used up by the key.
+    include = None if include is None else tuple(include)
+    exclude = None if exclude is None else tuple(exclude)
+
+    def compile():
+        return ObjectParameters.from_json_field(
+            None, False, schema,
+            include=include, exclude=exclude,
+            resolver=Resolver(schema, lazy=lazy, compact=compact))
+
+    if (collector := instrumentation.active.get()) is not None:
+        compile = partial(
+            collector.call, 'convert', ObjectParameters.__name__, compile)
+    if cache is None:
+        return compile()
+    key = fingerprint(schema, include, exclude)
+    if options := tuple(name for name, enabled in (
+            ('lazy', lazy), ('compact', compact)) if enabled):
+        key = (*options, key)
+    return cache.get(key, compile)
+
+
 def schema_fields(schema: JSONSchema,
                   include: Optional[Iterable[str]] = None,
-                  exclude: Optional[Iterable[str]] = None):
-    root = ObjectParameters.from_json_field(
-        None, False, schema,
-        include=include, exclude=exclude)
+                  exclude: Optional[Iterable[str]] = None,
+                  cache: Optional[SchemaCache] = schema_cache,
+                  lazy: bool = False,
+                  compact: bool = False):
+    root = compile_schema(
+        schema, include, exclude, cache=cache, lazy=lazy, compact=compact)
     return root.fields
 
 
+def schema_form_class(schema: JSONSchema,
+                      include: Optional[Iterable[str]] = None,
+                      exclude: Optional[Iterable[str]] = None,
+                      name: Optional[str] = None,
+                      base: Type[wtforms.form.Form] = wtforms.form.Form,
+                      cache: Optional[SchemaCache] = schema_cache
+                      ) -> Type[wtforms.form.Form]:
+    include = None if include is None else tuple(include)
+    exclude = None if exclude is None else tuple(exclude)
+
+    def compile():
+        root = compile_schema(schema, include, exclude, cache=cache)
+        return root.as_form_class(name=name, base=base)
+
+    if cache is None:
+        return compile()
+    return cache.get(
+        ('form_class', fingerprint(schema, include, exclude), name, base),
+        compile
+    )
+
+
 class Form(wtforms.form.BaseForm):
 
     def __init__(self, *args, **kwargs):
         self.form_errors = []  # this exists in 3.0a1
         super().__init__(*args, **kwargs)
 
+    async def validate_async(self, extra_validators=None,
+                             executor: Optional['Executor'] = None
+                             ) -> bool:
+        """Validates like `validate`, awaiting the async validators of
+        the fields concurrently. Sync validators run in the `executor`,
+        if given, to keep the event loop free.
+        """
+        # asyncio takes longer to import than the rest of the package.
+        from jsonschema_wtforms.asynchronous import validate_form
+
+        return await validate_form(self, extra_validators, executor)
+
+    def revalidate(self, formdata, paths: Iterable[str],
+                   extra_validators=None) -> bool:
+        """Processes and validates again the fields at the changed
+        paths only, keeping the errors of the others.
+        See `jsonschema_wtforms.incremental.revalidate`.
+        """
+        return revalidate(self, formdata, paths, extra_validators)
+
     @classmethod
     def from_schema(
             cls, schema: JSONSchema,
             include: Optional[Iterable[str]] = None,
-            exclude: Optional[Iterable[str]] = None):
-        return cls(schema_fields(schema, include, exclude))
+            exclude: Optional[Iterable[str]] = None,
+            cache: Optional[SchemaCache] = schema_cache,
+            lazy: bool = False,
+            compact: bool = False):
+        return cls(schema_fields(
+            schema, include, exclude, cache=cache, lazy=lazy,
+            compact=compact))
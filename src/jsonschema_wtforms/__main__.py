@@ -0,0 +1,217 @@
+"""Validates a stream of JSON records against a schema.
+
+    python -m jsonschema_wtforms schema.json [records.ndjson]
+
+Records are read as NDJSON, or as a single JSON array, from a file or
+from stdin, and validated one chunk at a time: memory use does not grow
+with the size of the input. A result is written per record, as NDJSON,
+in the input order. Throughput is reported on stderr.
+"""
+import argparse
+import json
+import sys
+import time
+import typing as t
+from jsonschema_wtforms.batch import BatchValidator, Result, validate_many
+from jsonschema_wtforms.fastpath import FastValidator
+
+
+VALIDATORS = {
+    'fast': FastValidator,
+    'form': BatchValidator,
+}
+
+
+class InvalidInput(ValueError):
+    pass
+
+
+def skip_whitespace(buffer: str, position: int) -> int:
+    while position < len(buffer) and buffer[position].isspace():
+        position += 1
+    return position
+
+
+def iter_array(stream: t.TextIO, buffer: str = '',
+               bufsize: int = 65536) -> t.Iterator:
+    """Yields the items of a JSON array, reading the stream a buffer at
+    a time.
+    """
+    decoder = json.JSONDecoder()
+    position = skip_whitespace(buffer, 0)
+    if buffer[position:position + 1] != '[':
+        raise InvalidInput('Expected a JSON array.')
+    position += 1
+    count = 0
+    expect_item = True
+    exhausted = False
+    while True:
+        position = skip_whitespace(buffer, position)
+        if position == len(buffer):
+            if exhausted:
+                raise InvalidInput('Unterminated JSON array.')
+            more = stream.read(bufsize)
+            buffer, position = buffer[position:] + more, 0
+            exhausted = not more
+            continue
+        char = buffer[position]
+        if char == ']':
+            if expect_item and count:
+                raise InvalidInput('Trailing comma in JSON array.')
+            return
+        if not expect_item:
+            if char != ',':
+                raise InvalidInput(f'Expected "," or "]" after item {count}.')
+            position += 1
+            expect_item = True
+            continue
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as exc:
+            if exhausted:
+                raise InvalidInput(f'Invalid JSON: {exc}') from exc
+            # The item may be cut by the end of the buffer.
+            more = stream.read(bufsize)
+            buffer, position = buffer[position:] + more, 0
+            exhausted = not more
+            continue
+        if end == len(buffer) and not exhausted:
+            # Numbers may be cut by the end of the buffer too.
+            more = stream.read(bufsize)
+            if more:
+                buffer, position = buffer[position:] + more, 0
+                continue
+            exhausted = True
+        yield item
+        count += 1
+        position = end
+        expect_item = False
+
+
+def iter_lines(stream: t.TextIO, buffer: str = '') -> t.Iterator:
+    """Yields the records of a NDJSON stream, skipping blank lines.
+    """
+    lines = iter(stream)
+    number = 0
+    if buffer:
+        # The first line, behind the blank lines read ahead.
+        number = buffer.count('\n') + 1
+        buffer += next(lines, '')
+        if buffer.strip():
+            yield parse_line(buffer, number)
+    for number, line in enumerate(lines, number + 1):
+        if line.strip():
+            yield parse_line(line, number)
+
+
+def parse_line(line: str, number: int):
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as exc:
+        raise InvalidInput(f'Invalid JSON on line {number}: {exc}') from exc
+
+
+def read_records(stream: t.TextIO) -> t.Iterator:
+    """Yields the records of a NDJSON stream or of a JSON array, as told
+    by the first character.
+    """
+    start = ''
+    while (char := stream.read(1)) and char.isspace():
+        start += char
+    if char == '[':
+        yield from iter_array(stream, start + char)
+    elif char:
+        yield from iter_lines(stream, start + char)
+
+
+def dump_result(result: Result) -> str:
+    if result.valid:
+        line = {'index': result.index, 'data': result.data}
+    else:
+        line = {'index': result.index, 'errors': result.errors}
+    return json.dumps(line, default=str)
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m jsonschema_wtforms',
+        description='Validates NDJSON records (or a JSON array) '
+                    'against a JSON schema.')
+    parser.add_argument(
+        'schema', type=argparse.FileType('r'),
+        help='the JSON schema file')
+    parser.add_argument(
+        'input', nargs='?', type=argparse.FileType('r'), default='-',
+        help='the records file, stdin by default')
+    parser.add_argument(
+        '-o', '--output', type=argparse.FileType('w'), default='-',
+        help='the results file, stdout by default')
+    parser.add_argument(
+        '-p', '--processes', type=int, default=0,
+        help='number of worker processes, none by default')
+    parser.add_argument(
+        '--chunksize', type=int, default=256,
+        help='records sent to a worker at a time')
+    parser.add_argument(
+        '--include', action='append',
+        help='property or dotted path to validate, can be repeated')
+    parser.add_argument(
+        '--exclude', action='append',
+        help='property or dotted path to ignore, can be repeated')
+    parser.add_argument(
+        '--validator', choices=tuple(VALIDATORS), default='fast',
+        help='validation path, both give the same results')
+    parser.add_argument(
+        '--errors-only', action='store_true',
+        help='only write the results of invalid records')
+    parser.add_argument(
+        '-q', '--quiet', action='store_true',
+        help='do not report the throughput')
+    return parser
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> int:
+    """Returns 0 if all records are valid, 1 otherwise, 2 on bad input.
+    """
+    parser = make_parser()
+    args = parser.parse_args(argv)
+    if args.processes < 0:
+        parser.error('--processes must not be negative.')
+    if args.chunksize < 1:
+        parser.error('--chunksize must be a positive integer.')
+    with args.schema:
+        schema = json.load(args.schema)
+
+    total = invalid = 0
+    start = time.perf_counter()
+    try:
+        results = validate_many(
+            schema, read_records(args.input),
+            include=args.include,
+            exclude=args.exclude,
+            processes=args.processes,
+            chunksize=args.chunksize,
+            validator=VALIDATORS[args.validator]
+        )
+        for result in results:
+            total += 1
+            if not result.valid:
+                invalid += 1
+            elif args.errors_only:
+                continue
+            args.output.write(dump_result(result) + '\n')
+    except InvalidInput as exc:
+        print(f'error: {exc}', file=sys.stderr)
+        return 2
+    finally:
+        args.output.flush()
+        if not args.quiet:
+            elapsed = time.perf_counter() - start
+            rate = total / elapsed if elapsed else 0.0
+            print(f'{total} records ({invalid} invalid) in {elapsed:.2f}s: '
+                  f'{rate:.0f} records/s', file=sys.stderr)
+    return 1 if invalid else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
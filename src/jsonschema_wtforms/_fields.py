@@ -1,23 +1,417 @@
+import itertools
 import typing as t
+from functools import cached_property
 from wtforms.utils import unset_value
-from wtforms.form import BaseForm
-from wtforms.fields import Field, FormField
-from wtforms import widgets, SelectMultipleField
+from wtforms.form import BaseForm, Form
+from wtforms.fields import (
+    Field, FormField, BooleanField, FloatField, IntegerField, StringField)
+from wtforms.validators import StopValidation, ValidationError
+from wtforms import widgets, SelectField, SelectMultipleField
+from jsonschema_wtforms.choices import Choices
+from jsonschema_wtforms.validators import candidates
 
 
 Fields = t.Mapping[str, t.Callable[[], Field]]
 
 
-class MultiCheckboxField(SelectMultipleField):
+def field_validators(form: BaseForm, name: str,
+                     extra_validators: t.Optional[t.Mapping] = None):
+    """The extra validators of a field, with the `validate_<name>`
+    method of a `wtforms.Form` last, as `Form.validate` gives them.
+    """
+    extra = extra_validators.get(name, ()) if extra_validators else ()
+    if isinstance(form, Form):
+        inline = getattr(form.__class__, f'validate_{name}', None)
+        if inline is not None:
+            return [*extra, inline]
+    return extra
+
+
+class Probe:
+    """Stands for a field in front of the validators.
+    """
+    __slots__ = ('data', 'raw_data', 'errors', 'entries', 'translations')
+
+    def __init__(self, data, raw_data, errors, entries=None,
+                 translations=None):
+        self.data = data
+        self.raw_data = raw_data
+        self.errors = errors
+        self.entries = entries
+        self.translations = translations
+
+    def gettext(self, string):
+        if self.translations is None:
+            return string
+        return self.translations.gettext(string)
+
+    def ngettext(self, singular, plural, n):
+        if self.translations is None:
+            return singular if n == 1 else plural
+        return self.translations.ngettext(singular, plural, n)
+
+
+class SharedChoices:
+    """Keeps `Choices` as given: wtforms copies the choices into a list
+    for every field.
+    """
+
+    def __init__(self, *args, choices=None, **kwargs):
+        shared = isinstance(choices, Choices)
+        super().__init__(
+            *args, choices=None if shared else choices, **kwargs)
+        if shared:
+            self.choices = choices
+
+
+class EnumSelectField(SharedChoices, SelectField):
+
+    def pre_validate(self, form):
+        if not self.validate_choice or not isinstance(self.choices, Choices):
+            return super().pre_validate(form)
+        if not self.choices.accepts(self.data, self.coerce):
+            raise ValidationError(self.gettext("Not a valid choice."))
+
+
+class MultiCheckboxField(SharedChoices, SelectMultipleField):
     widget = widgets.ListWidget(prefix_label=False)
     option_widget = widgets.CheckboxInput()
 
+    def pre_validate(self, form):
+        if not self.validate_choice or not self.data or \
+           not isinstance(self.choices, Choices):
+            return super().pre_validate(form)
+        unacceptable = [
+            str(data) for data in set(self.data)
+            if not self.choices.accepts(data, self.coerce)
+        ]
+        if unacceptable:
+            raise ValidationError(
+                self.ngettext(
+                    "'%(value)s' is not a valid choice for this field.",
+                    "'%(value)s' are not valid choices for this field.",
+                    len(unacceptable),
+                )
+                % dict(value="', '".join(unacceptable))
+            )
+
+
+class Entries(t.Sequence[Field]):
+    """Entries of a `ScalarListField`, only bound when first iterated or
+    indexed. Their number is known without binding them.
+    """
+
+    def __init__(self, field: 'ScalarListField'):
+        self.field = field
+        self._entries = None
+
+    @property
+    def entries(self) -> t.List[Field]:
+        if self._entries is None:
+            self._entries = [
+                self.field.bind_entry(index)
+                for index in range(len(self.field.data))
+            ]
+        return self._entries
+
+    def __getitem__(self, index):
+        return self.entries[index]
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.field.data)
+
+
+class ScalarListField(Field):
+    """List of scalar items, processed and validated as a whole.
+
+    Unlike `FieldList`, the submitted values are read from the formdata
+    in one pass, either repeated under the field name or indexed as
+    `FieldList` submits them, and coerced in bulk. Item validators run
+    over all the items at once, and `min_entries` and `max_entries` are
+    validated rather than enforced. Fields for the items are only bound
+    when the entries are iterated, to render them for instance.
+    """
+    widget = widgets.ListWidget()
+
+    kinds = (
+        ('boolean', BooleanField),
+        ('integer', IntegerField),
+        ('float', FloatField),
+        ('text', StringField),
+    )
+
+    def __init__(self, unbound_field, label=None, validators=None,
+                 min_entries=0, max_entries=None, separator='-',
+                 default=(), **kwargs):
+        super().__init__(label, validators, default=default, **kwargs)
+        if self.filters:
+            raise TypeError(
+                "ScalarListField does not accept any filters. Instead, "
+                "define them on the enclosed field.")
+        self.kind = self.item_kind(unbound_field)
+        if self.kind is None:
+            raise TypeError(
+                f"Unsupported item field: {unbound_field.field_class}")
+        self.unbound_field = unbound_field
+        self.item_validators = tuple(
+            unbound_field.kwargs.get('validators') or ())
+        self.false_values = None
+        if self.kind == 'boolean':
+            self.false_values = unbound_field.kwargs.get(
+                'false_values') or unbound_field.field_class.false_values
+        self.min_entries = min_entries
+        self.max_entries = max_entries
+        self._prefix = kwargs.get('_prefix', '')
+        self._separator = separator
+        self.data = []
+        self.raw_data = None
+        self.item_errors: t.Dict[int, t.List[str]] = {}
+        self.entries = Entries(self)
+
+    @classmethod
+    def item_kind(cls, unbound_field) -> t.Optional[str]:
+        """How the items are coerced, or None if the item field does not
+        simply keep or convert the first submitted value.
+        """
+        field_class = getattr(unbound_field, 'field_class', None)
+        if not isinstance(field_class, type) or \
+           unbound_field.kwargs.get('filters'):
+            return None
+        for kind, base in cls.kinds:
+            if issubclass(field_class, base) and \
+               field_class.process is Field.process and \
+               field_class.process_data is base.process_data and \
+               field_class.process_formdata is base.process_formdata and \
+               field_class.pre_validate is Field.pre_validate:
+                return kind
+        return None
+
+    def extract(self, formdata) -> list:
+        if self.name in formdata:
+            return list(formdata.getlist(self.name))
+        prefix = self.name + self._separator
+        offset = len(prefix)
+        indexed = {}
+        for key in formdata:
+            if key.startswith(prefix) and (index := key[offset:]).isdigit():
+                values = formdata.getlist(key)
+                indexed[int(index)] = values[0] if values else ''
+        return [indexed[index] for index in sorted(indexed)]
+
+    def coerce_formdata(self, raw_values: list):
+        if self.kind == 'text':
+            return list(raw_values), {}
+        if self.kind == 'boolean':
+            false_values = self.false_values
+            return [raw not in false_values for raw in raw_values], {}
+        if self.kind == 'integer':
+            convert, message = int, 'Not a valid integer value.'
+        else:
+            convert, message = float, 'Not a valid float value.'
+        try:
+            return list(map(convert, raw_values)), {}
+        except (ValueError, TypeError):
+            pass
+        data, errors = [], {}
+        for index, raw in enumerate(raw_values):
+            try:
+                data.append(convert(raw))
+            except (ValueError, TypeError):
+                data.append(None)
+                errors[index] = [self.gettext(message)]
+        return data, errors
+
+    def coerce_data(self, values: list):
+        if self.kind == 'boolean':
+            return list(map(bool, values)), {}
+        if self.kind != 'integer':
+            return list(values), {}
+        data, errors = [], {}
+        for index, value in enumerate(values):
+            if value is None:
+                data.append(None)
+                continue
+            try:
+                data.append(int(value))
+            except (ValueError, TypeError):
+                data.append(None)
+                errors[index] = [self.gettext('Not a valid integer value.')]
+        return data, errors
+
+    def process(self, formdata, data=unset_value, extra_filters=None):
+        self.process_errors = []
+        if data is unset_value:
+            try:
+                data = self.default()
+            except TypeError:
+                data = self.default
+        self.object_data = data
+
+        if formdata:
+            self.raw_data = self.extract(formdata)
+            self.data, self.item_errors = self.coerce_formdata(self.raw_data)
+        else:
+            self.raw_data = None
+            self.data, self.item_errors = self.coerce_data(
+                list(data) if data else [])
+        self.entries = Entries(self)
+
+    def validate_items(self, form) -> t.Dict[int, t.List[str]]:
+        """Runs each item validator over the items still validated, in
+        one go for the validators `candidates` knows about.
+        """
+        errors = {index: list(e) for index, e in self.item_errors.items()}
+        raw_values = self.raw_data
+        active = range(len(self.data))
+        for validator in self.item_validators:
+            if not active:
+                break
+            values = [self.data[index] for index in active]
+            if raw_values is not None:
+                positions = candidates(
+                    validator, values, [raw_values[i] for i in active])
+            else:
+                positions = candidates(validator, values, None)
+            if positions is None:
+                positions = range(len(active))
+            stopped = set()
+            for position in positions:
+                index = active[position]
+                probe = Probe(
+                    values[position],
+                    None if raw_values is None else [raw_values[index]],
+                    errors.get(index, []),
+                    translations=self._translations
+                )
+                try:
+                    validator(form, probe)
+                except StopValidation as exc:
+                    if exc.args and exc.args[0]:
+                        probe.errors.append(exc.args[0])
+                    stopped.add(position)
+                except ValidationError as exc:
+                    probe.errors.append(exc.args[0])
+                if probe.errors:
+                    errors[index] = probe.errors
+                else:
+                    errors.pop(index, None)
+            if stopped:
+                active = [
+                    index for position, index in enumerate(active)
+                    if position not in stopped
+                ]
+        return errors
+
+    def check_length(self, form, field):
+        count = len(self.data)
+        if self.min_entries and count < self.min_entries:
+            raise ValidationError(
+                self.ngettext(
+                    'At least %(min)d item is required.',
+                    'At least %(min)d items are required.',
+                    self.min_entries,
+                ) % dict(min=self.min_entries)
+            )
+        if self.max_entries is not None and count > self.max_entries:
+            raise ValidationError(
+                self.ngettext(
+                    'At most %(max)d item is allowed.',
+                    'At most %(max)d items are allowed.',
+                    self.max_entries,
+                ) % dict(max=self.max_entries)
+            )
+
+    def validate(self, form, extra_validators=()):
+        self.errors = []
+        if errors := self.validate_items(form):
+            self.errors = [
+                errors.get(index, []) for index in range(len(self.data))]
+        chain = itertools.chain(
+            self.validators, (self.check_length,), extra_validators)
+        self._run_validation_chain(form, chain)
+        return len(self.errors) == 0
+
+    async def validate_async(self, form, extra_validators=(),
+                             executor=None):
+        from jsonschema_wtforms.asynchronous import (
+            is_async, run_chain, run_sync)
+
+        chain = (*self.validators, self.check_length, *extra_validators)
+        if not any(map(is_async, chain)):
+            return await run_sync(
+                executor, self.validate, form, extra_validators)
+        self.errors = []
+        if errors := await run_sync(executor, self.validate_items, form):
+            self.errors = [
+                errors.get(index, []) for index in range(len(self.data))]
+        await run_chain(self, form, chain)
+        return len(self.errors) == 0
+
+    def bind_entry(self, index: int, data=unset_value) -> Field:
+        name = f'{self.short_name}{self._separator}{index}'
+        id = f'{self.id}{self._separator}{index}'
+        field = self.unbound_field.bind(
+            form=None,
+            name=name,
+            prefix=self._prefix,
+            id=id,
+            _meta=self.meta,
+            translations=self._translations,
+        )
+        if index < len(self.data):
+            data = self.data[index]
+        field.process(None, data)
+        if self.raw_data is not None and index < len(self.raw_data):
+            field.raw_data = [self.raw_data[index]]
+        errors = self.errors if isinstance(self.errors, list) else []
+        if index < len(errors) and isinstance(errors[index], list):
+            field.errors = errors[index]
+        return field
+
+    def __iter__(self):
+        yield from self.entries
+        for index in range(len(self.entries), self.min_entries):
+            yield self.bind_entry(index)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __getitem__(self, index):
+        return self.entries[index]
+
+
+class FormTemplate(t.Mapping[str, t.Callable[[], Field]]):
+    """Fields of a subform, turned into unbound fields once and for all.
+    Every subform built from the template binds the same unbound fields.
+    """
+
+    def __init__(self, fields: Fields):
+        self.fields = fields
+
+    @cached_property
+    def unbound(self) -> t.Tuple[t.Tuple[str, t.Any], ...]:
+        return tuple((name, bind()) for name, bind in self.fields.items())
+
+    def __getitem__(self, name):
+        return self.fields[name]
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
+
 
 class GenericFormField(FormField):
 
-    fields: t.Mapping[str, t.Callable[[], Field]]
+    fields: FormTemplate
 
     def __init__(self, fields, form_class=BaseForm, **kwargs):
+        if not isinstance(fields, FormTemplate):
+            fields = FormTemplate(fields)
         self.fields = fields
         super().__init__(form_class, **kwargs)
 
@@ -36,9 +430,7 @@ class GenericFormField(FormField):
         self.object_data = data
 
         prefix = self.name + self.separator
-        self.form = self.form_class(
-            {name: bind() for name, bind in self.fields.items()},
-            prefix=prefix)
+        self.form = self.form_class(self.fields.unbound, prefix=prefix)
 
         if isinstance(data, dict):
             self.form.process(
@@ -50,9 +442,15 @@ class GenericFormField(FormField):
     def validate(self, form, extra_validators=None):
         return self.form.validate(extra_validators=extra_validators)
 
+    async def validate_async(self, form, extra_validators=None,
+                             executor=None):
+        from jsonschema_wtforms.asynchronous import validate_form
+
+        return await validate_form(self.form, extra_validators, executor)
+
     @classmethod
     def factory(cls, fields, form_class=BaseForm):
-        return GenericFormFactory(cls, fields, form_class)
+        return GenericFormFactory.from_fields(fields, form_class, cls)
 
 
 class GenericFormFactory(t.NamedTuple):
@@ -60,6 +458,14 @@ class GenericFormFactory(t.NamedTuple):
     form_class: t.Type[BaseForm] = BaseForm
     form_field: t.Type[GenericFormField] = GenericFormField
 
+    @classmethod
+    def from_fields(cls, fields: Fields, *args, **kwargs):
+        """Factory sharing one template between all its form fields.
+        """
+        if not isinstance(fields, FormTemplate):
+            fields = FormTemplate(fields)
+        return cls(fields, *args, **kwargs)
+
     def __call__(self, **kwargs):
         return self.form_field(
             self.fields, form_class=self.form_class, **kwargs)
@@ -0,0 +1,121 @@
+import asyncio
+import inspect
+import itertools
+import typing as t
+from concurrent.futures import Executor
+from wtforms.fields import Field, FieldList, FormField
+from wtforms.form import BaseForm
+from wtforms.validators import StopValidation, ValidationError
+from jsonschema_wtforms._fields import field_validators
+
+
+def is_async(validator) -> bool:
+    """Whether calling the validator returns an awaitable.
+    """
+    return inspect.iscoroutinefunction(validator) or \
+        inspect.iscoroutinefunction(getattr(validator, '__call__', None))
+
+
+async def run_sync(executor: t.Optional[Executor], function, *args):
+    """Calls the function in the executor if given, in place otherwise.
+    """
+    if executor is None:
+        return function(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, function, *args)
+
+
+async def run_chain(field: Field, form, validators: t.Iterable) -> bool:
+    """`Field._run_validation_chain`, awaiting the validators returning
+    an awaitable. Returns whether the validation was stopped.
+    """
+    for validator in validators:
+        try:
+            result = validator(form, field)
+            if inspect.isawaitable(result):
+                await result
+        except StopValidation as exc:
+            if exc.args and exc.args[0]:
+                field.errors.append(exc.args[0])
+            return True
+        except ValidationError as exc:
+            field.errors.append(exc.args[0])
+    return False
+
+
+async def validate_list(field: FieldList, form, extra_validators=(),
+                        executor: t.Optional[Executor] = None) -> bool:
+    """`FieldList.validate`, validating the entries concurrently.
+    """
+    field.errors = []
+    await asyncio.gather(*(
+        validate_field(entry, form, executor=executor)
+        for entry in field.entries
+    ))
+    field.errors = [entry.errors for entry in field.entries]
+    if not any(field.errors):
+        field.errors = []
+    await run_chain(
+        field, form, itertools.chain(field.validators, extra_validators))
+    return len(field.errors) == 0
+
+
+async def validate_field(field: Field, form, extra_validators=(),
+                         executor: t.Optional[Executor] = None) -> bool:
+    """`Field.validate`, awaiting the async validators. Fields without
+    any are validated as they are, in the executor if given.
+    """
+    if (validate := getattr(field, 'validate_async', None)) is not None:
+        return await validate(form, extra_validators, executor=executor)
+    if isinstance(field, FieldList):
+        return await validate_list(field, form, extra_validators, executor)
+    if isinstance(field, FormField):
+        if extra_validators:
+            raise TypeError(
+                "FormField does not accept in-line validators, as it"
+                " gets errors from the enclosed form."
+            )
+        return await validate_form(field.form, executor=executor)
+    if not any(map(is_async, itertools.chain(
+            field.validators, extra_validators))):
+        return await run_sync(
+            executor, field.validate, form, extra_validators)
+    if type(field).validate is not Field.validate:
+        raise TypeError(
+            f'{type(field).__name__} cannot run async validators.')
+
+    field.errors = list(field.process_errors)
+    stop_validation = False
+    field.check_validators(extra_validators)
+    try:
+        field.pre_validate(form)
+    except StopValidation as exc:
+        if exc.args and exc.args[0]:
+            field.errors.append(exc.args[0])
+        stop_validation = True
+    except ValidationError as exc:
+        field.errors.append(exc.args[0])
+    if not stop_validation:
+        stop_validation = await run_chain(
+            field, form, itertools.chain(field.validators, extra_validators))
+    try:
+        field.post_validate(form, stop_validation)
+    except ValidationError as exc:
+        field.errors.append(exc.args[0])
+    return len(field.errors) == 0
+
+
+async def validate_form(form: BaseForm,
+                        extra_validators: t.Optional[t.Mapping] = None,
+                        executor: t.Optional[Executor] = None) -> bool:
+    """`BaseForm.validate`, validating the fields concurrently: the
+    async validators of a field are awaited while the other fields are
+    validated. The errors are the ones `validate` gives.
+    """
+    results = await asyncio.gather(*(
+        validate_field(
+            field, form, field_validators(form, name, extra_validators),
+            executor)
+        for name, field in form._fields.items()
+    ))
+    return all(results)
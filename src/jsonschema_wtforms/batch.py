@@ -0,0 +1,120 @@
+import typing as t
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from jsonschema_wtforms import Form, JSONSchema, compile_schema
+from jsonschema_wtforms.field import ObjectParameters
+from jsonschema_wtforms.formdata import record_formdata
+
+
+class Result(t.NamedTuple):
+    index: int
+    data: t.Optional[dict] = None
+    errors: t.Optional[dict] = None
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+
+class BatchValidator:
+    """Validates many records against one compiled schema.
+
+    The fields are bound once: each record only processes and validates
+    the same form again. Records are submitted as formdata, see
+    `record_formdata`. A validator must not be shared between threads.
+    """
+
+    def __init__(self, root: ObjectParameters,
+                 form_class: t.Type[Form] = Form):
+        self.root = root
+        self.form = form_class(root.fields)
+
+    @classmethod
+    def from_schema(cls, schema: JSONSchema,
+                    include: t.Optional[t.Iterable[str]] = None,
+                    exclude: t.Optional[t.Iterable[str]] = None,
+                    **kwargs):
+        return cls(compile_schema(schema, include, exclude), **kwargs)
+
+    def validate(self, record: dict, index: int = 0) -> Result:
+        if not isinstance(record, dict):
+            return Result(index, errors={None: ['Not a valid object.']})
+        form = self.form
+        form.process(formdata=record_formdata(self.root.fields, record))
+        if form.validate():
+            return Result(index, data=form.data)
+        return Result(index, errors=form.errors)
+
+    def __call__(self, records: t.Iterable[dict]) -> t.Iterator[Result]:
+        for index, record in enumerate(records):
+            yield self.validate(record, index)
+
+
+def chunked(iterable: t.Iterable, size: int) -> t.Iterator[list]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def ordered_map(executor: Executor, func: t.Callable, iterable: t.Iterable,
+                window: int) -> t.Iterator:
+    """Like `executor.map`, without consuming the whole iterable upfront:
+    at most `window` calls are pending at any time.
+    """
+    pending = deque()
+    for item in iterable:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+_validator: t.Optional[BatchValidator] = None
+
+
+def _initialize(schema, include, exclude, validator):
+    global _validator
+    _validator = validator.from_schema(schema, include, exclude)
+
+
+def _validate_chunk(chunk: t.Tuple[int, list]) -> t.List[Result]:
+    start, records = chunk
+    return [_validator.validate(record, index)
+            for index, record in enumerate(records, start)]
+
+
+def validate_many(schema: JSONSchema, records: t.Iterable[dict],
+                  include: t.Optional[t.Iterable[str]] = None,
+                  exclude: t.Optional[t.Iterable[str]] = None,
+                  processes: int = 0,
+                  chunksize: int = 256,
+                  validator: t.Type = BatchValidator) -> t.Iterator[Result]:
+    """Yields a result per record, in order.
+
+    With `processes`, records are validated by a pool of worker
+    processes, `chunksize` records at a time. Each worker compiles the
+    schema once. `validator` is the class validating the records, such
+    as `BatchValidator` or `fastpath.FastValidator`.
+    """
+    if not processes:
+        yield from validator.from_schema(schema, include, exclude)(records)
+        return
+
+    if chunksize < 1:
+        raise ValueError('chunksize must be a positive integer.')
+
+    def chunks():
+        start = 0
+        for chunk in chunked(records, chunksize):
+            yield start, chunk
+            start += len(chunk)
+
+    with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_initialize,
+            initargs=(schema, include, exclude, validator)) as executor:
+        for results in ordered_map(
+                executor, _validate_chunk, chunks(), processes * 2):
+            yield from results
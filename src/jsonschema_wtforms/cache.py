@@ -0,0 +1,143 @@
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import (
+    Any, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple)
+
+
+def canonical(node, ordered: bool = False):
+    """The node with its keys sorted, except in `properties`: their
+    order is the order of the fields.
+    """
+    if isinstance(node, dict):
+        items = node.items() if ordered else sorted(node.items())
+        return {
+            key: canonical(value, not ordered and key == 'properties')
+            for key, value in items
+        }
+    if isinstance(node, (list, tuple)):
+        return [canonical(item) for item in node]
+    return node
+
+
+def fingerprint(schema: Dict,
+                include: Optional[Iterable[str]] = None,
+                exclude: Optional[Iterable[str]] = None) -> str:
+    """Canonical digest of a schema and its include/exclude filters.
+    Two schemas that only differ in key order share a fingerprint,
+    unless the order of their properties differs.
+    """
+    text = json.dumps(
+        [
+            canonical(schema),
+            None if include is None else sorted(include),
+            None if exclude is None else sorted(exclude),
+        ],
+        separators=(',', ':'), default=repr
+    )
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class SchemaCache:
+    """Bounded LRU mapping of fingerprints to compiled schemas.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize < 0:
+            raise ValueError('maxsize must be a positive integer or 0.')
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int):
+        if value < 0:
+            raise ValueError('maxsize must be a positive integer or 0.')
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+
+    def _evict(self):
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: Hashable, compile: Callable[[], Any]):
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+        # Compile outside of the lock: a concurrent miss on the same
+        # key costs one extra conversion, not a stalled cache.
+        value = compile()
+        if self._maxsize:
+            with self._lock:
+                value = self._entries.setdefault(key, value)
+                self._entries.move_to_end(key)
+                self._evict()
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        """Store a value compiled elsewhere, as `get` would.
+        """
+        if self._maxsize:
+            with self._lock:
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                self._evict()
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Snapshot of the entries, least recently used first.
+        """
+        with self._lock:
+            return list(self._entries.items())
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop one entry, or everything when no key is given.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions,
+                self._maxsize, len(self._entries)
+            )
+
+    def __contains__(self, key: Hashable):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+schema_cache = SchemaCache()
@@ -0,0 +1,79 @@
+import typing as t
+from jsonschema_wtforms.cache import SchemaCache
+
+
+class Choices(t.Sequence[t.Tuple[t.Any, t.Any]]):
+    """Immutable `(value, label)` pairs of an enum.
+
+    One instance is shared by every field built from the same values:
+    fields keep it as is instead of copying it, and check the submitted
+    data against a set of the coerced values.
+    """
+    __slots__ = ('values', '_accepted')
+
+    def __init__(self, values: t.Iterable):
+        self.values = tuple(values)
+        self._accepted: t.Dict[t.Callable, t.FrozenSet] = {}
+
+    def accepted(self, coerce: t.Callable = str) -> t.FrozenSet:
+        """The coerced values, computed once per coercion function.
+        """
+        try:
+            return self._accepted[coerce]
+        except KeyError:
+            pass
+        accepted = self._accepted[coerce] = frozenset(
+            map(coerce, self.values))
+        return accepted
+
+    def accepts(self, data, coerce: t.Callable = str) -> bool:
+        try:
+            return data in self.accepted(coerce)
+        except TypeError:
+            # Unhashable data or values: a linear scan, as wtforms does.
+            return any(coerce(value) == data for value in self.values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple((value, value) for value in self.values[index])
+        value = self.values[index]
+        return (value, value)
+
+    def __iter__(self):
+        return ((value, value) for value in self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __eq__(self, other):
+        if isinstance(other, Choices):
+            return self.values == other.values
+        if isinstance(other, (tuple, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.values)
+
+    def __repr__(self):
+        return f'<Choices: {len(self.values)} values>'
+
+    def __reduce__(self):
+        # Unpickled choices are shared like freshly converted ones.
+        return shared_choices, (self.values,)
+
+
+choices_cache = SchemaCache(maxsize=256)
+
+
+def shared_choices(values: t.Iterable) -> Choices:
+    """The `Choices` of the given enum values, shared process-wide.
+    """
+    values = tuple(values)
+    # Typed, for `1`, `1.0` and `True` not to share an entry.
+    key = tuple((type(value), value) for value in values)
+    try:
+        hash(key)
+    except TypeError:
+        return Choices(values)
+    return choices_cache.get(key, lambda: Choices(values))
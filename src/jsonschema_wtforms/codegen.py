@@ -0,0 +1,258 @@
+"""Generates a Python module declaring the forms of a schema.
+
+    python -m jsonschema_wtforms.codegen schema.json -o forms.py
+
+The module holds the `wtforms.Form` classes `ObjectParameters.as_form_class`
+builds at runtime, written out with their fields, validators and
+choices: importing it converts no schema.
+"""
+import argparse
+import json
+import keyword
+import math
+import re
+import sys
+import typing as t
+import wtforms.form
+import wtforms.validators
+from types import MappingProxyType
+from wtforms.fields.core import UnboundField
+from jsonschema_wtforms import JSONSchema, compile_schema
+from jsonschema_wtforms.cache import fingerprint
+from jsonschema_wtforms.choices import Choices, shared_choices
+from jsonschema_wtforms.field import ObjectParameters, class_name
+from jsonschema_wtforms.validators import NumberRange
+
+
+# Validator type: the attributes given back to its constructor.
+VALIDATORS = {
+    wtforms.validators.DataRequired: ('message',),
+    wtforms.validators.InputRequired: ('message',),
+    wtforms.validators.Length: ('min', 'max', 'message'),
+    wtforms.validators.IPAddress: ('ipv4', 'ipv6', 'message'),
+    NumberRange: (
+        'min', 'max', 'exclusive_min', 'exclusive_max', 'message'),
+}
+
+
+def identifier(name: str) -> bool:
+    return name.isidentifier() and not keyword.iskeyword(name)
+
+
+class Generator:
+    """Writes out unbound fields and the objects they are made of.
+
+    Shared objects, such as validators and choices, are declared once
+    as module constants, and stay shared in the generated module.
+    """
+
+    def __init__(self, base: t.Type[wtforms.form.Form] = wtforms.form.Form):
+        self.base = base
+        self.imports: t.Set[str] = set()
+        # Constants, then the classes using them.
+        self.statements: t.List[t.Tuple[bool, str]] = []
+        self.constants: t.Dict[int, str] = {}
+        self.classes: t.Dict[t.Any, str] = {}
+        self.names: t.Set[str] = set()
+        self.refs: t.List[t.Any] = []
+
+    def unique(self, name: str) -> str:
+        candidate, count = name, 1
+        while candidate in self.names:
+            count += 1
+            candidate = f'{name}{count}'
+        self.names.add(candidate)
+        return candidate
+
+    def reference(self, obj) -> str:
+        module, name = obj.__module__, obj.__qualname__
+        self.imports.add(module)
+        return f'{module}.{name}'
+
+    def constant(self, obj, source: str, name: str) -> str:
+        try:
+            return self.constants[id(obj)]
+        except KeyError:
+            pass
+        name = self.constants[id(obj)] = self.unique(name)
+        # Identifiers of live objects are only unique while they live.
+        self.refs.append(obj)
+        self.statements.append((True, f'{name} = {source}'))
+        return name
+
+    def validator(self, validator) -> str:
+        cls = type(validator)
+        if cls in VALIDATORS:
+            arguments = ', '.join(
+                f'{name}={self.expression(getattr(validator, name))}'
+                for name in VALIDATORS[cls]
+                if getattr(validator, name) is not None
+            )
+        elif isinstance(validator, wtforms.validators.Optional):
+            strip = validator.string_check(' ') == ''
+            arguments = '' if strip else 'strip_whitespace=False'
+        elif isinstance(validator, wtforms.validators.Regexp):
+            pattern = validator.regex
+            arguments = (
+                f'{self.reference(re.compile)}'
+                f'({pattern.pattern!r}, {pattern.flags!r})')
+            if validator.message is not None:
+                arguments += f', message={validator.message!r}'
+        else:
+            raise TypeError(f'Cannot generate code for {validator!r}.')
+        return self.constant(
+            validator, f'{self.reference(cls)}({arguments})',
+            f'{cls.__name__.upper()}')
+
+    def expression(self, value, indent: str = '') -> str:
+        if value is None or isinstance(value, (bool, int, str)):
+            return repr(value)
+        if isinstance(value, float):
+            if math.isfinite(value):
+                return repr(value)
+            return f'float({str(value)!r})'
+        if isinstance(value, Choices):
+            return self.constant(
+                value,
+                f'{self.reference(shared_choices)}'
+                f'({self.expression(value.values)})',
+                'CHOICES')
+        if isinstance(value, (dict, MappingProxyType)):
+            items = ', '.join(
+                f'{self.expression(key)}: {self.expression(item, indent)}'
+                for key, item in value.items())
+            return f'{{{items}}}'
+        if isinstance(value, tuple):
+            items = ', '.join(
+                self.expression(item, indent) for item in value)
+            return f'({items},)' if len(value) == 1 else f'({items})'
+        if isinstance(value, list):
+            items = ', '.join(
+                self.expression(item, indent) for item in value)
+            return f'[{items}]'
+        if isinstance(value, UnboundField):
+            return self.field(value, indent)
+        if isinstance(value, type):
+            if issubclass(value, wtforms.form.BaseForm) and \
+               value.__module__ == ObjectParameters.__module__:
+                # Built by `as_form_class`.
+                return self.form_class(value)
+            return self.reference(value)
+        if type(value) in VALIDATORS or isinstance(value, (
+                wtforms.validators.Optional, wtforms.validators.Regexp)):
+            return self.validator(value)
+        raise TypeError(f'Cannot generate code for {value!r}.')
+
+    def field(self, unbound: UnboundField, indent: str = '') -> str:
+        arguments = [
+            self.expression(arg, indent + '    ') for arg in unbound.args]
+        arguments.extend(
+            f'{name}={self.expression(value, indent + "    ")}'
+            for name, value in unbound.kwargs.items())
+        inner = f',\n{indent}    '.join(arguments)
+        return (f'{self.reference(unbound.field_class)}(\n'
+                f'{indent}    {inner}\n{indent})')
+
+    def form_class(self, form_class: t.Type[wtforms.form.Form],
+                   name: t.Optional[str] = None) -> str:
+        if (known := self.classes.get(form_class)) is not None:
+            return known
+        # Fields in declaration order: nested classes come first.
+        fields = [
+            (key, value) for key, value in vars(form_class).items()
+            if isinstance(value, UnboundField)
+        ]
+        body = [(key, self.field(value, '    ')) for key, value in fields]
+        name = self.classes[form_class] = self.unique(
+            name or form_class.__name__)
+        base = self.reference(self.base)
+        if all(identifier(key) for key, _ in body):
+            lines = [f'class {name}({base}):']
+            lines.extend(f'    {key} = {source}' for key, source in body)
+            if not body:
+                lines.append('    pass')
+        else:
+            lines = [f'{name} = type({name!r}, ({base},), {{']
+            lines.extend(f'    {key!r}: {source},' for key, source in body)
+            lines.append('})')
+        self.statements.append((False, '\n'.join(lines)))
+        return name
+
+    def module(self, header: str = '') -> str:
+        source = '\n\n'.join(filter(None, (header, '\n'.join(
+            f'import {module}' for module in sorted(self.imports)))))
+        previous = False
+        for constant, statement in self.statements:
+            source += '\n' if constant and previous else '\n\n\n'
+            source += statement
+            previous = constant
+        return source + '\n'
+
+
+def generate(root: ObjectParameters, name: t.Optional[str] = None,
+             base: t.Type[wtforms.form.Form] = wtforms.form.Form,
+             header: str = '') -> str:
+    """Source of a module declaring the form class of the root and the
+    form classes of its nested objects.
+    """
+    generator = Generator(base)
+    if name is None:
+        name = class_name(root.label or 'Schema')
+    generator.form_class(root.as_form_class(name=name, base=base), name)
+    return generator.module(header)
+
+
+def generate_module(schema: JSONSchema,
+                    include: t.Optional[t.Iterable[str]] = None,
+                    exclude: t.Optional[t.Iterable[str]] = None,
+                    name: t.Optional[str] = None,
+                    compact: bool = False) -> str:
+    include = None if include is None else tuple(include)
+    exclude = None if exclude is None else tuple(exclude)
+    root = compile_schema(
+        schema, include, exclude, cache=None, compact=compact)
+    key = fingerprint(schema, include, exclude)
+    header = (
+        f'# Generated by jsonschema_wtforms.codegen, do not edit.\n'
+        f'# Schema fingerprint: {key}')
+    return generate(root, name=name, header=header)
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m jsonschema_wtforms.codegen',
+        description='Generate a module declaring the forms of a schema.')
+    parser.add_argument(
+        'schema', type=argparse.FileType('r'),
+        help='JSON schema file.')
+    parser.add_argument(
+        '-o', '--output', type=argparse.FileType('w'), default='-',
+        help='Module to write, stdout by default.')
+    parser.add_argument(
+        '--name', help='Name of the root form class.')
+    parser.add_argument(
+        '--include', action='append', metavar='PROPERTY',
+        help='Only generate this property or dotted path (repeatable).')
+    parser.add_argument(
+        '--exclude', action='append', metavar='PROPERTY',
+        help='Leave out this property or dotted path (repeatable).')
+    parser.add_argument(
+        '--compact', action='store_true',
+        help='Use compact fields for arrays of scalar items.')
+    return parser
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> int:
+    args = make_parser().parse_args(argv)
+    with args.schema:
+        schema = json.load(args.schema)
+    source = generate_module(
+        schema, args.include, args.exclude, name=args.name,
+        compact=args.compact)
+    with args.output:
+        args.output.write(source)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,7 +1,12 @@
 import abc
+import threading
 import wtforms.fields
 import wtforms.validators
-from typing import List, Dict, Type, ClassVar, Tuple, Optional
+from functools import cached_property
+from types import MappingProxyType
+from typing import (
+    Callable, List, Dict, Type, ClassVar, Tuple, Optional, Mapping)
+from jsonschema_wtforms.instrumentation import UnboundSchemaField
 
 
 class NotRequired(wtforms.validators.Optional):
@@ -16,19 +21,29 @@ class JSONFieldParameters(abc.ABC):
     supported: ClassVar[set]
     ignore: ClassVar[set] = {
         'additionalProperties', 'name', 'type',
-        'title', 'description', 'anyOf', 'if', 'then'
+        'title', 'description', 'anyOf', 'if', 'then', '$anchor'
     }
     allowed: ClassVar[set] = frozenset(('default',))
 
+    # Validators are stateless: one instance serves every field.
+    required_validator: ClassVar = wtforms.validators.DataRequired()
+    optional_validator: ClassVar = NotRequired()
+
     type: str
     name: str
     label: str
     description: str
-    validators: List
-    attributes: Dict
+    validators: Tuple
+    attributes: Mapping
     required: bool
     factory: Optional[Type[wtforms.fields.Field]] = None
 
+    # Read-only mappings, turned into dicts to be pickled.
+    read_only: ClassVar[Tuple[str, ...]] = ('attributes',)
+    # Attributes computed on first use, not pickled.
+    computed: ClassVar[Tuple[str, ...]] = (
+        'options', 'field_factory', 'unbound')
+
     def __init__(self,
                  type: str,
                  name: str,
@@ -45,31 +60,78 @@ class JSONFieldParameters(abc.ABC):
         self.label = label or name
         self.description = description
         self.required = required
-        self.validators = validators
-        self.attributes = attributes
+        # Parameters are shared between forms, threads and caches:
+        # they are never modified once created.
+        self.validators = tuple(validators)
+        self.attributes = MappingProxyType(dict(attributes))
 
     def get_options(self):
         return {
             'label': self.label,
             'description': self.description,
             'validators': [
-                wtforms.validators.DataRequired() if self.required else
-                NotRequired(), *self.validators
+                self.required_validator if self.required else
+                self.optional_validator, *self.validators
             ], **self.attributes
         }
 
+    def __getstate__(self):
+        state = {
+            name: value for name, value in self.__dict__.items()
+            if name not in self.computed
+        }
+        for name in self.read_only:
+            if name in state:
+                state[name] = dict(state[name])
+        return state
+
+    def __setstate__(self, state):
+        for name in self.read_only:
+            if name in state:
+                state[name] = MappingProxyType(state[name])
+        self.__dict__.update(state)
+
     @abc.abstractmethod
     def get_factory(self):
         return self.factory
 
+    @cached_property
+    def options(self) -> Mapping:
+        """`get_options`, computed once.
+        """
+        options = dict(self.get_options())
+        if 'validators' in options:
+            options['validators'] = tuple(options['validators'])
+        return MappingProxyType(options)
+
+    @cached_property
+    def field_factory(self):
+        """`get_factory`, computed once.
+        """
+        return self.get_factory()
+
     def __call__(self):
-        options = self.get_options()
-        factory = self.get_factory()
-        return factory(**options)
+        return self.tag(self.field_factory(**self.options))
+
+    def tag(self, unbound):
+        """Marks an unbound field as made from these parameters, for the
+        instrumentation to tell the field types apart.
+        """
+        return UnboundSchemaField.from_unbound(unbound, type(self).__name__)
+
+    def declare(self):
+        """Unbound field to be used as an attribute of a declarative form.
+        """
+        return self()
+
+    @cached_property
+    def unbound(self):
+        """Unbound field shared by every binding of the parameters.
+        """
+        return self()
 
     def bind(self, form, **options):
-        wtfield = self()
-        return wtfield.bind(form, **options)
+        return self.unbound.bind(form, **options)
 
     @classmethod
     def extract(cls, params: dict, available: set) -> Tuple[List, Dict]:
@@ -93,6 +155,52 @@ class JSONFieldParameters(abc.ABC):
         )
 
 
+class LazyParameters:
+    """Parameters converted on first use, then memoized.
+    Everything but the name and the requirement is read from the
+    converted parameters.
+    """
+
+    def __init__(self, name: str, required: bool,
+                 compile: Callable[[], JSONFieldParameters],
+                 lock: threading.RLock):
+        self.name = name
+        self.required = required
+        self._compile = compile
+        self._lock = lock
+        self._parameters = None
+
+    @property
+    def compiled(self) -> bool:
+        return self._parameters is not None
+
+    @property
+    def parameters(self) -> JSONFieldParameters:
+        if (parameters := self._parameters) is None:
+            with self._lock:
+                if self._parameters is None:
+                    self._parameters = self._compile()
+                    self._compile = None
+                parameters = self._parameters
+        return parameters
+
+    def __getattr__(self, name):
+        return getattr(self.parameters, name)
+
+    def __call__(self):
+        return self.parameters()
+
+    def bind(self, form, **options):
+        return self.parameters.bind(form, **options)
+
+    def declare(self):
+        return self.parameters.declare()
+
+    def __repr__(self):
+        state = repr(self._parameters) if self.compiled else 'pending'
+        return f'<LazyParameters {self.name!r}: {state}>'
+
+
 class Converter:
 
     converter: Dict[str, JSONFieldParameters]
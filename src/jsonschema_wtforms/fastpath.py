@@ -0,0 +1,420 @@
+import typing as t
+import wtforms.fields
+from functools import partial
+from wtforms.form import BaseForm
+from wtforms.utils import unset_value
+from wtforms.validators import StopValidation, ValidationError
+from jsonschema_wtforms import JSONSchema, compile_schema
+from jsonschema_wtforms._fields import GenericFormFactory, Probe
+from jsonschema_wtforms.batch import BatchValidator, Result
+from jsonschema_wtforms.choices import Choices
+from jsonschema_wtforms.converter import JSONFieldParameters, LazyParameters
+from jsonschema_wtforms.field import ArrayParameters, ObjectParameters
+from jsonschema_wtforms.formdata import FormData, flatten, raw_value
+
+
+MISSING = object()
+
+# A check takes the submitted JSON value (or MISSING) and the object data
+# given by the parent (or `unset_value`), and returns data and errors.
+Check = t.Callable[[t.Any, t.Any], t.Tuple[t.Any, t.Any]]
+
+
+def run_validators(probe: Probe, validators: t.Sequence,
+                   pre_validate: t.Optional[t.Callable] = None) -> list:
+    errors = probe.errors
+    if pre_validate is not None:
+        try:
+            pre_validate(probe)
+        except StopValidation as exc:
+            if exc.args and exc.args[0]:
+                errors.append(exc.args[0])
+            return probe.errors
+        except ValidationError as exc:
+            errors.append(exc.args[0])
+
+    for validator in validators:
+        try:
+            validator(None, probe)
+        except StopValidation as exc:
+            if exc.args and exc.args[0]:
+                probe.errors.append(exc.args[0])
+            break
+        except ValidationError as exc:
+            probe.errors.append(exc.args[0])
+    return probe.errors
+
+
+def produces(params, value) -> bool:
+    """Whether the value is submitted at all, see `flatten`.
+    """
+    if value is None:
+        return False
+    if isinstance(params, LazyParameters):
+        params = params.parameters
+    if isinstance(params, ObjectParameters):
+        return isinstance(value, dict) and any(
+            produces(subparams, value[name])
+            for name, subparams in params.fields.items() if name in value
+        )
+    if isinstance(params, ArrayParameters) and isinstance(value, list) \
+       and is_field_list(params.field_factory):
+        return any(produces(params.subfield, item) for item in value)
+    return True
+
+
+def is_field_list(factory) -> bool:
+    return isinstance(factory, partial) and \
+        factory.func is wtforms.fields.FieldList
+
+
+def field_class(factory):
+    if isinstance(factory, partial):
+        factory = factory.func
+    if isinstance(factory, type) and issubclass(factory, wtforms.fields.Field):
+        return factory
+    return None
+
+
+def scalar_kind(factory):
+    cls = field_class(factory)
+    if cls is None:
+        return None
+    for kind, base in (
+            ('multiple', wtforms.fields.SelectMultipleField),
+            ('select', wtforms.fields.SelectField),
+            ('boolean', wtforms.fields.BooleanField),
+            ('integer', wtforms.fields.IntegerField),
+            ('float', wtforms.fields.FloatField)):
+        if issubclass(cls, base):
+            return kind
+    # Fields keeping the first submitted value as is.
+    if cls.process is wtforms.fields.Field.process and \
+       cls.process_data is wtforms.fields.Field.process_data and \
+       cls.process_formdata in (wtforms.fields.Field.process_formdata,
+                                wtforms.fields.StringField.process_formdata):
+        return 'text'
+    return None
+
+
+def number_processors(convert, message):
+    def process_data(value):
+        if value is None or value is unset_value:
+            return None, None
+        try:
+            return convert(value), None
+        except (ValueError, TypeError):
+            return None, message
+
+    def process_formdata(data, valuelist):
+        if not valuelist:
+            return data, None
+        try:
+            return convert(valuelist[0]), None
+        except (ValueError, TypeError):
+            return None, message
+
+    return process_data, process_formdata
+
+
+def processors(kind: str, options: t.Mapping, factory):
+    """Mirrors of `process_data`, `process_formdata` and `pre_validate`
+    for the field kinds handled by closures.
+    """
+    pre_validate = None
+
+    if kind == 'text':
+        def process_data(value):
+            return value, None
+
+        def process_formdata(data, valuelist):
+            if valuelist:
+                return valuelist[0], None
+            return data, None
+
+    elif kind == 'integer':
+        process_data, process_formdata = number_processors(
+            int, 'Not a valid integer value.')
+
+    elif kind == 'float':
+        process_data, process_formdata = number_processors(
+            float, 'Not a valid float value.')
+
+    elif kind == 'boolean':
+        false_values = options.get(
+            'false_values', field_class(factory).false_values)
+
+        def process_data(value):
+            return bool(value), None
+
+        def process_formdata(data, valuelist):
+            return not (not valuelist or valuelist[0] in false_values), None
+
+    else:
+        coerce = options.get('coerce', str)
+        choices = options.get('choices')
+        validate_choice = options.get('validate_choice', True)
+        if choices is not None:
+            try:
+                if isinstance(choices, Choices):
+                    accepted = choices.accepted(coerce)
+                else:
+                    accepted = frozenset(
+                        coerce(choice[0]) for choice in choices)
+            except TypeError:
+                accepted = [coerce(choice[0]) for choice in choices]
+
+        if kind == 'select':
+            def process_data(value):
+                try:
+                    return (coerce(value) if value is not None else None,
+                            None)
+                except (ValueError, TypeError):
+                    return None, None
+
+            def process_formdata(data, valuelist):
+                if not valuelist:
+                    return data, None
+                try:
+                    return coerce(valuelist[0]), None
+                except (ValueError, TypeError):
+                    return data, 'Invalid Choice: could not coerce.'
+
+            def check_choice(probe):
+                if choices is None:
+                    raise TypeError('Choices cannot be None.')
+                if probe.data not in accepted:
+                    raise ValidationError('Not a valid choice.')
+
+            if validate_choice:
+                pre_validate = check_choice
+        else:
+            def process_data(value):
+                try:
+                    return [coerce(v) for v in value], None
+                except (ValueError, TypeError):
+                    return None, None
+
+            def process_formdata(data, valuelist):
+                try:
+                    return [coerce(x) for x in valuelist], None
+                except (ValueError, TypeError):
+                    return data, (
+                        'Invalid choice(s): one or more data inputs '
+                        'could not be coerced.')
+
+            def check_choices(probe):
+                if not probe.data:
+                    return
+                if choices is None:
+                    raise TypeError('Choices cannot be None.')
+                if any(data not in accepted for data in probe.data):
+                    unacceptable = [
+                        str(data) for data in set(probe.data)
+                        if data not in accepted
+                    ]
+                    raise ValidationError(probe.ngettext(
+                        "'%(value)s' is not a valid choice for this "
+                        "field.",
+                        "'%(value)s' are not valid choices for this "
+                        "field.",
+                        len(unacceptable)
+                    ) % dict(value="', '".join(unacceptable)))
+
+            if validate_choice:
+                pre_validate = check_choices
+
+    return process_data, process_formdata, pre_validate
+
+
+class Compiler:
+
+    def __init__(self):
+        self.checks: t.Dict[int, Check] = {}
+        self.field_list_defaults = False
+
+    def __call__(self, params: JSONFieldParameters) -> Check:
+        try:
+            return self.checks[id(params)][1]
+        except KeyError:
+            pass
+
+        if isinstance(params, LazyParameters):
+            compiled = []
+
+            def check(value, data=unset_value):
+                if not compiled:
+                    compiled.append(self(params.parameters))
+                return compiled[0](value, data)
+        else:
+            factory = params.field_factory
+            if isinstance(factory, GenericFormFactory):
+                check = self.object(params)
+            elif is_field_list(factory):
+                check = self.field_list(params)
+            elif (kind := scalar_kind(factory)) is not None:
+                check = self.scalar(params, kind)
+            else:
+                check = self.fallback(params)
+        # Parameters are kept alive, for their ids not to be reused.
+        self.checks[id(params)] = (params, check)
+        return check
+
+    def scalar(self, params, kind: str) -> Check:
+        options = params.options
+        validators = options.get('validators', ())
+        default = options.get('default')
+        process_data, process_formdata, pre_validate = processors(
+            kind, options, params.field_factory)
+        initial = process_data(default)
+
+        def check(value, data=unset_value):
+            if data is unset_value:
+                data, error = initial
+            else:
+                data, error = process_data(data)
+            errors = [] if error is None else [error]
+            if value is MISSING or value is None:
+                raw_data = []
+            elif isinstance(value, list) and kind == 'multiple':
+                raw_data = [raw_value(item) for item in value]
+            else:
+                raw_data = [raw_value(value, kind == 'boolean')]
+            data, error = process_formdata(data, raw_data)
+            if error is not None:
+                errors.append(error)
+            probe = Probe(data, raw_data, errors)
+            return probe.data, run_validators(
+                probe, validators, pre_validate)
+
+        return check
+
+    def fallback(self, params) -> Check:
+        """Exact but slower: clones a bound field for every value.
+        """
+        template = BaseForm({'field': params})['field']
+        name = template.name
+        cls, state = type(template), vars(template)
+
+        def check(value, data=unset_value):
+            # `copy.copy` would go through `Field.__new__`.
+            field = object.__new__(cls)
+            field.__dict__.update(state)
+            formdata = FormData()
+            if value is not MISSING:
+                flatten(params, name, value, formdata)
+            field.process(formdata, data)
+            field.validate(None)
+            return field.data, field.errors
+
+        return check
+
+    def object(self, params: ObjectParameters) -> Check:
+        default = params.options.get('default')
+        children = tuple(
+            (name, self(subparams))
+            for name, subparams in params.fields.items()
+        )
+
+        def check(value, data=unset_value):
+            if data is unset_value:
+                data = default
+            if not isinstance(value, dict):
+                value = {}
+            if isinstance(data, dict):
+                def given(name):
+                    return data.get(name, unset_value)
+            elif data is not None:
+                def given(name):
+                    return getattr(data, name, unset_value)
+            else:
+                def given(name):
+                    return unset_value
+
+            result, errors = {}, {}
+            for name, child in children:
+                result[name], child_errors = child(
+                    value.get(name, MISSING), given(name))
+                if child_errors:
+                    errors[name] = child_errors
+            return result, errors
+
+        return check
+
+    def field_list(self, params: ArrayParameters) -> Check:
+        options = params.options
+        validators = options.get('validators', ())
+        default = options.get('default', ())
+        min_entries = options.get('min_entries', 0)
+        max_entries = options.get('max_entries', None)
+        subparams = params.subfield
+        entry = self(subparams)
+        if default:
+            self.field_list_defaults = True
+
+        def check(value, data=unset_value):
+            if data is unset_value or not data:
+                data = default
+            items = value if isinstance(value, list) else ()
+            indices = [
+                index for index, item in enumerate(items)
+                if produces(subparams, item)
+            ]
+            if max_entries:
+                indices = indices[:max_entries]
+            idata = iter(data)
+            entries = [
+                entry(items[index], next(idata, unset_value))
+                for index in indices
+            ]
+            while len(entries) < min_entries:
+                entries.append(entry(MISSING, unset_value))
+
+            errors = [entry_errors for _, entry_errors in entries]
+            if not any(errors):
+                errors = []
+            probe = Probe(
+                [entry_data for entry_data, _ in entries],
+                None, errors, entries)
+            return probe.data, run_validators(probe, validators)
+
+        return check
+
+
+class FastValidator:
+    """Validates records with closures compiled from a parameters tree.
+
+    The closures apply the rules of the form path: a record is processed
+    as the formdata `record_formdata` would submit, by the same validator
+    instances, and gives the same data and errors as a `BatchValidator`.
+    No field, widget or label is created per record, and a fast
+    validator can be shared between threads.
+    """
+
+    def __init__(self, root: ObjectParameters):
+        self.root = root
+        compiler = Compiler()
+        self.check = compiler.object(root)
+        self.defaults_on_empty = compiler.field_list_defaults
+
+    @classmethod
+    def from_schema(cls, schema: JSONSchema,
+                    include: t.Optional[t.Iterable[str]] = None,
+                    exclude: t.Optional[t.Iterable[str]] = None):
+        return cls(compile_schema(schema, include, exclude))
+
+    def validate(self, record: dict, index: int = 0) -> Result:
+        if not isinstance(record, dict):
+            return Result(index, errors={None: ['Not a valid object.']})
+        if self.defaults_on_empty and not produces(self.root, record):
+            # Lists fall back to their defaults when nothing at all is
+            # submitted, see `FieldList.process`: left to the form path.
+            return BatchValidator(self.root).validate(record, index)
+        data, errors = self.check(record)
+        if errors:
+            return Result(index, errors=errors)
+        return Result(index, data=data)
+
+    def __call__(self, records: t.Iterable[dict]) -> t.Iterator[Result]:
+        for index, record in enumerate(records):
+            yield self.validate(record, index)
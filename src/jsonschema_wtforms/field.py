@@ -1,13 +1,105 @@
+import copy
 import re
 import wtforms.form
 import wtforms.fields
 import wtforms.validators
-from functools import partial
-from typing import Optional, Dict, ClassVar, Type, Iterable
-from jsonschema_wtforms._fields import MultiCheckboxField, GenericFormFactory
+from functools import cached_property, partial
+from types import MappingProxyType
+from typing import Optional, Dict, ClassVar, Type, Iterable, Tuple, FrozenSet
+from jsonschema_wtforms import instrumentation
+from jsonschema_wtforms._fields import (
+    EnumSelectField, MultiCheckboxField, GenericFormFactory, ScalarListField)
+from jsonschema_wtforms.choices import shared_choices
+from jsonschema_wtforms.patterns import pattern_cache
 from jsonschema_wtforms.validators import NumberRange
+from jsonschema_wtforms.resolver import Resolver
 from jsonschema_wtforms.converter import (
-    JSONFieldParameters, converter, NotRequired)
+    JSONFieldParameters, LazyParameters, converter)
+
+
+def class_name(name: str) -> str:
+    parts = re.split(r'[^0-9a-zA-Z]+', name)
+    name = ''.join(part[:1].upper() + part[1:] for part in parts)
+    if not name or name[0].isdigit():
+        name = f'Schema{name}'
+    return f'{name}Form'
+
+
+Paths = FrozenSet[Tuple[str, ...]]
+
+
+def path_segments(path, properties) -> Tuple[str, ...]:
+    """Property names along a path: a property name, a dotted path or a
+    JSON pointer. Array items are gone through, `*` standing for them.
+    """
+    if isinstance(path, tuple):
+        segments = path
+    elif path in properties:
+        segments = (path,)
+    elif path.startswith('/'):
+        segments = tuple(
+            segment.replace('~1', '/').replace('~0', '~')
+            for segment in path[1:].split('/'))
+    else:
+        segments = tuple(path.split('.'))
+    return tuple(segment for segment in segments if segment != '*')
+
+
+def selection(paths: Iterable, properties) -> Dict[str, Optional[Paths]]:
+    """What the paths select in an object: a property as a whole, as
+    None, or the paths within it.
+    """
+    selected = {}
+    for path in paths:
+        name, *rest = path_segments(path, properties) or ('',)
+        if not rest:
+            selected[name] = None
+        elif selected.get(name, ()) is not None:
+            selected.setdefault(name, set()).add(tuple(rest))
+    return {
+        name: None if paths is None else frozenset(paths)
+        for name, paths in selected.items()
+    }
+
+
+def convert(field: Type[JSONFieldParameters], name: str, required: bool,
+            definition: dict, resolver: Resolver, ref: Optional[str] = None,
+            include: Optional[Paths] = None,
+            exclude: Optional[Paths] = None):
+    """Converts a resolved subschema. Identical subschemas with the same
+    name, requirement and selected paths share a single parameters
+    instance.
+    """
+    # The conversion may be deferred: the reference and the document it
+    # is found in are taken now.
+    base = resolver.base
+    if ref is not None:
+        ref = resolver.absolute(ref)
+    filters = {
+        key: paths for key, paths in (
+            ('include', include), ('exclude', exclude)) if paths
+    }
+    if filters and 'definitions' not in field.allowed:
+        raise ValueError(f'Property {name!r} has no properties to select.')
+
+    def compile():
+        with resolver.resolving(ref, base):
+            if 'definitions' in field.allowed:
+                return field.from_json_field(
+                    name, required, definition, resolver=resolver,
+                    **filters)
+            return field.from_json_field(name, required, definition)
+
+    if (collector := instrumentation.active.get()) is not None:
+        compile = partial(
+            collector.call, 'convert', field.__name__, compile)
+
+    key = (field, name, required, resolver.schema_key(definition), base,
+           include, exclude)
+    if resolver.lazy and 'definitions' in field.allowed:
+        return resolver.compiled(key, lambda: LazyParameters(
+            name, required, compile, resolver.lock))
+    return resolver.compiled(key, compile)
 
 
 string_formats = {
@@ -35,6 +127,7 @@ class StringParameters(JSONFieldParameters):
     }
 
     def __init__(self, type, name, required, validators, attributes, **kwargs):
+        attributes = dict(attributes)
         self.format = attributes.pop('format', 'default')
         super().__init__(
             type, name, required, validators, attributes, **kwargs)
@@ -43,7 +136,7 @@ class StringParameters(JSONFieldParameters):
         if self.factory is not None:
             return self.factory
         if 'choices' in self.attributes:
-            return wtforms.fields.SelectField
+            return EnumSelectField
         return string_formats[self.format]
 
     @classmethod
@@ -58,11 +151,9 @@ class StringParameters(JSONFieldParameters):
         if 'default' in available:
             attributes['default'] = params.get('default')
         if 'pattern' in available:
-            validators.append(wtforms.validators.Regexp(
-                re.compile(params['pattern'])
-            ))
+            validators.append(pattern_cache.regexp(params['pattern']))
         if 'enum' in available:
-            attributes['choices'] = [(v, v) for v in params['enum']]
+            attributes['choices'] = shared_choices(params['enum'])
         if 'format' in available:
             format = attributes['format'] = params['format']
             if format not in string_formats:
@@ -101,22 +192,13 @@ class NumberParameters(JSONFieldParameters):
         if self.factory is not None:
             return self.factory
         if 'choices' in self.attributes:
-            return wtforms.fields.SelectField
+            return EnumSelectField
         if self.type == 'integer':
             return wtforms.fields.IntegerField
         return wtforms.fields.FloatField
 
-    def get_options(self):
-        """Override to use InputRequired instead of DataRequired
-        """
-        return {
-            'label': self.label,
-            'description': self.description,
-            'validators': [
-                wtforms.validators.InputRequired() if self.required else
-                NotRequired(), *self.validators
-            ], **self.attributes
-        }
+    # InputRequired instead of DataRequired, to accept 0.
+    required_validator = wtforms.validators.InputRequired()
 
     @classmethod
     def extract(cls, params: dict, available: set):
@@ -133,7 +215,7 @@ class NumberParameters(JSONFieldParameters):
                 exclusive_max=params.get('exclusiveMaximum', None)
             ))
         if 'enum' in available:
-            attributes['choices'] = [(v, v) for v in params['enum']]
+            attributes['choices'] = shared_choices(params['enum'])
         return validators, attributes
 
 
@@ -162,7 +244,7 @@ class EnumParameters(JSONFieldParameters):
     def extract(cls, params: dict, available: set):
         validators = []
         attributes = {
-            'choices': [(v, v) for v in params['enum']]
+            'choices': shared_choices(params['enum'])
         }
         if 'default' in available:
             attributes['default'] = params['default']
@@ -171,7 +253,7 @@ class EnumParameters(JSONFieldParameters):
     def get_factory(self):
         if self.factory is not None:
             return self.factory
-        return wtforms.fields.SelectField
+        return EnumSelectField
 
     @classmethod
     def from_json_field(cls, name: str, required: bool, params: dict):
@@ -195,18 +277,25 @@ class EnumParameters(JSONFieldParameters):
 class ArrayParameters(JSONFieldParameters):
 
     supported = {'array'}
-    allowed = {'items', 'minItems', 'maxItems', 'default', 'definitions'}
+    allowed = {
+        'items', 'minItems', 'maxItems', 'default', 'definitions', '$defs'
+    }
     subfield: Optional[JSONFieldParameters] = None
+    compact: bool = False
 
-    def __init__(self, *args, subfield=None, **kwargs):
-        super().__init__(*args, **kwargs)
+    def __init__(self, type, name, required, validators, attributes,
+                 subfield=None, compact=False, **kwargs):
+        if isinstance(subfield, EnumParameters):
+            attributes = {
+                **attributes, 'choices': subfield.attributes['choices']}
+        super().__init__(
+            type, name, required, validators, attributes, **kwargs)
         self.subfield = subfield
+        self.compact = compact
 
     def get_factory(self):
         if self.factory is not None:
             return self.factory
-        if isinstance(self.subfield, EnumParameters):
-            self.attributes['choices'] = self.subfield.attributes['choices']
         if 'choices' in self.attributes:
             return MultiCheckboxField
         if isinstance(self.subfield, StringParameters):
@@ -217,8 +306,30 @@ class ArrayParameters(JSONFieldParameters):
         elif self.subfield is None:
             raise NotImplementedError(
                 "Unsupported array type : 'items' attribute required.")
+        if self.compact and not isinstance(self.subfield, LazyParameters):
+            unbound = self.subfield()
+            if ScalarListField.item_kind(unbound) is not None:
+                return partial(ScalarListField, unbound)
         return partial(wtforms.fields.FieldList, self.subfield())
 
+    def project(self, include: Optional[Iterable] = None,
+                exclude: Optional[Iterable] = None) -> 'ArrayParameters':
+        """Same parameters, with the properties of the items projected.
+        """
+        if (project := getattr(self.subfield, 'project', None)) is None:
+            raise ValueError(
+                f'Property {self.name!r} has no properties to select.')
+        view = copy.copy(self)
+        view.subfield = project(include, exclude)
+        return view
+
+    def declare(self):
+        factory = self.field_factory
+        if isinstance(factory, partial) and factory.func in (
+                wtforms.fields.FieldList, ScalarListField):
+            factory = partial(factory.func, self.subfield.declare())
+        return self.tag(factory(**self.options))
+
     @classmethod
     def extract(cls, params: dict, available: set):
         attributes = {}
@@ -231,27 +342,33 @@ class ArrayParameters(JSONFieldParameters):
         return [], attributes
 
     @classmethod
-    def from_json_field(cls, name: str, required: bool, params: dict):
+    def from_json_field(cls, name: str, required: bool, params: dict,
+                        resolver: Optional[Resolver] = None,
+                        include: Optional[Paths] = None,
+                        exclude: Optional[Paths] = None):
+        """Paths to `include` or `exclude` select the properties of
+        the items.
+        """
         available = set(params.keys())
         if illegal := ((available - cls.ignore) - cls.allowed):
             raise NotImplementedError(
                 f'Unsupported attributes for array type: {illegal}')
 
+        if resolver is None:
+            resolver = Resolver(params)
         validators, attributes = cls.extract(params, available)
         if 'items' in available and (items := params['items']):
             if ref := items.get('$ref'):
-                definitions = params.get('definitions')
-                if not definitions:
-                    raise NotImplementedError('Missing definitions.')
-                items = definitions[ref.split('/')[-1]]
+                items = resolver.resolve(ref)
 
             if 'enum' in items:
                 subtype = 'enum'
             else:
                 subtype = items['type']
 
-            subfield = converter.lookup(subtype).from_json_field(
-                name, False, items)
+            subfield = convert(
+                converter.lookup(subtype), name, False, items,
+                resolver, ref=ref, include=include, exclude=exclude)
         else:
             subfield = None
         return cls(
@@ -261,6 +378,7 @@ class ArrayParameters(JSONFieldParameters):
             validators,
             attributes,
             subfield=subfield,
+            compact=resolver.compact,
             label=params.get('title'),
             description=params.get('description')
         )
@@ -273,29 +391,103 @@ class ObjectParameters(JSONFieldParameters):
         '$id', 'id', '$schema', '$comment'
     }
     supported = {'object'}
-    allowed = {'required', 'properties', 'definitions'}
+    allowed = {'required', 'properties', 'definitions', '$defs'}
     fields: Dict[str, JSONFieldParameters]
     formclass: ClassVar[Type[wtforms.form.BaseForm]] = wtforms.form.BaseForm
+    read_only = ('attributes', 'fields')
+    computed = JSONFieldParameters.computed + ('projections',)
 
     def __init__(self, fields, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields = fields
+        self.fields = MappingProxyType(dict(fields))
+
+    @cached_property
+    def projections(self) -> Dict[Tuple, 'ObjectParameters']:
+        return {}
+
+    def project(self, include: Optional[Iterable] = None,
+                exclude: Optional[Iterable] = None) -> 'ObjectParameters':
+        """View of the parameters restricted to the selected properties,
+        as `include` and `exclude` select them on conversion. The view
+        shares the parameters of the fields, and is memoized.
+        """
+        if include is None and exclude is None:
+            return self
+        # Read once: iterators would be used up by the key.
+        include = None if include is None else tuple(include)
+        exclude = None if exclude is None else tuple(exclude)
+        key = (
+            None if include is None else frozenset(include),
+            None if exclude is None else frozenset(exclude),
+        )
+        if (view := self.projections.get(key)) is not None:
+            return view
+
+        if include is not None:
+            include = selection(include, self.fields)
+        if exclude is not None:
+            exclude = selection(exclude, self.fields)
+        fields = {}
+        for name, field in self.fields.items():
+            if include is not None and name not in include:
+                continue
+            if exclude is not None and name in exclude and \
+                    exclude[name] is None:
+                continue
+            nested_include = None if include is None else include[name]
+            nested_exclude = None if exclude is None else exclude.get(name)
+            if nested_include or nested_exclude:
+                project = getattr(field, 'project', None)
+                if project is None:
+                    raise ValueError(
+                        f'Property {name!r} has no properties to select.')
+                field = project(nested_include, nested_exclude)
+            fields[name] = field
+        view = copy.copy(self)
+        view.fields = MappingProxyType(fields)
+        # Concurrent projections are alike: the first one is kept.
+        return self.projections.setdefault(key, view)
 
     def get_factory(self):
         if self.factory is not None:
             return self.factory
-        return GenericFormFactory(self.fields, self.formclass)
+        return GenericFormFactory.from_fields(self.fields, self.formclass)
 
     def get_options(self):
         # Object-types do not need root validators.
         # Validation is handled at field level.
         return self.attributes
 
+    def declare(self):
+        if self.factory is not None:
+            return self()
+        return self.tag(wtforms.fields.FormField(
+            self.as_form_class(), **self.options))
+
+    def as_form_class(
+            self, name: Optional[str] = None,
+            base: Type[wtforms.form.Form] = wtforms.form.Form
+    ) -> Type[wtforms.form.Form]:
+        """Compile the fields into a declarative `wtforms.Form` subclass.
+        Instantiating the returned class runs no schema logic at all.
+        """
+        attributes = {}
+        for field_name, field in self.fields.items():
+            if field_name.startswith('_') or hasattr(base, field_name):
+                raise NotImplementedError(
+                    f'Property {field_name!r} can not be declared '
+                    f'on {base}.')
+            attributes[field_name] = field.declare()
+        if name is None:
+            name = class_name(self.label or 'Schema')
+        return type(name, (base,), attributes)
+
     @classmethod
     def from_json_field(
             cls, name: str, required: bool, params: dict,
             include: Optional[Iterable] = None,
-            exclude: Optional[Iterable] = None
+            exclude: Optional[Iterable] = None,
+            resolver: Optional[Resolver] = None
     ):
         available = set(params.keys())
         if illegal := ((available - cls.ignore) - cls.allowed):
@@ -306,35 +498,42 @@ class ObjectParameters(JSONFieldParameters):
         if properties is None:
             raise NotImplementedError("Missing properties.")
 
-        if include is None:
-            include = set(properties.keys())
-        else:
-            include = set(include)  # idempotent
+        # Property names, dotted paths or JSON pointers: the properties
+        # outside the selection are not converted.
+        if include is not None:
+            include = selection(include, properties)
         if exclude is not None:
-            include = include - set(exclude)
+            exclude = selection(exclude, properties)
 
+        if resolver is None:
+            resolver = Resolver(params)
         requirements = params.get('required', [])
         fields = {}
-        definitions = params.get('definitions', {})
         for property_name, definition in properties.items():
             if 'allOf' in definition and len(definition['allOf']) == 1:
                 definition = definition['allOf'][0]
-            if property_name not in include:
+            if include is not None and property_name not in include:
+                continue
+            if exclude is not None and property_name in exclude and \
+                    exclude[property_name] is None:
                 continue
             if ref := definition.get('$ref'):
-                if not definitions:
-                    raise NotImplementedError('Missing definitions.')
-                definition = definitions[ref.split('/')[-1]]
+                definition = resolver.resolve(ref)
 
             if 'enum' in definition and 'type' not in definition:
-                definition['type'] = 'enum'
-            if type_ := definition.get('type', None):
-                field = converter.lookup(type_)
-                if 'definitions' in field.allowed:
-                    definition['definitions'] = definitions
-                fields[property_name] = field.from_json_field(
+                type_ = 'enum'
+            else:
+                type_ = definition.get('type', None)
+            if type_:
+                fields[property_name] = convert(
+                    converter.lookup(type_),
                     property_name,
-                    property_name in requirements, definition
+                    property_name in requirements, definition,
+                    resolver, ref=ref,
+                    include=None if include is None else include[
+                        property_name],
+                    exclude=None if exclude is None else exclude.get(
+                        property_name)
                 )
             else:
                 raise NotImplementedError(
@@ -0,0 +1,81 @@
+import json
+import typing as t
+import wtforms.fields
+from functools import partial
+from jsonschema_wtforms.converter import JSONFieldParameters, LazyParameters
+from jsonschema_wtforms.field import (
+    ArrayParameters, BooleanParameters, ObjectParameters)
+
+
+class FormData(t.Dict[str, list]):
+    """Minimal multidict, as expected by wtforms `process`.
+    """
+
+    def getlist(self, key: str) -> list:
+        return self.get(key, [])
+
+
+def raw_value(value, boolean: bool = False):
+    """Values are submitted the way a browser would, except for booleans
+    which the `BooleanField` understands as they are. Other values are
+    submitted as their JSON text, such as `true`, `null`, lists and
+    objects given for a single value: fields expecting a number or a
+    date reject them.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return value if boolean else json.dumps(value)
+    if isinstance(value, (int, float)):
+        return str(value)
+    return json.dumps(value, default=str)
+
+
+def is_boolean(params) -> bool:
+    return isinstance(unwrap(params), BooleanParameters)
+
+
+def unwrap(params):
+    if isinstance(params, LazyParameters):
+        return params.parameters
+    return params
+
+
+def is_field_list(params: ArrayParameters) -> bool:
+    factory = params.field_factory
+    return isinstance(factory, partial) and \
+        factory.func is wtforms.fields.FieldList
+
+
+def flatten(params: JSONFieldParameters, name: str, value,
+            formdata: FormData):
+    if value is None:
+        return
+    params = unwrap(params)
+    if isinstance(params, ObjectParameters):
+        if isinstance(value, dict):
+            prefix = f'{name}-'
+            for key, subparams in params.fields.items():
+                if key in value:
+                    flatten(subparams, prefix + key, value[key], formdata)
+    elif isinstance(params, ArrayParameters) and isinstance(value, list):
+        if is_field_list(params):
+            for index, item in enumerate(value):
+                flatten(params.subfield, f'{name}-{index}', item, formdata)
+        else:
+            boolean = is_boolean(params.subfield)
+            formdata[name] = [raw_value(item, boolean) for item in value]
+    else:
+        formdata[name] = [raw_value(value, is_boolean(params))]
+
+
+def record_formdata(fields: t.Mapping[str, JSONFieldParameters],
+                    record: dict, prefix: str = '') -> FormData:
+    """Turns a JSON record into the formdata a browser would submit for
+    the given fields, so that it is processed and validated as such.
+    """
+    formdata = FormData()
+    for name, params in fields.items():
+        if name in record:
+            flatten(params, prefix + name, record[name], formdata)
+    return formdata
@@ -0,0 +1,137 @@
+import itertools
+import typing as t
+from wtforms.fields import Field, FieldList, FormField
+from wtforms.form import BaseForm
+from jsonschema_wtforms._fields import field_validators
+
+
+def separator(field: Field) -> t.Optional[str]:
+    """What the names of the subfields add to the name of the field.
+    """
+    if isinstance(field, FormField):
+        return field.separator
+    return getattr(field, '_separator', None)
+
+
+def locate(form: BaseForm, path: str
+           ) -> t.Optional[t.Tuple[str, Field, str]]:
+    """The field of the form a path goes through: its name, the field
+    and what remains of the path.
+    """
+    if not path.startswith(form._prefix):
+        return None
+    relative = path[len(form._prefix):]
+    # Property names may contain the separator: longest names first.
+    for end in range(len(relative), 0, -1):
+        field = form._fields.get(relative[:end])
+        if field is None:
+            continue
+        rest = relative[end:]
+        if not rest or (sep := separator(field)) and rest.startswith(sep):
+            return relative[:end], field, rest
+    return None
+
+
+def list_entry(field: FieldList, rest: str
+               ) -> t.Optional[t.Tuple[Field, str]]:
+    """The entry of the list a path goes to, and what remains of it.
+    """
+    index = rest[len(field._separator):]
+    digits = len(index) - len(index.lstrip('0123456789'))
+    if not digits:
+        return None
+    name = f'{field.name}{field._separator}{int(index[:digits])}'
+    for entry in field.entries:
+        if entry.name == name:
+            return entry, index[digits:]
+    return None
+
+
+class Revalidation:
+    """Processes and validates the fields of a form some paths go to,
+    leaving the others as the previous validation left them.
+    """
+
+    def __init__(self, formdata):
+        self.formdata = formdata
+        # Names of the fields done and their separator.
+        self.done: t.List[t.Tuple[str, t.Optional[str]]] = []
+        # Lists with an updated entry: their errors are put together
+        # again once all entries are done, innermost lists first.
+        self.lists: t.Dict[int, t.Tuple[int, FieldList, BaseForm, t.Any]]
+        self.lists = {}
+
+    def covered(self, path: str) -> bool:
+        return any(
+            path == name or sep is not None and path.startswith(name + sep)
+            for name, sep in self.done
+        )
+
+    def submitted(self, field: Field) -> bool:
+        if field.name in self.formdata:
+            return True
+        if (sep := separator(field)) is None:
+            return False
+        prefix = field.name + sep
+        return any(key.startswith(prefix) for key in self.formdata)
+
+    def refresh(self, field: Field, form: BaseForm, extra=(),
+                filters=None):
+        field.process(self.formdata, extra_filters=filters)
+        field.validate(form, extra)
+        self.done.append((field.name, separator(field)))
+
+    def update(self, form: BaseForm, path: str, extra_validators=None,
+               depth: int = 0):
+        if (found := locate(form, path)) is None:
+            raise KeyError(f'No field at {path!r}.')
+        name, field, rest = found
+        extra = field_validators(form, name, extra_validators)
+        if rest and isinstance(field, FormField):
+            self.update(
+                field.form, path,
+                extra if isinstance(extra, t.Mapping) else None, depth + 1)
+            return
+        if rest and isinstance(field, FieldList) and \
+                (located := list_entry(field, rest)) is not None and \
+                self.submitted(located[0]):
+            entry, rest = located
+            if rest and isinstance(entry, FormField):
+                self.update(entry.form, path, None, depth + 1)
+            else:
+                self.refresh(entry, form)
+            self.lists.setdefault(id(field), (depth, field, form, extra))
+            return
+        inline = getattr(form, f'filter_{name}', None)
+        filters = None if inline is None else [inline]
+        self.refresh(field, form, extra, filters)
+
+    def join_lists(self):
+        for _, field, form, extra in sorted(
+                self.lists.values(), key=lambda item: -item[0]):
+            field.errors = [entry.errors for entry in field.entries]
+            if not any(field.errors):
+                field.errors = []
+            field._run_validation_chain(
+                form, itertools.chain(field.validators, extra))
+
+
+def revalidate(form: BaseForm, formdata, paths: t.Iterable[str],
+               extra_validators: t.Optional[t.Mapping] = None) -> bool:
+    """Processes the fields at the given paths from the formdata and
+    validates them again, nested objects and list entries included.
+    The other fields keep the data and errors of the previous
+    validation: the cost is that of the changed fields.
+
+    Paths are names of fields, as submitted: `address-city`,
+    `devices-1-serial`. A path to a list entry that does not exist, or
+    is no longer submitted, processes the whole list again.
+    Returns whether the form is valid.
+    """
+    revalidation = Revalidation(form.meta.wrap_formdata(form, formdata))
+    # Shortest first: a field done covers the paths under it.
+    for path in sorted(set(paths), key=len):
+        if not revalidation.covered(path):
+            revalidation.update(form, path, extra_validators)
+    revalidation.join_lists()
+    return not form.errors
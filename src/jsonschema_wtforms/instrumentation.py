@@ -0,0 +1,150 @@
+import threading
+import time
+import typing as t
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from wtforms.fields.core import UnboundField
+
+
+PHASES = ('convert', 'bind', 'process', 'validate', 'render')
+
+# The collector in use in the current thread or task, if any: with
+# instrumentation disabled, hooks cost a context variable lookup.
+active: ContextVar[t.Optional['Collector']] = ContextVar(
+    'active', default=None)
+
+
+class Collector:
+    """Records the time spent and the number of calls per phase and per
+    parameters type.
+
+    Times are exclusive: the time spent converting, binding, processing,
+    validating or rendering nested fields is not counted in their parent
+    object or array. Override `record` to forward the measures elsewhere.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.counts: t.Dict[t.Tuple[str, str], int] = defaultdict(int)
+        self.times: t.Dict[t.Tuple[str, str], float] = defaultdict(float)
+
+    def record(self, phase: str, kind: str, elapsed: float):
+        with self.lock:
+            self.counts[phase, kind] += 1
+            self.times[phase, kind] += elapsed
+
+    def call(self, phase: str, kind: str, func: t.Callable, *args, **kwargs):
+        try:
+            stack = self.local.stack
+        except AttributeError:
+            stack = self.local.stack = []
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self.record(phase, kind, elapsed - nested)
+
+    def bind(self, kind: str, bind: t.Callable, *args, **kwargs):
+        """Binds a field, which then reports its processing, validation
+        and rendering.
+        """
+        field = self.call('bind', kind, bind, *args, **kwargs)
+        field.process = partial_call(self, 'process', kind, field.process)
+        field.validate = partial_call(
+            self, 'validate', kind, field.validate)
+        field.widget = InstrumentedWidget(self, kind, field.widget)
+        return field
+
+    def reset(self):
+        with self.lock:
+            self.counts.clear()
+            self.times.clear()
+
+    def as_dict(self) -> t.Dict[str, t.Dict[str, dict]]:
+        """`{phase: {kind: {'count': int, 'time': seconds}}}`.
+        """
+        with self.lock:
+            result = {}
+            for (phase, kind), count in sorted(self.counts.items()):
+                result.setdefault(phase, {})[kind] = {
+                    'count': count,
+                    'time': self.times[phase, kind]
+                }
+            return result
+
+    def totals(self) -> t.Dict[str, float]:
+        """Time spent per phase.
+        """
+        with self.lock:
+            result = dict.fromkeys(PHASES, 0.0)
+            for (phase, _), elapsed in self.times.items():
+                result[phase] = result.get(phase, 0.0) + elapsed
+            return result
+
+
+def partial_call(collector: Collector, phase: str, kind: str,
+                 func: t.Callable) -> t.Callable:
+    def call(*args, **kwargs):
+        return collector.call(phase, kind, func, *args, **kwargs)
+    return call
+
+
+class InstrumentedWidget:
+    """Times the rendering and otherwise stands for the wrapped widget.
+    """
+
+    def __init__(self, collector: Collector, kind: str, widget):
+        self.collector = collector
+        self.kind = kind
+        self.widget = widget
+
+    def __call__(self, *args, **kwargs):
+        return self.collector.call(
+            'render', self.kind, self.widget, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.widget, name)
+
+
+class UnboundSchemaField(UnboundField):
+    """Unbound field knowing the parameters type it was made from.
+    """
+    kind: str
+
+    @classmethod
+    def from_unbound(cls, unbound: UnboundField, kind: str):
+        field = object.__new__(cls)
+        field.__dict__.update(vars(unbound))
+        field.kind = kind
+        return field
+
+    def bind(self, *args, **kwargs):
+        if (collector := active.get()) is None:
+            return super().bind(*args, **kwargs)
+        return collector.bind(self.kind, super().bind, *args, **kwargs)
+
+
+@contextmanager
+def instrument(collector: t.Optional[Collector] = None
+               ) -> t.Iterator[Collector]:
+    """Records the schema conversions and the fields bound in the block,
+    along with the processing, validation and rendering of these fields,
+    even after the block.
+
+    Only the current thread, or asyncio task, is instrumented: blocks in
+    other threads record into their own collectors.
+    """
+    if collector is None:
+        collector = Collector()
+    token = active.set(collector)
+    try:
+        yield collector
+    finally:
+        active.reset(token)
@@ -0,0 +1,169 @@
+import re
+import typing as t
+from wtforms.validators import Regexp
+from jsonschema_wtforms.cache import SchemaCache
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+
+ALPHABET = frozenset(map(chr, range(256)))
+CATEGORIES = {
+    getattr(sre_parse, name): frozenset(
+        filter(re.compile(regex).match, ALPHABET))
+    for name, regex in (
+        ('CATEGORY_DIGIT', r'\d'), ('CATEGORY_NOT_DIGIT', r'\D'),
+        ('CATEGORY_SPACE', r'\s'), ('CATEGORY_NOT_SPACE', r'\S'),
+        ('CATEGORY_WORD', r'\w'), ('CATEGORY_NOT_WORD', r'\W'),
+    )
+}
+REPEATS = (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT)
+# Atomic groups and possessive repeats (Python 3.11+) never backtrack.
+ATOMIC = tuple(filter(None, (
+    getattr(sre_parse, 'ATOMIC_GROUP', None),
+    getattr(sre_parse, 'POSSESSIVE_REPEAT', None),
+)))
+ZERO_WIDTH = (sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT)
+
+
+class UnsafePattern(re.error):
+    """Pattern that may take exponential time to fail a match.
+    """
+
+
+def charset(items) -> t.FrozenSet[str]:
+    chars = set()
+    negate = False
+    for op, av in items:
+        if op == sre_parse.NEGATE:
+            negate = True
+        elif op == sre_parse.LITERAL:
+            chars.add(chr(av))
+        elif op == sre_parse.RANGE:
+            chars.update(map(chr, range(av[0], min(av[1], 255) + 1)))
+        elif op == sre_parse.CATEGORY:
+            chars |= CATEGORIES.get(av, ALPHABET)
+        else:
+            chars |= ALPHABET
+    return ALPHABET - chars if negate else frozenset(chars)
+
+
+def first(items) -> t.Tuple[t.FrozenSet[str], bool]:
+    """The characters (out of Latin-1) a match can start with, and
+    whether the match can be empty.
+    """
+    chars = frozenset()
+    for op, av in items:
+        if op in ZERO_WIDTH:
+            continue
+        if op == sre_parse.LITERAL:
+            return chars | {chr(av)}, False
+        if op == sre_parse.NOT_LITERAL:
+            return chars | (ALPHABET - {chr(av)}), False
+        if op == sre_parse.IN:
+            return chars | charset(av), False
+        if op == sre_parse.SUBPATTERN:
+            subchars, empty = first(av[-1])
+        elif op == sre_parse.BRANCH:
+            subchars, empty = frozenset(), False
+            for branch in av[1]:
+                branch_chars, branch_empty = first(branch)
+                subchars |= branch_chars
+                empty = empty or branch_empty
+        elif op in REPEATS or op in ATOMIC and isinstance(av, tuple):
+            subchars, empty = first(av[2])
+            empty = empty or av[0] == 0
+        elif op in ATOMIC:
+            subchars, empty = first(av)
+        else:
+            # Any character, back references, conditionals.
+            return chars | ALPHABET, False
+        chars |= subchars
+        if not empty:
+            return chars, False
+    return chars, True
+
+
+def hazard(items, repeated: bool = False,
+           follow: t.FrozenSet[str] = frozenset()) -> t.Optional[str]:
+    """Looks for the constructs known to backtrack exponentially when
+    repeated: nested quantifiers whose inner rounds can match what
+    comes after them, as in `(a+)+` or `(.*a){20}` but not `(a+b)+`,
+    and alternatives matching alike, as in `(a|aa)+` or `(a|a?)+`.
+
+    `follow` holds the characters that can come after the items.
+    """
+    for index, (op, av) in enumerate(items):
+        rest, empty = first(items[index + 1:])
+        after = rest | follow if empty else rest
+        if op in REPEATS:
+            _, high, sub = av
+            unbounded = high == sre_parse.MAXREPEAT
+            # Text matched by a round could be matched by what comes
+            # next instead, the next outer round included.
+            if unbounded and repeated and first(sub)[0] & after:
+                return 'nested quantifiers'
+            many = unbounded or high >= 10
+            if many:
+                # Another round can follow a round.
+                after = after | first(sub)[0]
+            if reason := hazard(sub, repeated or many, after):
+                return reason
+        elif op == sre_parse.BRANCH:
+            branches = av[1]
+            if repeated:
+                seen = frozenset()
+                starts = [first(branch) for branch in branches]
+                optional = any(empty for _, empty in starts)
+                for chars, _ in starts:
+                    if seen & chars or optional and chars & after:
+                        return 'overlapping alternatives'
+                    seen |= chars
+            for branch in branches:
+                if reason := hazard(branch, repeated, after):
+                    return reason
+        elif op == sre_parse.SUBPATTERN:
+            if reason := hazard(av[-1], repeated, after):
+                return reason
+        elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            if reason := hazard(av[1], repeated):
+                return reason
+        elif op in ATOMIC:
+            if reason := hazard(av[2] if isinstance(av, tuple) else av):
+                return reason
+    return None
+
+
+def catastrophic(pattern: str) -> t.Optional[str]:
+    """Why the pattern may backtrack catastrophically, or None.
+    This is a heuristic: it errs on the side of reporting.
+    """
+    return hazard(sre_parse.parse(pattern))
+
+
+class PatternCache(SchemaCache):
+    """Bounded LRU cache of `Regexp` validators, keyed by pattern.
+    Identical patterns are compiled once and share a validator.
+    """
+
+    def __init__(self, maxsize: int = 512,
+                 reject_catastrophic: bool = False):
+        super().__init__(maxsize)
+        self.reject_catastrophic = reject_catastrophic
+
+    def regexp(self, pattern: str) -> Regexp:
+        validator, reason = self.get(pattern, lambda: (
+            Regexp(re.compile(pattern)), catastrophic(pattern)))
+        if reason is not None and self.reject_catastrophic:
+            raise UnsafePattern(
+                f'Catastrophic backtracking ({reason}): {pattern!r}',
+                pattern=pattern)
+        return validator
+
+    def compile(self, pattern: str) -> t.Pattern:
+        return self.regexp(pattern).regex
+
+
+pattern_cache = PatternCache()
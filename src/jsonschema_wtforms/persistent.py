@@ -0,0 +1,129 @@
+import gc
+import os
+import pickle
+import platform
+import tempfile
+import typing as t
+import wtforms
+from jsonschema_wtforms import JSONSchema, compile_schema
+from jsonschema_wtforms.cache import SchemaCache, schema_cache
+from jsonschema_wtforms.converter import JSONFieldParameters
+from jsonschema_wtforms.field import ArrayParameters, ObjectParameters
+
+
+# Bumped whenever the content of the cache file changes.
+FORMAT = 1
+
+
+def library_version() -> str:
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:  # pragma: no cover
+        return 'unknown'
+    try:
+        return version('jsonschema_wtforms')
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+def cache_version() -> t.Tuple:
+    """What a cache file is valid for: files written by other versions
+    of the library, of wtforms or of Python are ignored.
+    """
+    return (
+        FORMAT,
+        library_version(),
+        wtforms.__version__,
+        platform.python_implementation(),
+        platform.python_version(),
+    )
+
+
+def dump_cache(path: str, cache: SchemaCache = schema_cache) -> int:
+    """Write the compiled schemas of the cache to a file, replaced
+    atomically. Lazy trees, converting on demand, cannot be written and
+    are left out. Returns the number of schemas written.
+    """
+    entries = {}
+    for key, value in cache.items():
+        if isinstance(value, ObjectParameters):
+            try:
+                entries[key] = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            except (TypeError, AttributeError, pickle.PicklingError):
+                continue
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as stream:
+            pickle.dump(cache_version(), stream, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(entries, stream, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return len(entries)
+
+
+def load_cache(path: str, cache: SchemaCache = schema_cache) -> int:
+    """Fill the cache with the schemas of a file. Missing, unreadable or
+    outdated files are ignored. Returns the number of schemas loaded.
+
+    Cache files are pickles: only load the ones your deployment wrote.
+    """
+    try:
+        with open(path, 'rb') as stream:
+            if pickle.load(stream) != cache_version():
+                return 0
+            entries = {
+                key: pickle.loads(value)
+                for key, value in pickle.load(stream).items()
+            }
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+            ImportError, TypeError, ValueError):
+        return 0
+    for key, value in entries.items():
+        cache.put(key, value)
+    return len(entries)
+
+
+def prime(params: JSONFieldParameters):
+    """Compute what the parameters otherwise compute on first use,
+    down the whole tree.
+    """
+    params.unbound
+    if isinstance(params, ObjectParameters):
+        if params.factory is None:
+            params.field_factory.fields.unbound
+        for field in params.fields.values():
+            prime(field)
+    elif isinstance(params, ArrayParameters) and \
+            isinstance(params.subfield, JSONFieldParameters):
+        prime(params.subfield)
+
+
+def warm(schemas: t.Iterable[JSONSchema], path: t.Optional[str] = None,
+         cache: SchemaCache = schema_cache, freeze: bool = True,
+         **options) -> t.List[ObjectParameters]:
+    """Compile the schemas before forking the workers, reading and
+    updating the cache file at `path` if given.
+
+    The compiled trees are primed, so that workers never write into
+    them, and with `freeze` moved out of the garbage collector's reach:
+    the collector would otherwise touch every object, and preforked
+    workers would lose the pages they share copy-on-write. `options`
+    are given to `compile_schema`.
+    """
+    if path is not None:
+        load_cache(path, cache)
+    misses = cache.misses
+    roots = [
+        compile_schema(schema, cache=cache, **options) for schema in schemas
+    ]
+    if path is not None and cache.misses != misses:
+        dump_cache(path, cache)
+    for root in roots:
+        prime(root)
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return roots
@@ -0,0 +1,213 @@
+import json
+import threading
+import typing as t
+from collections import defaultdict
+from pathlib import Path
+from jsonschema_wtforms import Form, JSONSchema
+from jsonschema_wtforms.field import ObjectParameters
+from jsonschema_wtforms.resolver import (
+    Resolver, UnresolvableReference, split)
+
+
+Stamp = t.Tuple[int, int]
+
+
+class SchemaRegistry:
+    """Schemas referencing each other, loaded from a directory.
+
+    Schemas are indexed by `$id` and by file URI: a `$ref` to another
+    schema is resolved against the `$id` of the referring one, or its
+    file. Compiled schemas are kept, along with the schemas each of
+    them was compiled from. `reload` reads the files changed since the
+    last load, and recompiles the schemas depending on them only.
+    """
+
+    def __init__(self, directory: t.Optional[str] = None,
+                 pattern: str = '*.json'):
+        self.directory = directory
+        self.pattern = pattern
+        self.lock = threading.RLock()
+        self.schemas: t.Dict[str, JSONSchema] = {}
+        # Any URI of a schema: its `$id`, or its file URI.
+        self.aliases: t.Dict[str, str] = {}
+        # File path: (URI of the schema, modification stamp).
+        self.files: t.Dict[Path, t.Tuple[str, Stamp]] = {}
+        # Schema URI: URIs of the compiled schemas using it.
+        self.dependents: t.Dict[str, t.Set[str]] = defaultdict(set)
+        self.compiled: t.Dict[t.Hashable, ObjectParameters] = {}
+        if directory is not None:
+            self.reload()
+
+    def canonical(self, uri: str) -> str:
+        try:
+            return self.aliases[split(uri)[0]]
+        except KeyError:
+            raise UnresolvableReference(f'Unknown schema: {uri}') from None
+
+    def add(self, schema: JSONSchema, uri: t.Optional[str] = None) -> str:
+        """Register a schema under its `$id` and the given URI, if any.
+        Returns the URI it is known by.
+        """
+        identifier = schema.get('$id')
+        if isinstance(identifier, str) and split(identifier)[0]:
+            canonical = split(identifier)[0]
+        elif uri is not None:
+            canonical = split(uri)[0]
+        else:
+            raise ValueError('A schema needs an `$id` or an URI.')
+        with self.lock:
+            self.schemas[canonical] = schema
+            self.aliases[canonical] = canonical
+            if uri is not None:
+                self.aliases[split(uri)[0]] = canonical
+        return canonical
+
+    def remove(self, uri: str):
+        with self.lock:
+            canonical = self.canonical(uri)
+            del self.schemas[canonical]
+            for alias, target in list(self.aliases.items()):
+                if target == canonical:
+                    del self.aliases[alias]
+
+    def document(self, uri: str, dependent: t.Optional[str] = None
+                 ) -> t.Tuple[str, JSONSchema]:
+        """The schema to resolve references into, and its URI. The
+        `dependent` schema is then recompiled with it.
+        """
+        with self.lock:
+            canonical = self.canonical(uri)
+            if dependent is not None:
+                self.dependents[canonical].add(
+                    self.aliases.get(dependent, dependent))
+            return canonical, self.schemas[canonical]
+
+    def compile(self, uri: str,
+                include: t.Optional[t.Iterable[str]] = None,
+                exclude: t.Optional[t.Iterable[str]] = None,
+                lazy: bool = False, compact: bool = False
+                ) -> ObjectParameters:
+        canonical = self.canonical(uri)
+        # Read once: iterators would be used up by the key.
+        include = None if include is None else tuple(include)
+        exclude = None if exclude is None else tuple(exclude)
+        key = (
+            canonical,
+            None if include is None else frozenset(include),
+            None if exclude is None else frozenset(exclude),
+            lazy, compact
+        )
+        with self.lock:
+            if (root := self.compiled.get(key)) is not None:
+                return root
+            schema = self.schemas[canonical]
+            root = self.compiled[key] = ObjectParameters.from_json_field(
+                None, False, schema, include=include, exclude=exclude,
+                resolver=Resolver(
+                    schema, lazy=lazy, compact=compact,
+                    registry=self, uri=canonical)
+            )
+            return root
+
+    def fields(self, uri: str, **options):
+        return self.compile(uri, **options).fields
+
+    def form(self, uri: str, **options) -> Form:
+        return Form(self.fields(uri, **options))
+
+    def affected(self, uris: t.Iterable[str]) -> t.Set[str]:
+        """The given schemas and the compiled schemas using them. The
+        resolver of a compilation reports every schema it reads, those
+        referenced indirectly included.
+        """
+        affected = set(uris)
+        for uri in tuple(affected):
+            affected |= self.dependents.get(uri, set())
+        return affected
+
+    def invalidate(self, uris: t.Iterable[str]) -> t.List[t.Hashable]:
+        """Drop the compiled schemas depending on the given ones.
+        Returns the keys of the dropped compilations.
+        """
+        with self.lock:
+            affected = self.affected(uris)
+            for dependents in self.dependents.values():
+                dependents -= affected
+            dropped = [key for key in self.compiled if key[0] in affected]
+            for key in dropped:
+                del self.compiled[key]
+            return dropped
+
+    def scan(self) -> t.Dict[Path, Stamp]:
+        stamps = {}
+        for path in sorted(Path(self.directory).glob(self.pattern)):
+            if path.is_file():
+                stat = path.stat()
+                stamps[path.resolve()] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+
+    def snapshot(self) -> t.Tuple:
+        return (
+            dict(self.schemas), dict(self.aliases), dict(self.files),
+            {uri: set(uris) for uri, uris in self.dependents.items()},
+            dict(self.compiled),
+        )
+
+    def restore(self, state: t.Tuple):
+        (self.schemas, self.aliases, self.files, dependents,
+         self.compiled) = state
+        self.dependents = defaultdict(set, dependents)
+
+    def reload(self) -> t.Set[str]:
+        """Read the schema files added, changed or removed since the
+        last call, and recompile what was compiled from them.
+        Returns the URIs of the recompiled schemas.
+
+        A broken file, or a schema that no longer compiles, leaves the
+        registry as it was: the error is raised on every reload until
+        it is fixed.
+        """
+        if self.directory is None:
+            return set()
+        with self.lock:
+            stamps = self.scan()
+            changed = {
+                path: stamp for path, stamp in stamps.items()
+                if self.files.get(path, (None, None))[1] != stamp
+            }
+            removed = [path for path in self.files if path not in stamps]
+            # Everything is read before the registry is modified: a
+            # broken file leaves it as it was.
+            schemas = {}
+            for path in changed:
+                with path.open(encoding='utf-8') as stream:
+                    schemas[path] = json.load(stream)
+
+            # The schemas recompiled may no longer resolve, as when a
+            # file they reference was removed: the registry is then
+            # restored as it was.
+            state = self.snapshot()
+            try:
+                outdated = set()
+                for path in (*removed, *changed):
+                    if path in self.files:
+                        uri = self.files.pop(path)[0]
+                        outdated.add(uri)
+                        if uri in self.schemas:
+                            self.remove(uri)
+                for path, schema in schemas.items():
+                    uri = self.add(schema, path.as_uri())
+                    self.files[path] = (uri, changed[path])
+                    outdated.add(uri)
+
+                dropped = self.invalidate(outdated)
+                recompiled = set()
+                for uri, include, exclude, lazy, compact in dropped:
+                    if uri in self.schemas:
+                        self.compile(
+                            uri, include, exclude, lazy=lazy, compact=compact)
+                        recompiled.add(uri)
+                return recompiled
+            except Exception:
+                self.restore(state)
+                raise
@@ -0,0 +1,242 @@
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from urllib.parse import unquote, urljoin
+from jsonschema_wtforms.cache import fingerprint
+
+
+class UnresolvableReference(NotImplementedError):
+    pass
+
+
+class CircularReference(UnresolvableReference):
+    pass
+
+
+def escape(token: str) -> str:
+    return token.replace('~', '~0').replace('/', '~1')
+
+
+def unescape(token: str) -> str:
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def split(uri: str) -> Tuple[str, str]:
+    """The document and the pointer of a reference.
+    """
+    document, _, fragment = uri.partition('#')
+    return document, f'#{fragment}'
+
+
+def join(base: str, ref: str) -> str:
+    """The reference made absolute against the URI of its document.
+    """
+    if ref.startswith('#'):
+        return base + ref
+    if not base:
+        return ref
+    return urljoin(base, ref)
+
+
+class Resolver:
+    """Resolves the local references of one root schema.
+
+    Every subschema of the root is indexed by its JSON pointer when the
+    resolver is created. A reference is looked up once, following
+    `$ref` aliases, and the target is memoized.
+
+    When `interning` is enabled, the resolver also keeps the conversion
+    results: structurally identical subschemas are converted once and
+    share their parameters. When `lazy` is enabled, nested objects and
+    arrays are only converted when first used, which allows recursive
+    schemas. When `compact` is enabled, arrays of scalar items are
+    handled by a `ScalarListField` rather than a `FieldList`.
+
+    References to other documents are looked up in the `registry`, if
+    any, and resolved against the `$id` of the root, or `uri`. The
+    references met while converting the target of a reference are
+    resolved against the document of that target.
+    """
+
+    # Values of these keywords are data, not subschemas.
+    data_keywords = frozenset(('enum', 'const', 'default', 'examples'))
+
+    root: Dict
+    index: Dict[str, object]
+
+    def __init__(self, root: Dict,
+                 interning: bool = True, lazy: bool = False,
+                 compact: bool = False, registry=None,
+                 uri: Optional[str] = None):
+        self.root = root
+        self.interning = interning
+        self.lazy = lazy
+        self.compact = compact
+        self.registry = registry
+        if uri is None:
+            uri = root.get('$id', '') if isinstance(root, dict) else ''
+            if not isinstance(uri, str):
+                uri = ''
+        self.uri = split(uri)[0]
+        # Lazy conversions happen long after the resolver creation,
+        # possibly from concurrent threads.
+        self.lock = threading.RLock()
+        self.index = self._index(root)
+        # Document URI: (URI of the document, root, index).
+        self.documents = {self.uri: (self.uri, root, self.index)}
+        self._resolved = {}
+        self._targets: Dict[str, str] = {}
+        self._resolving: List[str] = []
+        self._bases: List[str] = []
+        self._keys = {}
+        self._compiled = {}
+
+    def _index(self, root) -> Dict[str, object]:
+        index = {}
+        stack = [('#', root)]
+        while stack:
+            pointer, node = stack.pop()
+            index[pointer] = node
+            if isinstance(node, dict):
+                if isinstance(anchor := node.get('$anchor'), str):
+                    index.setdefault(f'#{anchor}', node)
+                for key, value in node.items():
+                    if key not in self.data_keywords and \
+                       isinstance(value, (dict, list)):
+                        stack.append((f'{pointer}/{escape(key)}', value))
+            elif isinstance(node, list):
+                for position, value in enumerate(node):
+                    if isinstance(value, (dict, list)):
+                        stack.append((f'{pointer}/{position}', value))
+        return index
+
+    @property
+    def base(self) -> str:
+        """URI of the document being converted.
+        """
+        return self._bases[-1] if self._bases else self.uri
+
+    def absolute(self, ref: str) -> str:
+        return join(self.base, ref)
+
+    def document(self, uri: str, ref: str) -> Tuple[str, Dict, Dict]:
+        try:
+            return self.documents[uri]
+        except KeyError:
+            pass
+        if self.registry is None:
+            raise UnresolvableReference(
+                f'Remote references are not supported: {ref}')
+        with self.lock:
+            canonical, root = self.registry.document(uri, dependent=self.uri)
+            if (document := self.documents.get(canonical)) is None:
+                document = (canonical, root, self._index(root))
+                self.documents[canonical] = document
+            self.documents[uri] = document
+        return document
+
+    def lookup(self, ref: str):
+        uri, pointer = split(self.absolute(ref))
+        _, root, index = self.document(uri, ref)
+        pointer = unquote(pointer)
+        try:
+            return index[pointer]
+        except KeyError:
+            pass
+
+        # Pointers to data (inside an `enum`, for instance) are not
+        # indexed: walk down from the closest indexed ancestor.
+        tokens = pointer[2:].split('/') if pointer != '#' else []
+        node, walked = root, '#'
+        for token in tokens:
+            walked = f'{walked}/{token}'
+            if walked in index:
+                node = index[walked]
+                continue
+            token = unescape(token)
+            try:
+                if isinstance(node, list):
+                    node = node[int(token)]
+                else:
+                    node = node[token]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise UnresolvableReference(
+                    f'Unresolvable reference: {ref}') from None
+        return node
+
+    def resolve(self, ref: str):
+        ref = self.absolute(ref)
+        try:
+            return self._resolved[ref]
+        except KeyError:
+            pass
+
+        chain = [ref]
+        target = self.lookup(ref)
+        while isinstance(target, dict) and \
+                isinstance(alias := target.get('$ref'), str):
+            # Aliases are relative to the document they are found in.
+            alias = join(split(chain[-1])[0], alias)
+            if alias in chain:
+                raise CircularReference(
+                    'Circular reference: ' + ' -> '.join((*chain, alias)))
+            chain.append(alias)
+            target = self.lookup(alias)
+
+        document = self.documents[split(chain[-1])[0]][0]
+        for alias in chain:
+            self._resolved[alias] = target
+            self._targets[alias] = document
+        return target
+
+    @contextmanager
+    def resolving(self, ref: Optional[str], base: Optional[str] = None):
+        """Marks an absolute reference as being converted, to detect
+        cycles. Meanwhile, references are resolved against the document
+        of its target, or against `base` when there is no reference.
+        """
+        if ref is None:
+            if base is None or base == self.base:
+                yield
+                return
+            self._bases.append(base)
+            try:
+                yield
+            finally:
+                self._bases.pop()
+            return
+        if base is not None:
+            ref = join(base, ref)
+        if ref in self._resolving:
+            raise CircularReference(
+                'Circular reference: ' +
+                ' -> '.join((*self._resolving, ref)))
+        self.resolve(ref)
+        self._resolving.append(ref)
+        self._bases.append(self._targets[ref])
+        try:
+            yield
+        finally:
+            self._bases.pop()
+            self._resolving.pop()
+
+    def schema_key(self, schema: Dict) -> str:
+        """Structural key of a subschema, property order included,
+        computed once per subschema.
+        """
+        try:
+            return self._keys[id(schema)][1]
+        except KeyError:
+            key = fingerprint(schema)
+            # The schema is kept alive so that its id is not reused.
+            self._keys[id(schema)] = (schema, key)
+            return key
+
+    def compiled(self, key: Hashable, compile: Callable[[], Any]):
+        if not self.interning:
+            return compile()
+        try:
+            return self._compiled[key]
+        except KeyError:
+            value = self._compiled[key] = compile()
+            return value
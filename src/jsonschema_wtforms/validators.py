@@ -1,5 +1,7 @@
+import functools
 import math
-from wtforms.validators import ValidationError
+import typing as t
+from wtforms.validators import Length, Optional, ValidationError
 
 
 class NumberRange:
@@ -51,3 +53,128 @@ class NumberRange:
                 if self.message:
                     raise ValidationError(self.message)
                 raise
+
+    def candidates(self, values: t.Sequence) -> t.List[int]:
+        """Positions of the values out of range, found in one pass.
+
+        The values are first bounded with the builtin `min` and `max`,
+        which settles the common case where all of them are in range.
+        Otherwise, the offending ones are located with NumPy when it is
+        installed, or by a scan. `None` and NaN are never out of range.
+        """
+        bounds = self.bounds()
+        if not values or bounds is None:
+            return []
+        try:
+            lowest, highest = min(values), max(values)
+        except TypeError:
+            # None among the values.
+            lowest = highest = math.nan
+        if lowest is None:
+            # A single None is not compared.
+            lowest = highest = math.nan
+        if lowest == lowest and highest == highest and \
+           not self.out_of_range(lowest, *bounds) and \
+           not self.out_of_range(highest, *bounds):
+            return []
+        if len(values) >= VECTORIZE and (np := numpy()) is not None:
+            positions = vectorized_candidates(np, values, *bounds)
+            if positions is not None:
+                return positions
+        return [
+            index for index, data in enumerate(values)
+            if data is not None and data == data and
+            self.out_of_range(data, *bounds)
+        ]
+
+    def bounds(self) -> t.Optional[t.Tuple]:
+        """`(low, low_inclusive, high, high_inclusive)`, the tightest of
+        the inclusive and exclusive bounds, or None without bounds.
+        """
+        low, low_inclusive = self.min, True
+        if self.exclusive_min is not None and (
+                low is None or self.exclusive_min >= low):
+            low, low_inclusive = self.exclusive_min, False
+        high, high_inclusive = self.max, True
+        if self.exclusive_max is not None and (
+                high is None or self.exclusive_max <= high):
+            high, high_inclusive = self.exclusive_max, False
+        if low is None and high is None:
+            return None
+        return low, low_inclusive, high, high_inclusive
+
+    @staticmethod
+    def out_of_range(data, low, low_inclusive, high, high_inclusive) -> bool:
+        if low is not None and (
+                data < low if low_inclusive else data <= low):
+            return True
+        return high is not None and (
+            data > high if high_inclusive else data >= high)
+
+
+# Below this many values, NumPy costs more than it saves.
+VECTORIZE = 64
+
+
+@functools.lru_cache(maxsize=None)
+def numpy():
+    """NumPy if it is installed, imported on first use.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def vectorized_candidates(np, values, low, low_inclusive,
+                          high, high_inclusive) -> t.Optional[t.List[int]]:
+    """NumPy flavour of `NumberRange.candidates`, or None for the values
+    it cannot compare exactly: non numbers and integers beyond the
+    float precision.
+    """
+    try:
+        array = np.asarray(values)
+    except (ValueError, OverflowError):
+        return None
+    if array.dtype.kind == 'i':
+        if array.max() > 2 ** 53 or array.min() < -2 ** 53:
+            return None
+    elif array.dtype.kind != 'f':
+        return None
+    # NaN compares false, as in `NumberRange.__call__`.
+    mask = np.zeros(array.shape, dtype=bool)
+    if low is not None:
+        mask |= array < low if low_inclusive else array <= low
+    if high is not None:
+        mask |= array > high if high_inclusive else array >= high
+    return np.flatnonzero(mask).tolist()
+
+
+def candidates(validator, values: t.Sequence,
+               raw_values: t.Optional[t.Sequence]
+               ) -> t.Optional[t.Iterable[int]]:
+    """Positions of the items the validator may reject or stop, found in
+    one pass over the items data, or None when each item has to go
+    through the validator.
+
+    `raw_values` are the submitted values, None for items not submitted.
+    """
+    if isinstance(validator, Optional):
+        if raw_values is None:
+            return range(len(values))
+        check = validator.string_check
+        return [
+            index for index, raw in enumerate(raw_values)
+            if isinstance(raw, str) and not check(raw)
+        ]
+    if isinstance(validator, NumberRange):
+        return validator.candidates(values)
+    if isinstance(validator, Length):
+        low, high = validator.min, validator.max
+        lengths = [data and len(data) or 0 for data in values]
+        return [
+            index for index, length in enumerate(lengths)
+            if length < low or high != -1 and length > high
+        ]
+    return None
@@ -3,6 +3,7 @@ import wtforms.form
 import wtforms.fields
 import wtforms.validators
 import jsonschema_wtforms.validators
+from jsonschema_wtforms._fields import EnumSelectField
 from jsonschema_wtforms.field import NumberParameters
 
 
@@ -110,7 +111,7 @@ def test_enum():
     }))
 
     assert field.required is True
-    assert field.get_factory() == wtforms.fields.SelectField
+    assert field.get_factory() == EnumSelectField
     form = wtforms.form.BaseForm({"test": field()})
     form.process(data={'test': 9})
     assert form.validate() is False
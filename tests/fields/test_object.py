@@ -2,8 +2,10 @@ import pytest
 import wtforms.form
 import wtforms.fields
 import wtforms.validators
-from jsonschema_wtforms.field import ObjectParameters
-from jsonschema_wtforms._fields import GenericFormFactory
+from jsonschema_wtforms.field import (
+    ObjectParameters, ArrayParameters, StringParameters)
+from jsonschema_wtforms._fields import (
+    GenericFormFactory, GenericFormField, FormTemplate)
 
 
 def test_object():
@@ -117,3 +119,156 @@ def test_ref_object():
     assert devices.label == 'Devices'
     assert devices.name == 'devices'
     assert not devices.required
+
+
+def test_subform_template():
+    field = ArrayParameters.from_json_field('items', True, {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "maxLength": 3},
+                "quantity": {"type": "integer"}
+            }
+        }
+    })
+    item = field.subfield
+    template = item.field_factory.fields
+    assert isinstance(template, FormTemplate)
+    assert template.fields is item.fields
+
+    calls = []
+    original = dict(template.fields)
+    template.fields = {
+        name: (lambda bind=bind: calls.append(bind) or bind())
+        for name, bind in original.items()
+    }
+
+    form = wtforms.form.BaseForm({"items": field()})
+    form.process(data={'items': [
+        {'name': f'n{i}', 'quantity': i} for i in range(500)
+    ]})
+    assert form.validate()
+    assert len(form['items'].entries) == 500
+    assert form['items'][499]['name'].name == 'items-499-name'
+    assert form.data['items'][42] == {'name': 'n42', 'quantity': 42}
+    # Each subfield was turned into an unbound field only once.
+    assert len(calls) == 2
+
+
+def test_generic_form_field_factory():
+    factory = GenericFormField.factory({
+        'name': StringParameters.from_json_field(
+            'name', True, {"type": "string"})
+    })
+    assert isinstance(factory.fields, FormTemplate)
+    assert factory.form_field is GenericFormField
+    form = wtforms.form.BaseForm({"sub": factory()})
+    form.process(data={'sub': {'name': 'test'}})
+    assert form.validate()
+    assert form.data == {'sub': {'name': 'test'}}
+
+
+NESTED = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "user.id": {"type": "integer"},
+        "address": {
+            "type": "object",
+            "properties": {
+                "city": {"type": "string"},
+                "geo": {
+                    "type": "object",
+                    "properties": {
+                        "lat": {"type": "number"},
+                        # Not convertible: only excluded, it passes.
+                        "lon": {"type": "number", "oneOf": []}
+                    }
+                }
+            }
+        },
+        "devices": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "serial": {"type": "string"},
+                    "secret": {"type": "string", "oneOf": []}
+                }
+            }
+        }
+    }
+}
+
+
+def test_nested_include_exclude():
+    def convert(**filters):
+        return ObjectParameters.from_json_field(
+            'test', True, NESTED, **filters)
+
+    with pytest.raises(NotImplementedError):
+        convert()
+
+    field = convert(exclude=['address.geo.lon', 'devices.secret'])
+    assert list(field.fields) == ['name', 'user.id', 'address', 'devices']
+    assert list(field.fields['address'].fields) == ['city', 'geo']
+    assert list(field.fields['address'].fields['geo'].fields) == ['lat']
+    assert list(field.fields['devices'].subfield.fields) == ['serial']
+
+    field = convert(include=['/address/geo/lat', '/devices/*/serial'])
+    assert list(field.fields) == ['address', 'devices']
+    assert list(field.fields['address'].fields) == ['geo']
+    assert list(field.fields['address'].fields['geo'].fields) == ['lat']
+    assert list(field.fields['devices'].subfield.fields) == ['serial']
+
+    field = convert(
+        include=['user.id', 'address', 'address.city'],
+        exclude=['address.geo'])
+    assert list(field.fields) == ['user.id', 'address']
+    assert list(field.fields['address'].fields) == ['city']
+
+    with pytest.raises(ValueError):
+        convert(include=['name.first'])
+
+    # Same subschema, other selections: not shared.
+    first = convert(include=['address.city'])
+    second = convert(include=['address.geo.lat'])
+    assert list(first.fields['address'].fields) == ['city']
+    assert list(second.fields['address'].fields) == ['geo']
+
+
+def test_projection():
+    root = ObjectParameters.from_json_field(
+        'test', True, NESTED, exclude=['address.geo.lon', 'devices.secret'])
+    assert root.project() is root
+
+    view = root.project(include=['name', 'address.geo', 'devices'])
+    assert list(view.fields) == ['name', 'address', 'devices']
+    assert view.fields['name'] is root.fields['name']
+    assert view.fields['devices'] is root.fields['devices']
+    assert list(view.fields['address'].fields) == ['geo']
+    assert view.fields['address'].fields['geo'] is \
+        root.fields['address'].fields['geo']
+    assert list(root.fields['address'].fields) == ['city', 'geo']
+    # Memoized, whatever the order of the paths.
+    assert root.project(include=['devices', 'address.geo', 'name']) is view
+    # Iterators are read once.
+    assert root.project(include=iter(['address.geo', 'devices', 'name'])) \
+        is view
+    assert list(root.project(include=iter(['name'])).fields) == ['name']
+
+    view = root.project(exclude=['/devices/*/serial', 'user.id'])
+    assert list(view.fields) == ['name', 'address', 'devices']
+    assert view.fields['address'] is root.fields['address']
+    assert view.fields['devices'].subfield.fields == {}
+    assert root.fields['devices'].subfield.fields['serial']
+
+    with pytest.raises(ValueError):
+        root.project(include=['name.first'])
+
+    form = wtforms.form.BaseForm(
+        root.project(include=['address.city']).fields)
+    form.process(data={'address': {'city': 'Paris'}})
+    assert form.validate()
+    assert form.data == {'address': {'city': 'Paris'}}
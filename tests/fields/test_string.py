@@ -3,6 +3,7 @@ import hamcrest
 import wtforms.form
 import wtforms.fields
 import wtforms.validators
+from jsonschema_wtforms._fields import EnumSelectField
 from jsonschema_wtforms.field import StringParameters
 
 
@@ -198,7 +199,7 @@ def test_enum():
     }))
 
     assert field.required is True
-    assert field.get_factory() == wtforms.fields.SelectField
+    assert field.get_factory() == EnumSelectField
     form = wtforms.form.BaseForm({"test": field()})
     form.process(data={'test': 'Dagger'})
     assert form.validate() is False
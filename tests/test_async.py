@@ -0,0 +1,146 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from wtforms.validators import StopValidation, ValidationError
+from jsonschema_wtforms import Form, compile_schema, schema_form_class
+from jsonschema_wtforms.asynchronous import validate_form
+from jsonschema_wtforms.formdata import record_formdata
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 2},
+        "age": {"type": "integer", "minimum": 0},
+        "scores": {
+            "type": "array",
+            "maxItems": 2,
+            "items": {"type": "integer", "maximum": 10}
+        },
+        "address": {
+            "type": "object",
+            "properties": {
+                "city": {"type": "string"},
+                "zip": {"type": "string", "pattern": "^[0-9]{4}$"}
+            },
+            "required": ["city"]
+        },
+        "devices": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"serial": {"type": "string", "minLength": 3}}
+            }
+        }
+    },
+    "required": ["name"]
+}
+
+RECORDS = [
+    {"name": "Jo", "age": 3, "scores": [1, 2],
+     "address": {"city": "Paris", "zip": "7500"},
+     "devices": [{"serial": "abc"}]},
+    {"name": "J", "age": -1, "scores": [1, 20, 3],
+     "address": {"zip": "75"},
+     "devices": [{"serial": "abc"}, {"serial": "a"}]},
+    {},
+]
+
+
+def bound(record, compact=False):
+    fields = compile_schema(SCHEMA, compact=compact).fields
+    form = Form(fields)
+    form.process(record_formdata(fields, record))
+    return form
+
+
+def test_same_errors():
+    for compact in (False, True):
+        for record in RECORDS:
+            expected = bound(record, compact)
+            success = expected.validate()
+            form = bound(record, compact)
+            assert asyncio.run(form.validate_async()) is success
+            assert form.errors == expected.errors
+
+
+def test_executor():
+    with ThreadPoolExecutor(4) as executor:
+        for compact in (False, True):
+            for record in RECORDS:
+                expected = bound(record, compact)
+                expected.validate()
+                form = bound(record, compact)
+                asyncio.run(form.validate_async(executor=executor))
+                assert form.errors == expected.errors
+
+
+def test_concurrent_fields():
+    # Each validator waits for the other: awaited one after the other,
+    # they would time out.
+    async def validate():
+        name, age = asyncio.Event(), asyncio.Event()
+
+        async def check_name(form, field):
+            name.set()
+            await asyncio.wait_for(age.wait(), 1)
+            raise ValidationError('Name taken.')
+
+        async def check_age(form, field):
+            age.set()
+            await asyncio.wait_for(name.wait(), 1)
+
+        form = bound(RECORDS[0])
+        success = await form.validate_async(
+            {'name': [check_name], 'age': [check_age]})
+        return success, form.errors
+
+    success, errors = asyncio.run(validate())
+    assert success is False
+    assert errors == {'name': ['Name taken.']}
+
+
+def test_nested_and_stop():
+    async def stop(form, field):
+        raise StopValidation('Unknown city.')
+
+    def never(form, field):
+        raise AssertionError('Validation was stopped.')
+
+    form = bound(RECORDS[0])
+    success = asyncio.run(form.validate_async(
+        {'address': {'city': [stop, never]}}))
+    assert success is False
+    assert form.errors == {'address': {'city': ['Unknown city.']}}
+
+
+def test_list_validators():
+    async def unique(form, field):
+        serials = [entry.data['serial'] for entry in field.entries]
+        if len(set(serials)) != len(serials):
+            raise ValidationError('Duplicate serial.')
+
+    async def short(form, field):
+        if len(field.data) > 1:
+            raise ValidationError('Too many scores.')
+
+    for compact in (False, True):
+        record = dict(RECORDS[0], devices=[{"serial": "abc"}] * 2)
+        form = bound(record, compact)
+        success = asyncio.run(form.validate_async(
+            {'devices': [unique], 'scores': [short]}))
+        assert success is False
+        assert form.errors == {
+            'devices': ['Duplicate serial.'],
+            'scores': ['Too many scores.'],
+        }
+
+
+def test_declarative_form():
+    fields = compile_schema(SCHEMA).fields
+    form_class = schema_form_class(SCHEMA)
+    for record in RECORDS:
+        expected = form_class(record_formdata(fields, record))
+        success = expected.validate()
+        form = form_class(record_formdata(fields, record))
+        assert asyncio.run(validate_form(form)) is success
+        assert form.errors == expected.errors
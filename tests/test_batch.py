@@ -0,0 +1,82 @@
+import pytest
+from jsonschema_wtforms import compile_schema
+from jsonschema_wtforms.batch import (
+    BatchValidator, Result, chunked, validate_many)
+
+
+def records(count):
+    for index in range(count):
+        if index % 3:
+            yield {'latitude': index % 90, 'longitude': 12.5}
+        else:
+            yield {'latitude': 100 + index, 'longitude': 12.5}
+
+
+def check(results, count):
+    assert [result.index for result in results] == list(range(count))
+    for result in results:
+        if result.index % 3:
+            assert result.valid
+            assert result.data == {
+                'latitude': result.index % 90, 'longitude': 12.5}
+            assert result.errors is None
+        else:
+            assert not result.valid
+            assert result.data is None
+            assert result.errors == {
+                'latitude': ['Number must be at most 90.']}
+
+
+def test_batch_validator(geo_schema):
+    validator = BatchValidator(compile_schema(geo_schema))
+    form = validator.form
+    results = list(validator(records(100)))
+    check(results, 100)
+    assert validator.form is form
+
+    assert validator.validate([1, 2], 7) == Result(
+        7, errors={None: ['Not a valid object.']})
+
+
+def test_validate_many(geo_schema):
+    check(list(validate_many(geo_schema, records(50))), 50)
+
+
+def test_validate_many_processes(geo_schema):
+    results = validate_many(
+        geo_schema, records(1000), processes=2, chunksize=64)
+    check(list(results), 1000)
+
+    with pytest.raises(ValueError):
+        list(validate_many(geo_schema, records(1), processes=2, chunksize=0))
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 2)) == []
+
+
+def test_badly_typed_values():
+    schema = {
+        "type": "object",
+        "properties": {
+            "count": {"type": "integer"},
+            "ratio": {"type": "number"},
+            "day": {"type": "string", "format": "date"},
+            "name": {"type": "string", "minLength": 2}
+        }
+    }
+    validator = BatchValidator(compile_schema(schema))
+    messages = {
+        'count': 'Not a valid integer value.',
+        'ratio': 'Not a valid float value.',
+        'day': 'Not a valid date value.',
+    }
+    for name, message in messages.items():
+        for value in ([1, 2], {'a': 1}, [], {}, True, [None]):
+            result = validator.validate({name: value})
+            assert result.errors == {name: [message]}, (name, value)
+
+    # Text fields take the JSON text.
+    assert validator.validate({'name': [1, 2]}).data['name'] == '[1, 2]'
+    assert validator.validate({'name': False}).data['name'] == 'false'
@@ -0,0 +1,106 @@
+import pytest
+from jsonschema_wtforms import Form, compile_schema, schema_fields
+from jsonschema_wtforms.cache import SchemaCache, fingerprint
+
+
+def test_fingerprint():
+    assert fingerprint({'type': 'string', 'title': 'A'}) == fingerprint(
+        {'title': 'A', 'type': 'string'})
+    assert fingerprint({'a': 1}) != fingerprint({'a': 2})
+    assert fingerprint({'a': 1}, include=['x', 'y']) == fingerprint(
+        {'a': 1}, include=('y', 'x'))
+    assert fingerprint({'a': 1}, include=[]) != fingerprint({'a': 1})
+    assert fingerprint({'a': 1}, exclude=['x']) != fingerprint(
+        {'a': 1}, include=['x'])
+
+
+def test_property_order():
+    first = {"type": "object", "properties": {
+        "a": {"type": "string", "title": "A"}, "b": {"type": "string"}}}
+    second = {"properties": {
+        "b": {"type": "string"}, "a": {"title": "A", "type": "string"}},
+        "type": "object"}
+    assert fingerprint(first) != fingerprint(second)
+    # A property named `properties` is a schema like the others.
+    assert fingerprint({"properties": {"properties": {
+        "type": "string", "title": "P"}}}) == fingerprint(
+            {"properties": {"properties": {"title": "P", "type": "string"}}})
+
+    cache = SchemaCache()
+    assert list(Form.from_schema(first, cache=cache)._fields) == ['a', 'b']
+    assert list(Form.from_schema(second, cache=cache)._fields) == ['b', 'a']
+
+
+def test_cached_compilation(person_schema):
+    cache = SchemaCache(maxsize=2)
+    root = compile_schema(person_schema, cache=cache)
+    assert compile_schema(person_schema, cache=cache) is root
+    assert cache.info() == (1, 1, 0, 2, 1)
+
+    filtered = compile_schema(
+        person_schema, include=['firstName'], cache=cache)
+    assert filtered is not root
+    assert list(filtered.fields) == ['firstName']
+
+    fields = schema_fields(person_schema, cache=cache)
+    assert fields is root.fields
+    form = Form.from_schema(person_schema, cache=cache)
+    assert set(form._fields) == set(root.fields)
+    assert cache.info().hits == 3
+
+
+def test_cache_eviction(person_schema, address_schema, geo_schema):
+    cache = SchemaCache(maxsize=2)
+    person = compile_schema(person_schema, cache=cache)
+    compile_schema(address_schema, cache=cache)
+    compile_schema(person_schema, cache=cache)  # refreshes person
+    compile_schema(geo_schema, cache=cache)  # evicts address
+    assert cache.info().evictions == 1
+    assert fingerprint(address_schema) not in cache
+    assert compile_schema(person_schema, cache=cache) is person
+
+    cache.maxsize = 1
+    assert len(cache) == 1
+    assert cache.info().evictions == 2
+
+    with pytest.raises(ValueError):
+        cache.maxsize = -1
+
+
+def test_cache_invalidation(person_schema, geo_schema):
+    cache = SchemaCache()
+    person = compile_schema(person_schema, cache=cache)
+    compile_schema(geo_schema, cache=cache)
+
+    cache.invalidate(fingerprint(person_schema))
+    assert len(cache) == 1
+    assert compile_schema(person_schema, cache=cache) is not person
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 128, 0)
+
+
+def test_disabled_cache(person_schema):
+    cache = SchemaCache(maxsize=0)
+    assert compile_schema(person_schema, cache=cache) is not \
+        compile_schema(person_schema, cache=cache)
+    assert len(cache) == 0
+    assert compile_schema(person_schema, cache=None) is not \
+        compile_schema(person_schema, cache=None)
+
+
+def test_filter_iterators(person_schema):
+    cache = SchemaCache()
+    fields = schema_fields(
+        person_schema, include=(name for name in ['firstName']),
+        cache=cache)
+    assert list(fields) == ['firstName']
+    assert schema_fields(
+        person_schema, include=['firstName'], cache=cache) is fields
+    fields = schema_fields(
+        person_schema, exclude=iter(['firstName']), cache=cache)
+    assert 'firstName' not in fields
+    assert 'lastName' in fields
@@ -0,0 +1,96 @@
+import wtforms.form
+from jsonschema_wtforms import compile_schema
+from jsonschema_wtforms.choices import Choices, shared_choices
+from jsonschema_wtforms.formdata import record_formdata
+
+
+CODES = [f'C{index:05d}' for index in range(20000)]
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "country": {"type": "string", "enum": CODES},
+        "origin": {"enum": CODES},
+        "level": {"type": "integer", "enum": [1, 2, 3]},
+        "codes": {"type": "array", "items": {"enum": CODES}},
+    }
+}
+
+
+def test_choices():
+    choices = Choices(['a', 'b', 1])
+    assert len(choices) == 3
+    assert choices[0] == ('a', 'a')
+    assert choices[1:] == (('b', 'b'), (1, 1))
+    assert list(choices) == [('a', 'a'), ('b', 'b'), (1, 1)]
+    assert choices == (('a', 'a'), ('b', 'b'), (1, 1))
+    assert choices == Choices(['a', 'b', 1])
+    assert choices.accepts('1')
+    assert not choices.accepts(1)
+    assert choices.accepts(1, coerce=lambda value: value)
+    assert choices.accepted() is choices.accepted()
+
+    unhashable = Choices([[1], [2]])
+    assert unhashable.accepts([2], coerce=list)
+    assert not unhashable.accepts([3], coerce=list)
+
+
+def test_shared_choices():
+    assert shared_choices(CODES) is shared_choices(tuple(CODES))
+    assert shared_choices([1, 2]) is not shared_choices([True, 2])
+    assert shared_choices([{'a': 1}]) == (({'a': 1}, {'a': 1}),)
+
+    root = compile_schema(SCHEMA, cache=None)
+    choices = root.fields['country'].attributes['choices']
+    assert isinstance(choices, Choices)
+    assert root.fields['origin'].attributes['choices'] is choices
+    assert root.fields['codes'].attributes['choices'] is choices
+
+    form = wtforms.form.BaseForm(root.fields)
+    # Fields keep the shared choices, instead of a copy.
+    assert form['country'].choices is choices
+    assert form['codes'].choices is choices
+
+
+def test_validation():
+    root = compile_schema(SCHEMA, cache=None)
+    form = wtforms.form.BaseForm(root.fields)
+    form.process(formdata=record_formdata(root.fields, {
+        'country': 'C19999',
+        'origin': 'C00000',
+        'level': 2,
+        'codes': ['C00001', 'C12345']
+    }))
+    assert form.validate()
+    assert form.data['codes'] == ['C00001', 'C12345']
+
+    form.process(formdata=record_formdata(root.fields, {
+        'country': 'C20000',
+        'origin': 'XX',
+        'level': 4,
+        'codes': ['C00001', 'XX', 'XX']
+    }))
+    assert not form.validate()
+    assert form.errors == {
+        'country': ['Not a valid choice.'],
+        'origin': ['Not a valid choice.'],
+        'level': ['Not a valid choice.'],
+        'codes': ["'XX' is not a valid choice for this field."]
+    }
+
+
+def test_render():
+    schema = {
+        "type": "object",
+        "properties": {
+            "size": {"enum": ["S", "M", "L"]},
+            "colors": {"type": "array", "items": {"enum": ["red", "blue"]}}
+        }
+    }
+    root = compile_schema(schema, cache=None)
+    form = wtforms.form.BaseForm(root.fields)
+    form.process(formdata=record_formdata(
+        root.fields, {'size': 'M', 'colors': ['blue']}))
+    assert '<option selected value="M">M</option>' in form['size']()
+    assert 'checked id="colors-1" name="colors" type="checkbox" ' \
+        'value="blue"' in form['colors']()
@@ -0,0 +1,85 @@
+import importlib.util
+import json
+import pytest
+from jsonschema_wtforms import compile_schema, instrumentation
+from jsonschema_wtforms.codegen import generate_module, main
+from jsonschema_wtforms.formdata import record_formdata
+from test_fastpath import SCHEMA, random_records
+
+
+def load(path, name='generated_forms'):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def outcome(form):
+    return form.validate(), form.errors, form.data
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_generated_forms_behave_alike(tmp_path, compact):
+    path = tmp_path / 'forms.py'
+    path.write_text(
+        generate_module(SCHEMA, name='RecordForm', compact=compact))
+    with instrumentation.instrument() as collector:
+        module = load(path)
+    # Importing the module converts nothing.
+    assert 'convert' not in collector.as_dict()
+
+    root = compile_schema(SCHEMA, cache=None, compact=compact)
+    runtime = root.as_form_class()
+    for record in random_records(500):
+        formdata = record_formdata(root.fields, record)
+        assert outcome(module.RecordForm(formdata)) == \
+            outcome(runtime(formdata)), record
+
+    generated = module.RecordForm()
+    assert generated.kind.choices is \
+        root.fields['kind'].attributes['choices']
+    assert str(generated.scores) == str(runtime().scores)
+
+
+def test_names(tmp_path):
+    schema = {
+        "type": "object",
+        "title": "Shop",
+        "properties": {
+            "first-name": {"type": "string", "title": "Name"},
+            "home": {
+                "type": "object",
+                "title": "Address",
+                "properties": {"city": {"type": "string"}}
+            },
+            "work": {
+                "type": "object",
+                "title": "Address",
+                "properties": {"street": {"type": "string"}}
+            }
+        }
+    }
+    path = tmp_path / 'forms.py'
+    path.write_text(generate_module(schema))
+    module = load(path)
+    form = module.ShopForm()
+    assert list(form._fields) == ['first-name', 'home', 'work']
+    assert form['first-name'].label.text == 'Name'
+    assert list(form.home.form._fields) == ['city']
+    assert list(form.work.form._fields) == ['street']
+    assert module.AddressForm is not module.AddressForm2
+
+
+def test_command(tmp_path, geo_schema):
+    schema = tmp_path / 'geo.json'
+    schema.write_text(json.dumps(geo_schema))
+    output = tmp_path / 'geo_forms.py'
+    assert main([str(schema), '-o', str(output), '--name', 'Geo']) == 0
+    module = load(output, 'geo_forms')
+    form = module.Geo(data={'latitude': 12, 'longitude': 200})
+    assert list(form._fields) == ['latitude', 'longitude']
+
+
+def test_filter_iterators():
+    assert generate_module(SCHEMA, include=iter(['name'])) == \
+        generate_module(SCHEMA, include=['name'])
@@ -0,0 +1,158 @@
+import wtforms.fields
+from jsonschema_wtforms import Form, compile_schema
+from jsonschema_wtforms._fields import ScalarListField
+from jsonschema_wtforms.batch import BatchValidator
+from jsonschema_wtforms.fastpath import FastValidator
+from jsonschema_wtforms.field import ArrayParameters
+from jsonschema_wtforms.formdata import FormData, record_formdata
+from jsonschema_wtforms.resolver import Resolver
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "scores": {
+            "type": "array",
+            "minItems": 2,
+            "maxItems": 4,
+            "items": {"type": "integer", "minimum": 0, "maximum": 10}
+        },
+        "tags": {
+            "type": "array",
+            "items": {"type": "string", "minLength": 2}
+        },
+        "flags": {
+            "type": "array",
+            "items": {"type": "boolean"}
+        },
+        "colors": {
+            "type": "array",
+            "items": {"enum": ["red", "blue"]}
+        },
+        "points": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"x": {"type": "number"}}
+            }
+        }
+    },
+    "required": ["scores"]
+}
+
+
+def test_compact_factory():
+    params = {"type": "array", "items": {"type": "number"}}
+    field = ArrayParameters.from_json_field('test', True, params)
+    assert field.get_factory().func is wtforms.fields.FieldList
+
+    field = ArrayParameters.from_json_field(
+        'test', True, params, resolver=Resolver(params, compact=True))
+    factory = field.get_factory()
+    assert factory.func is ScalarListField
+    assert factory.args[0].field_class is wtforms.fields.FloatField
+
+
+def test_compact_fields():
+    form = Form.from_schema(SCHEMA, cache=None, compact=True)
+    assert isinstance(form['scores'], ScalarListField)
+    assert isinstance(form['tags'], ScalarListField)
+    assert isinstance(form['flags'], ScalarListField)
+    # Enums and objects keep their fields.
+    assert not isinstance(form['colors'], ScalarListField)
+    assert isinstance(form['points'], wtforms.fields.FieldList)
+
+
+def test_compact_validation():
+    form = Form.from_schema(SCHEMA, cache=None, compact=True)
+    form.process(FormData({
+        'scores': ['1', '20', 'x', ''],
+        'tags-0': ['a'],
+        'tags-1': ['abc'],
+        'flags': [True, 'false'],
+    }))
+    assert not form.validate()
+    assert form.errors == {
+        'scores': [
+            [], ['Number must be at most 10.'],
+            ['Not a valid integer value.'], []
+        ],
+        'tags': [['Field must be at least 2 characters long.'], []]
+    }
+    assert form.data['scores'] == [1, 20, None, None]
+    assert form.data['flags'] == [True, False]
+
+
+def test_compact_length():
+    form = Form.from_schema(SCHEMA, cache=None, compact=True)
+    form.process(FormData({'scores': ['1', '2', '3', '4', '5']}))
+    assert not form.validate()
+    assert form.errors == {'scores': ['At most 4 items are allowed.']}
+
+    form.process(FormData({'scores': ['1', '-1']}))
+    assert not form.validate()
+    assert form.errors == {
+        'scores': [[], ['Number must be at least 0.']]}
+
+    form.process(FormData({'scores': ['1'], 'tags': []}))
+    assert not form.validate()
+    assert form.errors == {'scores': ['At least 2 items are required.']}
+
+    form.process(FormData({'tags': ['ab']}))
+    assert not form.validate()
+    assert form.errors == {'scores': ['This field is required.']}
+
+
+def test_compact_entries():
+    form = Form.from_schema(SCHEMA, cache=None, compact=True)
+    form.process(FormData({'scores': ['1', 'x']}))
+    form.validate()
+    field = form['scores']
+    # Nothing is bound until asked for.
+    assert field.entries._entries is None
+    assert len(field.entries) == 2
+    assert field.entries._entries is None
+
+    first, second = field.entries
+    assert (first.name, first.data) == ('scores-0', 1)
+    assert second.errors == ['Not a valid integer value.']
+    assert 'value="x"' in second()
+
+    # Rendering pads the entries up to `min_entries`.
+    form.process(FormData({'scores': ['1']}))
+    assert [entry.name for entry in form['scores']] == [
+        'scores-0', 'scores-1']
+
+
+def test_compact_round_trip():
+    form = Form.from_schema(SCHEMA, cache=None, compact=True)
+    form.process(data={'scores': [3, 4], 'tags': ['ab']})
+    assert form.validate()
+    html = form['scores']()
+    formdata = FormData({
+        'scores-0': ['3'], 'scores-1': ['4'], 'tags': ['ab']})
+    assert 'name="scores-1"' in html
+
+    submitted = Form.from_schema(SCHEMA, cache=None, compact=True)
+    submitted.process(formdata)
+    assert submitted.validate()
+    assert submitted.data['scores'] == [3, 4]
+
+
+def test_compact_parity():
+    root = compile_schema(SCHEMA, cache=None, compact=True)
+    form_path = BatchValidator(root)
+    fast_path = FastValidator(root)
+    records = [
+        {'scores': [1, 2], 'tags': ['ab', 'cd'], 'flags': [True]},
+        {'scores': [1, 11, -1], 'tags': ['a']},
+        {'scores': [1, 2, 3, 4, 5]},
+        {'scores': [1]},
+        {'scores': ['x', None, 2.5]},
+        {'tags': ['ab']},
+    ]
+    for index, record in enumerate(records):
+        assert fast_path.validate(record, index) == \
+            form_path.validate(record, index)
+    assert record_formdata(root.fields, records[0]) == {
+        'scores': ['1', '2'], 'tags': ['ab', 'cd'], 'flags': [True]}
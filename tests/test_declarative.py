@@ -0,0 +1,137 @@
+import pytest
+import wtforms.form
+import wtforms.fields
+from jsonschema_wtforms import Form, schema_form_class
+from jsonschema_wtforms.cache import SchemaCache
+from jsonschema_wtforms.field import ObjectParameters
+
+
+def test_form_class(person_schema):
+    root = ObjectParameters.from_json_field(None, False, person_schema)
+    PersonForm = root.as_form_class()
+    assert PersonForm.__name__ == 'PersonForm'
+    assert issubclass(PersonForm, wtforms.form.Form)
+    for name in root.fields:
+        assert isinstance(
+            getattr(PersonForm, name), wtforms.fields.core.UnboundField)
+
+    form = PersonForm(data={'firstName': 'Jane', 'lastName': 'Doe'})
+    assert list(form._fields) == list(root.fields)
+    assert isinstance(form.age, wtforms.fields.IntegerField)
+    assert form.homepage.label.text == 'Homepage'
+    assert form.validate()
+
+    form = PersonForm(data={'firstName': 'Jane'})
+    assert not form.validate()
+    assert form.errors == {'lastName': ['This field is required.']}
+
+    # Same results as the dynamic form.
+    dynamic = Form.from_schema(person_schema, cache=None)
+    dynamic.process(data={'firstName': 'Jane'})
+    dynamic.validate()
+    assert dynamic.errors == form.errors
+    assert dynamic.data == form.data
+
+
+def test_nested_form_class():
+    root = ObjectParameters.from_json_field(None, False, {
+        "type": "object",
+        "properties": {
+            "fruits": {
+                "type": "array",
+                "items": {"type": "string"}
+            },
+            "vegetables": {
+                "type": "array",
+                "items": {"$ref": "#/definitions/veggie"}
+            }
+        },
+        "definitions": {
+            "veggie": {
+                "type": "object",
+                "required": ["veggieName", "veggieLike"],
+                "properties": {
+                    "veggieName": {"type": "string"},
+                    "veggieLike": {"type": "boolean"}
+                }
+            }
+        }
+    })
+    ArraysForm = root.as_form_class(name='ArraysForm')
+    vegetables = ArraysForm.vegetables
+    assert vegetables.field_class is wtforms.fields.FieldList
+    subform = vegetables.args[0]
+    assert subform.field_class is wtforms.fields.FormField
+    assert issubclass(subform.args[0], wtforms.form.Form)
+
+    form = ArraysForm(data={
+        'fruits': ['apple'],
+        'vegetables': [{'veggieName': 'leek', 'veggieLike': True}]
+    })
+    assert form.vegetables[0].veggieName.data == 'leek'
+    assert form.vegetables[0].name == 'vegetables-0'
+    assert form.vegetables[0].veggieName.name == 'vegetables-0-veggieName'
+    assert form.validate()
+
+
+def test_nested_object_form_class():
+    root = ObjectParameters.from_json_field(None, False, {
+        "type": "object",
+        "properties": {
+            "address": {
+                "type": "object",
+                "title": "Postal address",
+                "properties": {
+                    "city": {"type": "string"}
+                },
+                "required": ["city"]
+            }
+        }
+    })
+    SchemaForm = root.as_form_class()
+    assert SchemaForm.__name__ == 'SchemaForm'
+    address = SchemaForm.address
+    assert address.field_class is wtforms.fields.FormField
+    assert address.args[0].__name__ == 'PostalAddressForm'
+
+    form = SchemaForm(data={'address': {'city': 'Boppelsen'}})
+    assert form.validate()
+    assert form.data == {'address': {'city': 'Boppelsen'}}
+
+    form = SchemaForm(data={'address': {}})
+    assert not form.validate()
+    assert form.errors == {'address': {'city': ['This field is required.']}}
+
+
+def test_reserved_property_names():
+    root = ObjectParameters.from_json_field(None, False, {
+        "type": "object",
+        "properties": {
+            "validate": {"type": "string"}
+        }
+    })
+    with pytest.raises(NotImplementedError):
+        root.as_form_class()
+
+
+def test_cached_form_class(person_schema):
+    cache = SchemaCache()
+    PersonForm = schema_form_class(person_schema, cache=cache)
+    assert schema_form_class(person_schema, cache=cache) is PersonForm
+    assert schema_form_class(
+        person_schema, name='Other', cache=cache) is not PersonForm
+    assert schema_form_class(
+        person_schema, exclude=['age'], cache=cache) is not PersonForm
+    # Two compiled schemas and three form classes.
+    assert cache.info().misses == 5
+    assert len(cache) == 5
+
+
+def test_form_class_filter_iterators(person_schema):
+    cache = SchemaCache()
+    PersonForm = schema_form_class(
+        person_schema, exclude=iter(['age']), cache=cache)
+    assert not hasattr(PersonForm, 'age')
+    assert hasattr(PersonForm, 'firstName')
+    assert schema_form_class(
+        person_schema, exclude=['age'], cache=cache) is PersonForm
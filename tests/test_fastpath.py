@@ -0,0 +1,193 @@
+import random
+from jsonschema_wtforms import compile_schema
+from jsonschema_wtforms.batch import BatchValidator, Result
+from jsonschema_wtforms.fastpath import FastValidator
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 2, "maxLength": 8},
+        "code": {"type": "string", "pattern": "^[A-Z]{3}$"},
+        "ip": {"type": "string", "format": "ipv4"},
+        "email": {"type": "string", "format": "email"},
+        "born": {"type": "string", "format": "date"},
+        "age": {"type": "integer", "minimum": 0, "maximum": 120},
+        "ratio": {
+            "type": "number", "exclusiveMinimum": 0, "exclusiveMaximum": 1
+        },
+        "level": {"type": "integer", "enum": [1, 2, 3]},
+        "active": {"type": "boolean", "default": True},
+        "kind": {"enum": ["PC", "Laptop"]},
+        "tags": {
+            "type": "array",
+            "items": {"enum": ["red", "green", "blue"]}
+        },
+        "scores": {
+            "type": "array",
+            "minItems": 1,
+            "maxItems": 3,
+            "items": {"type": "number", "minimum": 0}
+        },
+        "address": {
+            "type": "object",
+            "properties": {
+                "city": {"type": "string"},
+                "zip": {"type": "string", "pattern": "^[0-9]{4}$"}
+            },
+            "required": ["city"]
+        },
+        "devices": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "serial": {"type": "string", "minLength": 3},
+                    "ports": {"type": "integer", "minimum": 1}
+                },
+                "required": ["serial"]
+            }
+        }
+    },
+    "required": ["name", "age", "kind", "scores"]
+}
+
+
+# The first choice of each field is valid.
+CHOICES = {
+    "name": ["abc", "a", "abcdefghij", "", None, 12, ["ab"], {"a": 1}],
+    "code": ["ABC", "abc", "ABCD", "", True],
+    "ip": ["127.0.0.1", "::1", "nope", "", [1]],
+    "email": ["me@example.com", "not an email"],
+    "born": [
+        "2000-01-31", "2000-02-31", "yesterday", "", {"a": 1}, [1], False
+    ],
+    "age": [
+        0, 1, 121, -1, "12", "twelve", 1.5, None, True, [1, 2], {"a": 1}
+    ],
+    "ratio": [0.5, 0, 1, "0.25", "x", [0.5], {}],
+    "level": [1, 3, 4, "2", None, [1], {"a": 1}],
+    "active": [True, False, "false", "", "yes", 0, [], {"a": 1}],
+    "kind": ["PC", "Laptop", "Tablet", "", None, ["PC"], {"a": 1}],
+    "tags": [
+        [], ["red"], ["red", "blue"], ["pink", "red", "black"], "red",
+        [["red"]], {"a": 1}
+    ],
+    "scores": [
+        [0], [], [1, 2.5], [-1, 2], [1, 2, 3, 4], ["a"], [None, 1],
+        [[1]], [{"a": 1}], {"a": 1}, True
+    ],
+    "address": [
+        {"city": "Boppelsen"}, {}, {"city": "B", "zip": "8113"},
+        {"zip": "zip"}, "nowhere", None, [1], {"city": [1], "zip": {}}
+    ],
+    "devices": [
+        [], [{"serial": "123"}], [{"serial": "1"}, {"ports": 0}],
+        [{}, {"serial": "12345", "ports": "4"}], [None, {"serial": "abc"}],
+        [{"serial": ["abc"], "ports": [1]}], [[1]], {"serial": "abc"}
+    ],
+}
+
+
+def random_records(count, seed=42):
+    rng = random.Random(seed)
+    for _ in range(count):
+        record = {}
+        for name, choices in CHOICES.items():
+            if rng.random() < 0.6:
+                record[name] = choices[0]
+            elif rng.random() < 0.8:
+                record[name] = rng.choice(choices)
+        yield record
+
+
+def test_parity():
+    root = compile_schema(SCHEMA, cache=None)
+    form_path = BatchValidator(root)
+    fast_path = FastValidator(root)
+
+    valid = 0
+    for index, record in enumerate(random_records(2000)):
+        expected = form_path.validate(record, index)
+        assert fast_path.validate(record, index) == expected, record
+        valid += expected.valid
+    # Both outcomes are covered.
+    assert 0 < valid < 2000
+
+
+def test_badly_typed_fallback():
+    root = compile_schema(SCHEMA, cache=None)
+    for value in ({"a": 1}, [1], True):
+        record = {
+            "name": "abc", "age": 0, "kind": "PC", "scores": [0],
+            "address": {"city": "Boppelsen"},
+            "born": value
+        }
+        expected = BatchValidator(root).validate(record)
+        assert expected.errors == {'born': ['Not a valid date value.']}
+        assert FastValidator(root).validate(record) == expected
+
+
+def test_fast_validator(geo_schema):
+    validator = FastValidator.from_schema(geo_schema)
+    results = list(validator([
+        {'latitude': 12, 'longitude': 5.5},
+        {'latitude': -91},
+        'not an object'
+    ]))
+    assert results == [
+        Result(0, data={'latitude': 12.0, 'longitude': 5.5}),
+        Result(1, errors={
+            'latitude': ['Number must be at least -90.'],
+            'longitude': ['This field is required.']
+        }),
+        Result(2, errors={None: ['Not a valid object.']})
+    ]
+
+
+def test_lazy_parity():
+    schema = {
+        "type": "object",
+        "properties": {
+            "root": {"$ref": "#/definitions/Node"}
+        },
+        "definitions": {
+            "Node": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "minLength": 2},
+                    "children": {
+                        "type": "array",
+                        "items": {"$ref": "#/definitions/Node"}
+                    }
+                },
+                "required": ["name"]
+            }
+        }
+    }
+    root = compile_schema(schema, cache=None, lazy=True)
+    record = {'root': {'name': 'root', 'children': [
+        {'name': 'a', 'children': [{'name': 'aa'}, {}]},
+        {'name': 'bb', 'children': [{'children': [{'name': 'x'}]}]},
+    ]}}
+    expected = BatchValidator(root).validate(record)
+    assert not expected.valid
+    assert FastValidator(root).validate(record) == expected
+
+
+def test_list_defaults_parity():
+    schema = {
+        "type": "object",
+        "properties": {
+            "values": {
+                "type": "array",
+                "default": [1, 2],
+                "items": {"type": "integer"}
+            },
+            "name": {"type": "string"}
+        }
+    }
+    root = compile_schema(schema, cache=None)
+    for record in ({}, {'name': None}, {'name': 'x'}, {'values': [3]}):
+        assert FastValidator(root).validate(record) == \
+            BatchValidator(root).validate(record)
@@ -0,0 +1,88 @@
+from jsonschema_wtforms import Form, compile_schema
+from jsonschema_wtforms.formdata import record_formdata
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "count": {"type": "integer", "minimum": 0},
+        "active": {"type": "boolean"},
+        "tags": {
+            "type": "array",
+            "items": {"enum": ["red", "green"]}
+        },
+        "scores": {
+            "type": "array",
+            "items": {"type": "number"}
+        },
+        "address": {
+            "type": "object",
+            "properties": {
+                "city": {"type": "string"}
+            },
+            "required": ["city"]
+        },
+        "devices": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"kind": {"type": "string"}}
+            }
+        }
+    },
+    "required": ["count"]
+}
+
+
+def test_record_formdata():
+    root = compile_schema(SCHEMA, cache=None)
+    formdata = record_formdata(root.fields, {
+        'count': 0,
+        'active': False,
+        'tags': ['red', 'green'],
+        'scores': [1.5, 2],
+        'address': {'city': 'Boppelsen', 'unknown': 1},
+        'devices': [{'kind': 'PC'}, {'kind': 'Laptop'}],
+        'unknown': 'ignored',
+        'nothing': None,
+    })
+    assert formdata == {
+        'count': ['0'],
+        'active': [False],
+        'tags': ['red', 'green'],
+        'scores-0': ['1.5'],
+        'scores-1': ['2'],
+        'address-city': ['Boppelsen'],
+        'devices-0-kind': ['PC'],
+        'devices-1-kind': ['Laptop'],
+    }
+    assert formdata.getlist('tags') == ['red', 'green']
+    assert formdata.getlist('missing') == []
+
+    form = Form(root.fields)
+    form.process(formdata=formdata)
+    assert form.validate()
+    assert form.data == {
+        'count': 0,
+        'active': False,
+        'tags': ['red', 'green'],
+        'scores': [1.5, 2.0],
+        'address': {'city': 'Boppelsen'},
+        'devices': [{'kind': 'PC'}, {'kind': 'Laptop'}],
+    }
+
+
+def test_record_formdata_errors():
+    root = compile_schema(SCHEMA, cache=None)
+    form = Form(root.fields)
+    form.process(formdata=record_formdata(root.fields, {
+        'count': 1.5,
+        'tags': ['blue'],
+        'address': {}
+    }))
+    assert not form.validate()
+    assert form.errors == {
+        'count': ['Not a valid integer value.'],
+        'tags': ["'blue' is not a valid choice for this field."],
+        'address': {'city': ['This field is required.']},
+    }
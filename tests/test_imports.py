@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+import jsonschema_wtforms
+
+
+# Needed by some features only: imported when first used.
+DEFERRED = (
+    'asyncio',
+    'concurrent.futures',
+    'numpy',
+    'jsonschema_wtforms.asynchronous',
+    'jsonschema_wtforms.batch',
+    'jsonschema_wtforms.codegen',
+    'jsonschema_wtforms.fastpath',
+    'jsonschema_wtforms.persistent',
+    'jsonschema_wtforms.registry',
+)
+
+# Time importing the package may take on top of wtforms, as a share of
+# the time wtforms takes: the ratio is about the same on any machine.
+BUDGET = 0.75
+
+
+def import_times(cache: str):
+    """Cumulative import times, in microseconds, of the modules imported
+    by `import jsonschema_wtforms`, as `-X importtime` reports them.
+    """
+    path = os.path.dirname(os.path.dirname(jsonschema_wtforms.__file__))
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=cache, PYTHONPATH=path)
+    # Timing imports, not compilation.
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         'import jsonschema_wtforms'],
+        env=env, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:'):
+            _, cumulative, name = line.split('|')
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_deferred_imports(tmp_path):
+    times = import_times(str(tmp_path))
+    assert 'jsonschema_wtforms' in times
+    assert not set(DEFERRED) & set(times)
+
+
+def test_import_budget(tmp_path):
+    import_times(str(tmp_path))
+    own, wtforms = min(
+        (times['jsonschema_wtforms'] - times['wtforms'], times['wtforms'])
+        for times in (import_times(str(tmp_path)) for _ in range(3))
+    )
+    assert own <= wtforms * BUDGET
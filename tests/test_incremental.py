@@ -0,0 +1,147 @@
+import pytest
+from wtforms.validators import ValidationError
+from jsonschema_wtforms import Form, compile_schema, schema_form_class
+from jsonschema_wtforms.formdata import record_formdata
+from jsonschema_wtforms.incremental import revalidate
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 2},
+        "first-name": {"type": "string", "minLength": 2},
+        "scores": {
+            "type": "array",
+            "maxItems": 3,
+            "items": {"type": "integer", "maximum": 10}
+        },
+        "address": {
+            "type": "object",
+            "properties": {
+                "city": {"type": "string", "minLength": 2},
+                "zip": {"type": "string", "pattern": "^[0-9]{4}$"}
+            },
+            "required": ["city"]
+        },
+        "devices": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "serial": {"type": "string", "minLength": 3},
+                    "ports": {
+                        "type": "array",
+                        "items": {"type": "integer", "minimum": 1}
+                    }
+                }
+            }
+        }
+    },
+    "required": ["name"]
+}
+
+RECORD = {
+    "name": "Jo", "first-name": "Al", "scores": [1, 2],
+    "address": {"city": "Paris", "zip": "7500"},
+    "devices": [{"serial": "abc", "ports": [1, 2]}, {"serial": "def"}]
+}
+
+CHANGES = [
+    # New record, changed paths.
+    ({**RECORD, "name": "J"}, ["name"]),
+    ({**RECORD, "first-name": "A"}, ["first-name"]),
+    ({**RECORD, "address": {"city": "P", "zip": "7500"}}, ["address-city"]),
+    ({**RECORD, "address": {"zip": "75"}}, ["address-city", "address-zip"]),
+    ({**RECORD, "address": {"city": "P", "zip": "x"}}, ["address"]),
+    ({**RECORD, "scores": [1, 20]}, ["scores-1"]),
+    ({**RECORD, "scores": [1, 2, 3, 4]}, ["scores-2", "scores-3"]),
+    ({**RECORD, "devices": [{"serial": "a"}, {"serial": "def"}]},
+     ["devices-0-serial", "devices-0-ports-0", "devices-0-ports-1"]),
+    ({**RECORD, "devices": [{"serial": "abc", "ports": [0, 2]},
+                            {"serial": "def"}]},
+     ["devices-0-ports-0"]),
+    ({**RECORD, "devices": [*RECORD["devices"], {"serial": "x"}]},
+     ["devices-2-serial"]),
+    ({**RECORD, "name": "J", "devices": [{"serial": "a"}]},
+     ["name", "devices", "devices-0-serial"]),
+]
+
+
+def bound(fields, record):
+    form = Form(fields)
+    form.process(record_formdata(fields, record))
+    return form
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_same_errors(compact):
+    fields = compile_schema(SCHEMA, compact=compact).fields
+    for record, paths in CHANGES:
+        expected = bound(fields, record)
+        success = expected.validate()
+        for previous in (RECORD, record):
+            form = bound(fields, previous)
+            form.validate()
+            assert form.revalidate(
+                record_formdata(fields, record), paths) is success
+            assert form.errors == expected.errors
+            assert form.data == expected.data
+
+
+def test_unchanged_fields():
+    fields = compile_schema(SCHEMA).fields
+    calls = []
+
+    def count(form, field):
+        calls.append(field.name)
+
+    form = bound(fields, RECORD)
+    form.validate({'first-name': [count]})
+    assert calls == ['first-name']
+
+    record = {**RECORD, "name": "J"}
+    assert not form.revalidate(
+        record_formdata(fields, record), ['name'], {'first-name': [count]})
+    assert calls == ['first-name']
+    assert form.errors == {
+        'name': ['Field must be at least 2 characters long.']}
+
+    form.revalidate(
+        record_formdata(fields, record), ['first-name'],
+        {'first-name': [count]})
+    assert calls == ['first-name', 'first-name']
+
+
+def test_nested_extra_validators():
+    def taken(form, field):
+        raise ValidationError('Taken.')
+
+    fields = compile_schema(SCHEMA).fields
+    form = bound(fields, RECORD)
+    assert form.validate()
+    assert not form.revalidate(
+        record_formdata(fields, RECORD), ['address-city'],
+        {'address': {'city': [taken]}})
+    assert form.errors == {'address': {'city': ['Taken.']}}
+
+
+def test_unknown_path():
+    fields = compile_schema(SCHEMA).fields
+    form = bound(fields, RECORD)
+    form.validate()
+    with pytest.raises(KeyError):
+        form.revalidate(record_formdata(fields, RECORD), ['nickname'])
+    with pytest.raises(KeyError):
+        form.revalidate(record_formdata(fields, RECORD), ['address-street'])
+
+
+def test_declarative_form():
+    fields = compile_schema(SCHEMA).fields
+    form_class = schema_form_class(SCHEMA)
+    record, paths = CHANGES[3]
+    expected = form_class(record_formdata(fields, record))
+    expected.validate()
+    form = form_class(record_formdata(fields, RECORD))
+    form.validate()
+    assert not revalidate(form, record_formdata(fields, record), paths)
+    assert form.errors == expected.errors
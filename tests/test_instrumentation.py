@@ -0,0 +1,153 @@
+import threading
+from jsonschema_wtforms import Form, compile_schema, schema_form_class
+from jsonschema_wtforms.formdata import record_formdata
+from jsonschema_wtforms.instrumentation import (
+    Collector, UnboundSchemaField, instrument)
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "age": {"type": "integer", "minimum": 0},
+        "address": {
+            "type": "object",
+            "properties": {
+                "street": {"type": "string"},
+                "city": {"type": "string"}
+            }
+        },
+        "scores": {"type": "array", "items": {"type": "number"}}
+    }
+}
+
+RECORD = {
+    "name": "Jane",
+    "age": 33,
+    "address": {"street": "Main street", "city": "Springfield"},
+    "scores": [1, 2, 3]
+}
+
+
+def counts(collector):
+    return {
+        phase: {kind: stats['count'] for kind, stats in kinds.items()}
+        for phase, kinds in collector.as_dict().items()
+    }
+
+
+def test_instrument():
+    with instrument() as collector:
+        root = compile_schema(SCHEMA, cache=None)
+        form = Form(root.fields)
+        form.process(formdata=record_formdata(root.fields, RECORD))
+        assert form.validate()
+        html = [field() for field in form]
+
+    assert 'Springfield' in html[2]
+    assert counts(collector) == {
+        'convert': {
+            'ArrayParameters': 1,
+            'NumberParameters': 2,
+            'ObjectParameters': 2,
+            'StringParameters': 3,
+        },
+        'bind': {
+            'ArrayParameters': 1,
+            'NumberParameters': 4,
+            'ObjectParameters': 1,
+            'StringParameters': 3,
+        },
+        'process': {
+            'ArrayParameters': 1,
+            'NumberParameters': 4,
+            'ObjectParameters': 1,
+            'StringParameters': 3,
+        },
+        'validate': {
+            'ArrayParameters': 1,
+            'NumberParameters': 4,
+            'ObjectParameters': 1,
+            'StringParameters': 3,
+        },
+        'render': {
+            'ArrayParameters': 1,
+            'NumberParameters': 4,
+            'ObjectParameters': 1,
+            'StringParameters': 3,
+        },
+    }
+    totals = collector.totals()
+    assert list(totals) == [
+        'convert', 'bind', 'process', 'validate', 'render']
+    assert all(elapsed > 0 for elapsed in totals.values())
+
+    collector.reset()
+    assert collector.as_dict() == {}
+
+
+def test_disabled():
+    root = compile_schema(SCHEMA, cache=None)
+    form = Form(root.fields)
+    assert isinstance(root.fields['name'](), UnboundSchemaField)
+    assert 'process' not in vars(form['name'])
+
+    with instrument() as collector:
+        form.process(formdata=record_formdata(root.fields, RECORD))
+        form.validate()
+    # Only fields bound while instrumenting report: here, the subfields
+    # bound when processing the object and the array.
+    assert counts(collector) == {
+        'bind': {'NumberParameters': 3, 'StringParameters': 2},
+        'process': {'NumberParameters': 3, 'StringParameters': 2},
+        'validate': {'NumberParameters': 3, 'StringParameters': 2},
+    }
+
+
+def test_declarative_and_record():
+
+    class Recorder(Collector):
+
+        def __init__(self):
+            super().__init__()
+            self.calls = []
+
+        def record(self, phase, kind, elapsed):
+            self.calls.append((phase, kind))
+            super().record(phase, kind, elapsed)
+
+    formclass = schema_form_class(SCHEMA, cache=None)
+    with instrument(Recorder()) as collector:
+        form = formclass()
+    assert ('bind', 'ObjectParameters') in collector.calls
+    assert ('process', 'StringParameters') in collector.calls
+    assert form.address.form.city.widget.input_type == 'text'
+
+
+def test_threads():
+    root = compile_schema(SCHEMA, cache=None)
+    entered, done = threading.Event(), threading.Event()
+    collectors = {}
+
+    def instrumented():
+        with instrument() as collector:
+            entered.set()
+            done.wait(5)
+            Form(root.fields)
+        collectors['thread'] = collector
+
+    thread = threading.Thread(target=instrumented)
+    thread.start()
+    entered.wait(5)
+    # Not recorded by the collector of the other thread.
+    Form(root.fields)
+    with instrument() as collector:
+        Form(root.fields)
+    done.set()
+    thread.join()
+    assert counts(collectors['thread']) == counts(collector) == {
+        'bind': {
+            'ArrayParameters': 1, 'NumberParameters': 1,
+            'ObjectParameters': 1, 'StringParameters': 1,
+        },
+    }
@@ -0,0 +1,115 @@
+import pytest
+from jsonschema_wtforms import Form, compile_schema
+from jsonschema_wtforms.cache import SchemaCache
+from jsonschema_wtforms.converter import LazyParameters
+from jsonschema_wtforms.field import ObjectParameters, StringParameters
+from jsonschema_wtforms.resolver import CircularReference
+
+
+TREE = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "root": {"$ref": "#/definitions/Node"}
+    },
+    "definitions": {
+        "Node": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "minLength": 2},
+                "children": {
+                    "type": "array",
+                    "items": {"$ref": "#/definitions/Node"}
+                }
+            },
+            "required": ["name"]
+        }
+    }
+}
+
+
+def test_recursive_schema_requires_lazy():
+    with pytest.raises(CircularReference):
+        compile_schema(TREE, cache=None)
+
+
+def test_lazy_conversion():
+    root = compile_schema(TREE, cache=None, lazy=True)
+    assert isinstance(root.fields['title'], StringParameters)
+    node = root.fields['root']
+    assert isinstance(node, LazyParameters)
+    assert node.name == 'root'
+    assert not node.required
+    assert not node.compiled
+
+    # Reading the parameters converts them.
+    assert node.label == 'root'
+    assert node.compiled
+    assert isinstance(node.parameters, ObjectParameters)
+    children = node.fields['children']
+    assert isinstance(children, LazyParameters)
+    assert not children.compiled
+    # The recursion is memoized.
+    assert children.subfield.fields['children'] is children
+
+
+def test_recursive_form():
+    form = Form.from_schema(TREE, cache=None, lazy=True)
+    form.process(data={
+        'title': 'Tree',
+        'root': {
+            'name': 'root',
+            'children': [
+                {'name': 'a', 'children': [{'name': 'aa'}]},
+                {'name': 'bb', 'children': [{'name': 'b'}]},
+            ]
+        }
+    })
+    assert not form.validate()
+    assert form.errors == {'root': {'children': [
+        {'name': ['Field must be at least 2 characters long.']},
+        {'children': [
+            {'name': ['Field must be at least 2 characters long.']}
+        ]}
+    ]}}
+    assert form.data['root']['children'][1]['children'][0]['name'] == 'b'
+    assert form['root']['children'][0]['children'][0]['name'].name == \
+        'root-children-0-children-0-name'
+
+
+def test_unused_branches_are_not_converted():
+    root = compile_schema({
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "details": {
+                "type": "object",
+                "properties": {
+                    "deep": {"$ref": "#/definitions/Deep"}
+                }
+            }
+        },
+        "definitions": {
+            "Deep": {
+                "type": "object",
+                "properties": {"value": {"type": "number"}}
+            }
+        }
+    }, cache=None, lazy=True)
+    details = root.fields['details']
+    form = Form({'name': root.fields['name']})
+    form.process(data={'name': 'only the name'})
+    assert form.validate()
+    assert not details.compiled
+
+    Form(root.fields).process()
+    assert details.compiled
+    assert details.fields['deep'].compiled
+
+
+def test_lazy_cache_key(person_schema):
+    cache = SchemaCache()
+    eager = compile_schema(person_schema, cache=cache)
+    lazy = compile_schema(person_schema, cache=cache, lazy=True)
+    assert eager is not lazy
+    assert compile_schema(person_schema, cache=cache, lazy=True) is lazy
@@ -0,0 +1,119 @@
+import io
+import json
+import pytest
+from jsonschema_wtforms.__main__ import (
+    InvalidInput, iter_array, main, read_records)
+
+
+RECORDS = [
+    {'latitude': 12, 'longitude': 5.5},
+    {'latitude': -91, 'longitude': 5.5},
+    {'latitude': 45.5},
+    [1, 2],
+]
+
+EXPECTED = [
+    {'index': 0, 'data': {'latitude': 12.0, 'longitude': 5.5}},
+    {'index': 1, 'errors': {'latitude': ['Number must be at least -90.']}},
+    {'index': 2, 'errors': {'longitude': ['This field is required.']}},
+    {'index': 3, 'errors': {'null': ['Not a valid object.']}},
+]
+
+
+@pytest.fixture
+def schema_file(tmp_path, geo_schema):
+    path = tmp_path / 'schema.json'
+    path.write_text(json.dumps(geo_schema))
+    return str(path)
+
+
+def test_read_records():
+    ndjson = '\n\n' + '\n'.join(map(json.dumps, RECORDS)) + '\n\n'
+    assert list(read_records(io.StringIO(ndjson))) == RECORDS
+    array = '  ' + json.dumps(RECORDS, indent=2)
+    assert list(read_records(io.StringIO(array))) == RECORDS
+    assert list(read_records(io.StringIO(' [ ] '))) == []
+    assert list(read_records(io.StringIO(''))) == []
+
+    with pytest.raises(InvalidInput, match='line 3'):
+        list(read_records(io.StringIO('{}\n\n{"a": \n')))
+
+
+def test_iter_array_buffers():
+    records = [{'value': index * 1000, 'name': 'x' * index}
+               for index in range(50)] + [123456789]
+    text = json.dumps(records)
+    for bufsize in (1, 3, 7, 64):
+        stream = io.StringIO(text)
+        assert list(iter_array(
+            stream, stream.read(1), bufsize=bufsize)) == records
+
+    for text in ('[1, 2', '[1, 2,]', '[1 2]', '[{"a": }]'):
+        stream = io.StringIO(text)
+        with pytest.raises(InvalidInput):
+            list(iter_array(stream, stream.read(1), bufsize=2))
+
+
+@pytest.mark.parametrize('processes', [0, 2])
+@pytest.mark.parametrize('validator', ['fast', 'form'])
+def test_main(tmp_path, schema_file, capsys, processes, validator):
+    records = tmp_path / 'records.ndjson'
+    records.write_text('\n'.join(map(json.dumps, RECORDS)))
+    status = main([
+        schema_file, str(records), '--processes', str(processes),
+        '--chunksize', '1', '--validator', validator
+    ])
+    assert status == 1
+    out, err = capsys.readouterr()
+    assert [json.loads(line) for line in out.splitlines()] == EXPECTED
+    assert err.startswith('4 records (3 invalid) in ')
+    assert err.strip().endswith('records/s')
+
+
+def test_main_options(tmp_path, schema_file, capsys, monkeypatch):
+    records = tmp_path / 'records.json'
+    records.write_text(json.dumps(RECORDS))
+    output = tmp_path / 'results.ndjson'
+    status = main([
+        schema_file, str(records), '-o', str(output),
+        '--errors-only', '--exclude', 'longitude', '--quiet'
+    ])
+    assert status == 1
+    assert capsys.readouterr() == ('', '')
+    assert [json.loads(line) for line in output.read_text().splitlines()] \
+        == [EXPECTED[1], EXPECTED[3]]
+
+    monkeypatch.setattr('sys.stdin', io.StringIO(json.dumps(RECORDS[0])))
+    assert main([schema_file, '-q']) == 0
+    assert json.loads(capsys.readouterr().out) == EXPECTED[0]
+
+    monkeypatch.setattr('sys.stdin', io.StringIO('{"latitude": 1}\nnope\n'))
+    assert main([schema_file, '-q']) == 2
+    assert capsys.readouterr().err.startswith('error: Invalid JSON on line 2')
+
+
+@pytest.mark.parametrize('validator', ['fast', 'form'])
+def test_main_badly_typed(tmp_path, capsys, validator):
+    schema = tmp_path / 'schema.json'
+    schema.write_text(json.dumps({
+        "type": "object",
+        "properties": {
+            "d": {"type": "string", "format": "date"},
+            "age": {"type": "integer"}
+        }
+    }))
+    records = tmp_path / 'records.ndjson'
+    records.write_text('\n'.join(map(json.dumps, [
+        {'d': {'a': 1}},
+        {'age': [1, 2]},
+        {'d': '2000-01-31', 'age': 3},
+    ])))
+    status = main([str(schema), str(records), '--validator', validator])
+    assert status == 1
+    out, err = capsys.readouterr()
+    assert [json.loads(line) for line in out.splitlines()] == [
+        {'index': 0, 'errors': {'d': ['Not a valid date value.']}},
+        {'index': 1, 'errors': {'age': ['Not a valid integer value.']}},
+        {'index': 2, 'data': {'d': '2000-01-31', 'age': 3}},
+    ]
+    assert err.startswith('3 records (2 invalid) in ')
@@ -0,0 +1,88 @@
+import pytest
+from jsonschema_wtforms import compile_schema
+from jsonschema_wtforms.patterns import (
+    PatternCache, UnsafePattern, catastrophic, pattern_cache)
+
+
+@pytest.mark.parametrize('pattern', [
+    r'(a+)+$',
+    r'(a*)*b',
+    r'^(\w+\s?)+$',
+    r'(.*a){20}',
+    r'(a|aa)+$',
+    r'^(a|a?)+$',
+    r'(\d|\d\d)*x',
+])
+def test_catastrophic(pattern):
+    assert catastrophic(pattern) is not None
+
+
+@pytest.mark.parametrize('pattern', [
+    r'^[A-Z]{3}$',
+    r'^[0-9]{4}$',
+    r'^\+?[0-9 ]{6,20}$',
+    r'^(\d+\.){3}\d+$',
+    r'(ab|cd)*',
+    r'(ab|a)+',
+    r'(?:\d{3}-)+\d{4}',
+    r'^[^@]+@[^@]+\.[a-z]{2,}$',
+    r'^[a-z]+(\.[a-z]+)*$',
+    r'^([a-z]+-)*[a-z]+$',
+    r'^(\d+\.)*\d+$',
+])
+def test_safe(pattern):
+    assert catastrophic(pattern) is None
+
+
+def test_pattern_cache():
+    cache = PatternCache(maxsize=2)
+    validator = cache.regexp('^[0-9]{4}$')
+    assert cache.regexp('^[0-9]{4}$') is validator
+    assert cache.compile('^[0-9]{4}$') is validator.regex
+    cache.regexp('^[A-Z]{3}$')
+    cache.regexp('^x$')
+    assert cache.info() == (2, 3, 1, 2, 2)
+
+    # Unsafe patterns are only rejected on demand.
+    assert cache.regexp('(a+)+$').regex.pattern == '(a+)+$'
+    cache.reject_catastrophic = True
+    with pytest.raises(UnsafePattern) as error:
+        cache.regexp('(a+)+$')
+    assert str(error.value) == (
+        "Catastrophic backtracking (nested quantifiers): '(a+)+$'")
+
+
+def test_shared_validators():
+    schema = {
+        "type": "object",
+        "properties": {
+            "zip": {"type": "string", "pattern": "^[0-9]{4}$"},
+            "address": {
+                "type": "object",
+                "properties": {
+                    "postcode": {"type": "string", "pattern": "^[0-9]{4}$"}
+                }
+            }
+        }
+    }
+    root = compile_schema(schema, cache=None)
+    zip_code = root.fields['zip'].validators[0]
+    postcode = root.fields['address'].fields['postcode'].validators[0]
+    assert zip_code is postcode
+    assert zip_code is pattern_cache.regexp('^[0-9]{4}$')
+
+
+def test_reject_at_conversion():
+    schema = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "pattern": "^([a-z]+ ?)+$"}
+        }
+    }
+    assert compile_schema(schema, cache=None)
+    pattern_cache.reject_catastrophic = True
+    try:
+        with pytest.raises(UnsafePattern):
+            compile_schema(schema, cache=None)
+    finally:
+        pattern_cache.reject_catastrophic = False
@@ -0,0 +1,92 @@
+import gc
+import os
+import pickle
+from jsonschema_wtforms import Form, compile_schema
+from jsonschema_wtforms.cache import SchemaCache
+from jsonschema_wtforms.formdata import FormData
+from jsonschema_wtforms.persistent import (
+    cache_version, dump_cache, load_cache, warm)
+
+
+def test_pickled_parameters(person_schema):
+    root = compile_schema(person_schema, cache=None)
+    root.unbound
+    copy = pickle.loads(pickle.dumps(root))
+    assert list(copy.fields) == list(root.fields)
+    assert 'unbound' not in vars(copy)
+    assert dict(copy.fields['age'].attributes) == dict(
+        root.fields['age'].attributes)
+
+    form = Form(copy.fields)
+    form.process(FormData({'firstName': ['Jane'], 'age': ['-1']}))
+    assert not form.validate()
+    assert form.errors == {
+        'age': ['Number must be at least 0.'],
+        'lastName': ['This field is required.']
+    }
+
+
+TREE = {
+    "type": "object",
+    "properties": {
+        "owner": {
+            "type": "object",
+            "properties": {"name": {"type": "string"}}
+        }
+    }
+}
+
+
+def test_dump_and_load(tmp_path, person_schema, geo_schema):
+    path = str(tmp_path / 'schemas.cache')
+    cache = SchemaCache()
+    compile_schema(person_schema, cache=cache)
+    compile_schema(geo_schema, cache=cache, compact=True)
+    compile_schema(TREE, cache=cache, lazy=True)
+    # Lazy trees are not persisted.
+    assert dump_cache(path, cache) == 2
+
+    loaded = SchemaCache()
+    assert load_cache(path, loaded) == 2
+    root = compile_schema(person_schema, cache=loaded)
+    assert list(root.fields) == list(
+        compile_schema(person_schema, cache=None).fields)
+    compile_schema(geo_schema, cache=loaded, compact=True)
+    assert loaded.info().hits == 2
+    assert loaded.info().misses == 0
+
+
+def test_outdated_cache(tmp_path, person_schema):
+    path = str(tmp_path / 'schemas.cache')
+    assert load_cache(path, SchemaCache()) == 0
+
+    with open(path, 'wb') as stream:
+        pickle.dump(('other', *cache_version()[1:]), stream)
+        pickle.dump({}, stream)
+    assert load_cache(path, SchemaCache()) == 0
+
+    with open(path, 'wb') as stream:
+        stream.write(b'garbage')
+    assert load_cache(path, SchemaCache()) == 0
+
+
+def test_warm(tmp_path, person_schema, geo_schema):
+    path = str(tmp_path / 'schemas.cache')
+    cache = SchemaCache()
+    roots = warm([person_schema, geo_schema], path, cache, freeze=False)
+    assert os.path.exists(path)
+    assert 'unbound' in vars(roots[0].fields['age'])
+    assert cache.info().misses == 2
+    written = os.stat(path).st_mtime_ns
+
+    # Another worker starts from the file.
+    cache = SchemaCache()
+    roots = warm([person_schema, geo_schema], path, cache, freeze=False)
+    assert cache.info().misses == 0
+    assert os.stat(path).st_mtime_ns == written
+
+    try:
+        warm([person_schema], cache=SchemaCache())
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
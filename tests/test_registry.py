@@ -0,0 +1,192 @@
+import json
+import os
+import pytest
+from jsonschema_wtforms.field import ObjectParameters, StringParameters
+from jsonschema_wtforms.formdata import FormData
+from jsonschema_wtforms.registry import SchemaRegistry
+from jsonschema_wtforms.resolver import UnresolvableReference
+
+
+ADDRESS = {
+    "$id": "https://example.com/schemas/address.json",
+    "type": "object",
+    "properties": {
+        "city": {"$ref": "#/definitions/City"},
+        "country": {"$ref": "common.json#/definitions/Country"}
+    },
+    "definitions": {
+        "City": {"type": "string", "minLength": 2}
+    },
+    "required": ["city"]
+}
+
+COMMON = {
+    "$id": "https://example.com/schemas/common.json",
+    "definitions": {
+        "Country": {"$ref": "#/definitions/Code"},
+        "Code": {"type": "string", "enum": ["DE", "FR"]}
+    }
+}
+
+PERSON = {
+    "$id": "https://example.com/schemas/person.json",
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "address": {"$ref": "address.json"}
+    }
+}
+
+# No `$id`: known by its file.
+PET = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "city": {"$ref": "address.json#/definitions/City"}
+    }
+}
+
+
+def write(directory, name, schema):
+    path = directory / name
+    path.write_text(json.dumps(schema))
+    # Modification times may not change within a test.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    return path
+
+
+@pytest.fixture
+def directory(tmp_path):
+    write(tmp_path, 'address.json', ADDRESS)
+    write(tmp_path, 'common.json', COMMON)
+    write(tmp_path, 'person.json', PERSON)
+    write(tmp_path, 'pet.json', PET)
+    return tmp_path
+
+
+def test_cross_file_references(directory):
+    registry = SchemaRegistry(str(directory))
+    person = registry.compile('https://example.com/schemas/person.json')
+    address = person.fields['address']
+    assert isinstance(address, ObjectParameters)
+    assert address.fields['city'].validators[0].min == 2
+    assert address.fields['country'].attributes['choices'] == [
+        ('DE', 'DE'), ('FR', 'FR')]
+
+    pet = registry.compile((directory / 'pet.json').as_uri())
+    assert isinstance(pet.fields['city'], StringParameters)
+
+    # Deferred conversions resolve against the document they are in.
+    lazy = registry.compile(
+        'https://example.com/schemas/person.json', lazy=True)
+    address = lazy.fields['address'].parameters
+    assert address.fields['country'].attributes['choices'] == [
+        ('DE', 'DE'), ('FR', 'FR')]
+
+    form = registry.form('https://example.com/schemas/person.json')
+    form.process(FormData({
+        'address-city': ['B'], 'address-country': ['UK']}))
+    assert not form.validate()
+    assert form.errors == {'address': {
+        'city': ['Field must be at least 2 characters long.'],
+        'country': ['Not a valid choice.']
+    }}
+
+
+def test_compilations_are_kept(directory):
+    registry = SchemaRegistry(str(directory))
+    uri = 'https://example.com/schemas/person.json'
+    assert registry.compile(uri) is registry.compile(uri)
+    assert registry.compile(uri, lazy=True) is not registry.compile(uri)
+    assert registry.compile(uri, include=['name']) is registry.compile(
+        uri, include=('name',))
+    # Iterators are read once.
+    named = registry.compile(uri, exclude=iter(['address']))
+    assert list(named.fields) == ['name']
+    assert registry.compile(uri, exclude=['address']) is named
+    # Only compiled schemas depend on others.
+    assert registry.affected(
+        ['https://example.com/schemas/common.json']) == {
+            'https://example.com/schemas/common.json',
+            'https://example.com/schemas/person.json',
+    }
+
+
+def test_unknown_schema(directory):
+    registry = SchemaRegistry(str(directory))
+    with pytest.raises(UnresolvableReference):
+        registry.compile('https://example.com/schemas/unknown.json')
+
+    registry.add({
+        "$id": "https://example.com/schemas/broken.json",
+        "type": "object",
+        "properties": {"x": {"$ref": "unknown.json"}}
+    })
+    with pytest.raises(UnresolvableReference) as exc:
+        registry.compile('https://example.com/schemas/broken.json')
+    assert str(exc.value) == (
+        'Unknown schema: https://example.com/schemas/unknown.json')
+
+
+def test_reload(directory):
+    registry = SchemaRegistry(str(directory))
+    person_uri = 'https://example.com/schemas/person.json'
+    address_uri = 'https://example.com/schemas/address.json'
+    pet_uri = (directory / 'pet.json').as_uri()
+    person = registry.compile(person_uri)
+    pet = registry.compile(pet_uri)
+    address = registry.compile(address_uri)
+    assert registry.reload() == set()
+
+    write(directory, 'common.json', {
+        **COMMON,
+        "definitions": {
+            **COMMON['definitions'],
+            "Code": {"type": "string", "enum": ["DE", "FR", "UK"]}
+        }
+    })
+    # The pet does not use the common definitions.
+    assert registry.reload() == {person_uri, address_uri}
+    assert registry.compile(pet_uri) is pet
+    assert registry.compile(person_uri) is not person
+    assert registry.compile(address_uri) is not address
+    country = registry.compile(
+        person_uri).fields['address'].fields['country']
+    assert len(country.attributes['choices']) == 3
+
+    write(directory, 'pet.json', {**PET, "title": "Pet"})
+    assert registry.reload() == {pet_uri}
+    assert registry.compile(pet_uri).label == 'Pet'
+
+    (directory / 'pet.json').unlink()
+    assert registry.reload() == set()
+    with pytest.raises(UnresolvableReference):
+        registry.compile(pet_uri)
+
+
+def test_broken_file(directory):
+    registry = SchemaRegistry(str(directory))
+    uri = 'https://example.com/schemas/person.json'
+    person = registry.compile(uri)
+    (directory / 'address.json').write_text('{')
+    os.utime(directory / 'address.json', ns=(0, 0))
+    with pytest.raises(ValueError):
+        registry.reload()
+    assert registry.compile(uri) is person
+
+
+def test_removed_reference(directory):
+    registry = SchemaRegistry(str(directory))
+    uri = 'https://example.com/schemas/person.json'
+    person = registry.compile(uri)
+    (directory / 'address.json').unlink()
+    # The registry is left as it was, and the error raised again.
+    for _ in range(2):
+        with pytest.raises(UnresolvableReference):
+            registry.reload()
+        assert registry.compile(uri) is person
+
+    write(directory, 'address.json', ADDRESS)
+    assert registry.reload() == {uri}
+    assert registry.compile(uri) is not person
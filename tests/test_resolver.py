@@ -0,0 +1,180 @@
+import pytest
+from jsonschema_wtforms.field import ObjectParameters, StringParameters
+from jsonschema_wtforms.resolver import (
+    Resolver, UnresolvableReference, CircularReference)
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "city": {"$ref": "#/definitions/Address/properties/city"},
+        "street": {"$ref": "#/definitions/Street"},
+        "code": {"$ref": "#/definitions/a~1b"},
+    },
+    "definitions": {
+        "Address": {
+            "type": "object",
+            "properties": {
+                "city": {"type": "string", "title": "City"}
+            }
+        },
+        "Street": {"$ref": "#/$defs/street"},
+        "a/b": {"type": "string", "enum": ["x", {"y": 1}]},
+    },
+    "$defs": {
+        "street": {"type": "string", "title": "Street", "$anchor": "street"}
+    }
+}
+
+
+def test_index_and_lookup():
+    resolver = Resolver(SCHEMA)
+    assert resolver.lookup('#') is SCHEMA
+    assert resolver.lookup('#/definitions/Address/properties/city') is \
+        SCHEMA['definitions']['Address']['properties']['city']
+    assert resolver.lookup('#/definitions/a~1b') is \
+        SCHEMA['definitions']['a/b']
+    assert resolver.lookup('#/definitions/a%7E1b') is \
+        SCHEMA['definitions']['a/b']
+    assert resolver.lookup('#street') is SCHEMA['$defs']['street']
+
+    # Enum values are not indexed, but can still be pointed at.
+    assert '#/definitions/a~1b/enum/1' not in resolver.index
+    assert resolver.lookup('#/definitions/a~1b/enum/1/y') == 1
+
+    with pytest.raises(UnresolvableReference):
+        resolver.lookup('#/definitions/Unknown')
+    with pytest.raises(UnresolvableReference):
+        resolver.lookup('#/definitions/a~1b/enum/12')
+    with pytest.raises(UnresolvableReference) as exc:
+        resolver.lookup('other.json#/definitions/Address')
+    assert str(exc.value) == (
+        'Remote references are not supported: '
+        'other.json#/definitions/Address')
+
+
+def test_resolve_is_memoized():
+    resolver = Resolver(SCHEMA)
+    street = resolver.resolve('#/definitions/Street')
+    assert street is SCHEMA['$defs']['street']
+    assert resolver.resolve('#/definitions/Street') is street
+    assert resolver._resolved == {
+        '#/definitions/Street': street,
+        '#/$defs/street': street,
+    }
+
+
+def test_alias_cycle():
+    resolver = Resolver({
+        "definitions": {
+            "a": {"$ref": "#/definitions/b"},
+            "b": {"$ref": "#/definitions/a"},
+        }
+    })
+    with pytest.raises(CircularReference) as exc:
+        resolver.resolve('#/definitions/a')
+    assert str(exc.value) == (
+        'Circular reference: #/definitions/a -> '
+        '#/definitions/b -> #/definitions/a')
+
+
+def test_conversion_with_pointers():
+    root = ObjectParameters.from_json_field(None, False, SCHEMA)
+    assert isinstance(root.fields['city'], StringParameters)
+    assert root.fields['city'].label == 'City'
+    assert root.fields['street'].label == 'Street'
+    assert root.fields['code'].attributes['choices'][0] == ('x', 'x')
+
+
+def test_defs(refs_and_defs_schema):
+    root = ObjectParameters.from_json_field(
+        None, False, refs_and_defs_schema)
+    veggie = root.fields['vegetables'].subfield
+    assert set(veggie.fields) == {'veggieName', 'veggieLike'}
+    assert veggie.fields['veggieName'].required
+
+
+def test_recursive_schema():
+    with pytest.raises(CircularReference) as exc:
+        ObjectParameters.from_json_field(None, False, {
+            "type": "object",
+            "properties": {
+                "root": {"$ref": "#/definitions/Node"}
+            },
+            "definitions": {
+                "Node": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "children": {
+                            "type": "array",
+                            "items": {"$ref": "#/definitions/Node"}
+                        }
+                    }
+                }
+            }
+        })
+    assert str(exc.value) == (
+        'Circular reference: #/definitions/Node -> #/definitions/Node')
+
+
+def test_interning():
+    address = {
+        "type": "object",
+        "properties": {
+            "city": {"type": "string"},
+            "geo": {"$ref": "#/definitions/Geo"}
+        }
+    }
+    schema = {
+        "type": "object",
+        "properties": {
+            "home": {"$ref": "#/definitions/Address"},
+            "work": {"$ref": "#/definitions/Address"},
+            "billing": address,
+            "city": {"type": "string"},
+        },
+        "required": ["billing"],
+        "definitions": {
+            "Address": address,
+            "Geo": {
+                "type": "object",
+                "properties": {"latitude": {"type": "number"}}
+            }
+        }
+    }
+    root = ObjectParameters.from_json_field(None, False, schema)
+    home, work, billing = (
+        root.fields['home'], root.fields['work'], root.fields['billing'])
+    assert home is not work
+    assert home.name == 'home' and work.name == 'work'
+    assert billing.required and not home.required
+    assert home.fields['city'] is work.fields['city'] is \
+        billing.fields['city'] is root.fields['city']
+    assert home.fields['geo'] is work.fields['geo'] is billing.fields['geo']
+
+    root = ObjectParameters.from_json_field(
+        None, False, schema, resolver=Resolver(schema, interning=False))
+    assert root.fields['home'].fields['city'] is not \
+        root.fields['work'].fields['city']
+
+
+def test_interning_keeps_property_order():
+    schema = {
+        "type": "object",
+        "properties": {
+            "a": {"type": "object", "properties": {
+                "addr": {"type": "object", "properties": {
+                    "x": {"type": "string"}, "y": {"type": "string"}}}}},
+            "b": {"type": "object", "properties": {
+                "addr": {"type": "object", "properties": {
+                    "y": {"type": "string"}, "x": {"type": "string"}}}}},
+        }
+    }
+    root = ObjectParameters.from_json_field(None, False, schema)
+    first = root.fields['a'].fields['addr']
+    second = root.fields['b'].fields['addr']
+    assert first is not second
+    assert list(first.fields) == ['x', 'y']
+    assert list(second.fields) == ['y', 'x']
+    assert first.fields['x'] is second.fields['x']
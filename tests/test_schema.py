@@ -62,3 +62,27 @@ def test_schema_as_field(person_schema):
         "age": hamcrest.instance_of(
             wtforms.fields.IntegerField),
     }))
+
+
+def test_precomputed_options(person_schema):
+    schema = jsonschema_wtforms.field.ObjectParameters.from_json_field(
+        None, False, person_schema
+    )
+    first, last, age = (
+        schema.fields['firstName'],
+        schema.fields['lastName'],
+        schema.fields['age']
+    )
+    assert first.options is first.options
+    assert first.field_factory is wtforms.fields.StringField
+    assert first.options['validators'] == tuple(
+        first.get_options()['validators'])
+
+    # Validators are shared between fields.
+    assert first.options['validators'][0] is last.options['validators'][0]
+    assert age.options['validators'][0] is \
+        schema.fields['homepage'].options['validators'][0]
+
+    unbound = first()
+    assert unbound.kwargs['validators'] is first.options['validators']
+    assert first() is not unbound
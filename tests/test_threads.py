@@ -0,0 +1,95 @@
+import copy
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from jsonschema_wtforms import Form
+from jsonschema_wtforms.field import ObjectParameters
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 2},
+        "kind": {"enum": ["PC", "Laptop"]},
+        "tags": {
+            "type": "array",
+            "items": {"enum": ["red", "green", "blue"]}
+        },
+        "address": {"$ref": "#/definitions/Address"},
+        "devices": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/Device"}
+        }
+    },
+    "required": ["name", "kind"],
+    "definitions": {
+        "Address": {
+            "type": "object",
+            "properties": {
+                "city": {"type": "string"}
+            },
+            "required": ["city"]
+        },
+        "Device": {
+            "type": "object",
+            "properties": {
+                "kind": {"enum": ["PC", "Laptop"]}
+            }
+        }
+    }
+}
+
+
+def test_conversion_does_not_modify_schema():
+    schema = copy.deepcopy(SCHEMA)
+    root = ObjectParameters.from_json_field(None, False, schema)
+    assert schema == SCHEMA
+
+    tags = root.fields['tags']
+    options = tags.get_options()
+    tags.get_factory()
+    tags()
+    assert tags.attributes['choices'] == options['choices']
+
+    with pytest.raises(TypeError):
+        tags.attributes['choices'] = ()
+    with pytest.raises(TypeError):
+        root.fields['name'] = None
+
+
+def build_and_validate(root, index):
+    form = Form(root.fields)
+    record = {
+        'name': f'name{index}',
+        'kind': 'PC' if index % 2 else 'Tablet',
+        'tags': ['red'],
+        'address': {'city': 'Boppelsen'},
+        'devices': [{'kind': 'Laptop'}] * (index % 3)
+    }
+    form.process(data=record)
+    valid = form.validate()
+    return valid, form.data, form.errors
+
+
+def test_concurrent_usage():
+    schema = copy.deepcopy(SCHEMA)
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        roots = list(pool.map(
+            lambda _: ObjectParameters.from_json_field(None, False, schema),
+            range(64)
+        ))
+    assert schema == SCHEMA
+
+    root = roots[0]
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(
+            lambda i: build_and_validate(root, i), range(2000)))
+
+    assert schema == SCHEMA
+    for index, (valid, data, errors) in enumerate(results):
+        assert data['name'] == f'name{index}'
+        assert len(data['devices']) == index % 3
+        if index % 2:
+            assert valid and not errors
+        else:
+            assert errors == {'kind': ['Not a valid choice.']}
+        assert results[index] == build_and_validate(roots[-1], index)
@@ -0,0 +1,71 @@
+import math
+import random
+import pytest
+from wtforms.validators import ValidationError
+from jsonschema_wtforms._fields import Probe
+from jsonschema_wtforms.validators import NumberRange, VECTORIZE
+from jsonschema_wtforms import validators
+
+
+RANGES = [
+    NumberRange(min=0, max=10),
+    NumberRange(min=0, exclusive_max=10),
+    NumberRange(exclusive_min=0, exclusive_max=1),
+    NumberRange(min=5, exclusive_min=5),
+    NumberRange(min=5, exclusive_min=3),
+    NumberRange(max=-2.5),
+]
+
+
+def rejected(validator, values):
+    positions = []
+    for index, data in enumerate(values):
+        try:
+            validator(None, Probe(data, [data], []))
+        except ValidationError:
+            positions.append(index)
+    return positions
+
+
+def random_values(count, seed):
+    rng = random.Random(seed)
+    return [
+        rng.choice((None, math.nan, math.inf, -math.inf))
+        if rng.random() < 0.05 else rng.uniform(-5, 15)
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize('validator', RANGES)
+@pytest.mark.parametrize('count', [1, VECTORIZE * 4])
+def test_candidates(validator, count):
+    for seed in range(20):
+        values = random_values(count, seed)
+        assert validator.candidates(values) == rejected(validator, values)
+    integers = list(range(-20, 20))
+    assert validator.candidates(integers) == rejected(validator, integers)
+
+
+def test_candidates_in_range():
+    validator = NumberRange(min=0, max=10)
+    assert validator.candidates([]) == []
+    assert validator.candidates([0, 10, 5.5, None]) == []
+    assert validator.candidates([math.nan, -1, 3]) == [1]
+    assert validator.candidates([None]) == []
+    assert NumberRange().candidates([-1, 1]) == []
+
+
+def test_candidates_without_numpy(monkeypatch):
+    monkeypatch.setattr(validators, 'numpy', lambda: None)
+    validator = NumberRange(min=0, max=10)
+    values = random_values(VECTORIZE * 4, 0)
+    assert validator.candidates(values) == rejected(validator, values)
+
+
+def test_candidates_with_numpy():
+    pytest.importorskip('numpy')
+    validator = NumberRange(min=0, max=10)
+    assert validator.candidates([2 ** 60] * VECTORIZE) == list(
+        range(VECTORIZE))
+    values = [1, None, 11] * VECTORIZE
+    assert validator.candidates(values) == rejected(validator, values)